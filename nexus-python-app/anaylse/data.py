@@ -1,35 +1,76 @@
+import itertools
 import sqlite3
 
+# Statements are kept as constants so sqlite3's statement cache prepares
+# each of them once per connection. Rows already stored (same repository
+# name, component_id or asset_id) are skipped, so a crawl resumed after a
+# crash can write the same page again without duplicating it.
+INSERT_REPOSITORY = 'INSERT OR IGNORE INTO repositories (name, format) VALUES (?, ?)'
+SELECT_REPOSITORY_ID = 'SELECT id FROM repositories WHERE name = ?'
+INSERT_COMPONENT = 'INSERT OR IGNORE INTO components (name, format, "group", version, repository_id, component_id) VALUES (?, ?, ?, ?, ?, ?)'
+INSERT_ASSET = '''
+    INSERT OR IGNORE INTO assets (name, asset_id, file_size, last_modified, last_downloaded, uploaded_by, blob_created, blob_store_name, format, path, download_url, content_type, repository_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
 class DataNexus:
-    def __init__(self, db_path='nexus_data.db'):
+    """
+    SQLite store of crawled repositories, components and assets.
+
+    Rows are written in transactions of up to ``commit_interval`` rows
+    rather than one transaction per row; call commit() to make pending
+    rows durable (close() commits too). The database runs in WAL mode with
+    synchronous=NORMAL, which cannot corrupt it on a crash but may lose
+    the last transactions on power loss.
+    """
+
+    def __init__(self, db_path='nexus_data.db', commit_interval=10000, cache_size_mb=64, mmap_size_mb=256):
+        """
+        Args:
+            db_path: SQLite database file
+            commit_interval: Rows written per transaction
+            cache_size_mb: Page cache size
+            mmap_size_mb: Size of the memory-mapped part of the database
+        """
         self.db_path = db_path
+        self.commit_interval = commit_interval
+        self.cache_size_mb = cache_size_mb
+        self.mmap_size_mb = mmap_size_mb
         self.conn = None
+        self._pending = 0
 
     def connect(self):
         self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(f'PRAGMA cache_size=-{self.cache_size_mb * 1024}')
+        self.conn.execute(f'PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
         self.create_tables()
 
     def create_tables(self):
         with self.conn:
-            self.conn.execute('''
+            self.conn.executescript('''
                 CREATE TABLE IF NOT EXISTS repositories (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
+                    name TEXT NOT NULL UNIQUE,
                     format TEXT NOT NULL
-                )
+                );
                 CREATE TABLE IF NOT EXISTS components (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
                     format TEXT,
-                    group TEXT,
+                    "group" TEXT,
                     version TEXT,
                     repository_id INTEGER NOT NULL,
+                    component_id TEXT UNIQUE,
                     FOREIGN KEY (repository_id) REFERENCES repositories(id)
-                )
+                );
                 CREATE TABLE IF NOT EXISTS assets (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
-                    asset_id TEXT NOT NULL,
+                    asset_id TEXT NOT NULL UNIQUE,
                     file_size INTEGER,
                     last_modified TEXT,
                     last_downloaded TEXT,
@@ -42,32 +83,78 @@ class DataNexus:
                     content_type TEXT,
                     repository_id INTEGER NOT NULL,
                     FOREIGN KEY (repository_id) REFERENCES repositories(id)
-                )
+                );
             ''')
 
+    def _written(self, count):
+        """Count rows added to the open transaction, committing every commit_interval rows."""
+        self._pending += count
+        if self._pending >= self.commit_interval:
+            self.commit()
+
+    def _insert(self, sql, row):
+        cursor = self.conn.execute(sql, row)
+        self._written(1)
+        # None when the row was already stored
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def _insert_many(self, sql, rows):
+        """executemany() over rows, split at commit_interval boundaries."""
+        rows = iter(rows)
+        total = 0
+        while True:
+            room = max(1, self.commit_interval - self._pending)
+            chunk = list(itertools.islice(rows, room))
+            if not chunk:
+                return total
+            total += self.conn.executemany(sql, chunk).rowcount
+            self._written(len(chunk))
+
+    def commit(self):
+        """Commit the rows written since the last commit."""
+        if self.conn is not None:
+            self.conn.commit()
+        self._pending = 0
+
     def save_repository(self, name, format):
-        with self.conn:
-            cursor = self.conn.execute('''
-                INSERT INTO repositories (name, format) VALUES (?, ?)
-            ''', (name, format))
-            return cursor.lastrowid
+        self._insert(INSERT_REPOSITORY, (name, format))
+        return self.conn.execute(SELECT_REPOSITORY_ID, (name,)).fetchone()[0]
+
+    def save_repositories(self, rows):
+        """
+        Insert (name, format) rows.
+
+        Returns:
+            Number of rows inserted (rows already stored are skipped)
+        """
+        return self._insert_many(INSERT_REPOSITORY, rows)
 
     def save_asset(self, name, asset_id, file_size, last_modified, last_downloaded, uploaded_by, blob_created, blob_store_name, format, path, download_url, content_type, repository_id):
-        with self.conn:
-            cursor = self.conn.execute('''
-                INSERT INTO assets (name, asset_id, file_size, last_modified, last_downloaded, uploaded_by, blob_created, blob_store_name, format, path, download_url, content_type, repository_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (name, asset_id, file_size, last_modified, last_downloaded, uploaded_by, blob_created, blob_store_name, format, path, download_url, content_type, repository_id))
-            return cursor.lastrowid
+        return self._insert(INSERT_ASSET, (name, asset_id, file_size, last_modified, last_downloaded, uploaded_by, blob_created, blob_store_name, format, path, download_url, content_type, repository_id))
 
-    def save_component(self, name, format, group, version, repository_id):
-        with self.conn:
-            cursor = self.conn.execute('''
-                INSERT INTO components (name, format, group, version, repository_id) VALUES (?, ?, ?, ?, ?)
-            ''', (name, format, group, version, repository_id))
-            return cursor.lastrowid
+    def save_assets(self, rows):
+        """
+        Insert rows with the columns of save_asset(), in the same order.
+
+        Returns:
+            Number of rows inserted (rows already stored are skipped)
+        """
+        return self._insert_many(INSERT_ASSET, rows)
+
+    def save_component(self, name, format, group, version, repository_id, component_id=None):
+        return self._insert(INSERT_COMPONENT, (name, format, group, version, repository_id, component_id))
+
+    def save_components(self, rows):
+        """
+        Insert (name, format, group, version, repository_id, component_id) rows.
+
+        Returns:
+            Number of rows inserted (rows already stored are skipped)
+        """
+        return self._insert_many(INSERT_COMPONENT, rows)
 
     def close(self):
         if self.conn:
+            self.commit()
             self.conn.close()
             self.conn = None
-
@@ -6,14 +6,50 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from nexus_client import NexusClient
+from nexus_client.checkpoint import CheckpointStore
 from nexus_client.config import Config
 from data import DataNexus
 
+
+class DatabaseCheckpoint(CheckpointStore):
+    """
+    Checkpoint that records pages only once their rows are committed, so it never gets ahead of the database.
+
+    Component rows are buffered across pages and written by flush(), which
+    runs whenever commit_interval rows are waiting. Call flush() at the end
+    of each repository too. A crash loses the buffered pages, which are
+    crawled again on the next run (the inserts skip rows already stored).
+    """
+
+    def __init__(self, path, data):
+        super().__init__(path)
+        self.data = data
+        self.rows = []
+        self._pages = []
+
+    def save_page(self, key, continuation_token, items):
+        self._pages.append((key, continuation_token, items))
+        if len(self.rows) >= self.data.commit_interval:
+            self.flush()
+
+    def flush(self):
+        """Insert and commit the buffered rows, then record their pages."""
+        self.data.save_components(self.rows)
+        self.rows.clear()
+        self.data.commit()
+        for page in self._pages:
+            super().save_page(*page)
+        self._pages.clear()
+
+
 def main():
     config = Config()
     data = DataNexus(db_path=config.database_path)
     data.connect()
 
+    # Progress of the crawl, so a restarted run resumes where it stopped
+    checkpoint = DatabaseCheckpoint(config.checkpoint_path, data)
+
     with NexusClient(**config.get_client_kwargs()) as client:
         try:
             ## list all repository
@@ -21,23 +57,34 @@ def main():
             print(f"Found {len(repos)} repositories")
             for repo in repos:
                 print(f" - {repo['name']} ({repo['format']})")
-                # save to sqlite base
-                repo_id = data.save_repository(repo['name'], repo['format'])
-                sys.stdout.write(f"   ✓ Saved to database with ID {repo_id}\n")
-
-                components = client.components.list(repo['name'])
-                print(f"   Found {len(components)} components")
-                for component in components:
-                    print(f"   - Component: {component['name']} (ID: {component['id']})")
-                    component_id = data.save_component(component['name'], component.get('format'), component.get('group'), component.get('version'), repo_id)
-                    sys.stdout.write(f"     ✓ Saved component to database with ID {component_id}\n")
-
-                # assets = client.assets.list(repo['name'])
+                repo_key = f"repository:{repo['name']}"
+                repo_state = checkpoint.get(repo_key)
+                if repo_state is not None:
+                    repo_id = repo_state['id']
+                    sys.stdout.write(f"   ↻ Resuming with database ID {repo_id}\n")
+                else:
+                    # save to sqlite base
+                    repo_id = data.save_repository(repo['name'], repo['format'])
+                    data.commit()
+                    checkpoint.put(repo_key, {'id': repo_id})
+                    sys.stdout.write(f"   ✓ Saved to database with ID {repo_id}\n")
+
+                component_count = 0
+                for component in client.components.iter_components(repo['name'], checkpoint=checkpoint):
+                    checkpoint.rows.append((component['name'], component.get('format'), component.get('group'), component.get('version'), repo_id, component['id']))
+                    component_count += 1
+                checkpoint.flush()
+                print(f"   ✓ Saved {component_count} components")
+
+                # assets = client.assets.iter_assets(repo['name'])
                 # for asset in assets:
                 #     print(f"   - Asset: {asset['name']} (ID: {asset['id']})")
                 #     asset_id = data.save_asset(asset['name'], asset['id'], asset.get('fileSize'), asset.get('lastModified'), asset.get('lastDownloaded'), asset.get('uploader'), asset.get('blobCreated'), asset.get('blobStoreName'), asset.get('format'), asset.get('path'), asset.get('downloadUrl'), asset.get('contentType'), repo_id)
                 #     sys.stdout.write(f"     ✓ Saved asset to database with ID {asset_id}\n")
 
+            # Crawl finished: the next run starts from scratch
+            checkpoint.clear()
+
         except Exception as e:
             print(f"   ✗ Error: {e}")
             return
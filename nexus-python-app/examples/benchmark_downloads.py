@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU time per GB of the download write paths.
+
+Compares writing and hashing a response body with iter_content() in
+8 KB and 1 MB chunks against write_body(), which uses
+DOWNLOAD_CHUNK_SIZE (4 MB) chunks. By default a
+temporary file is served by a local HTTP server started in a separate
+process, so only the client's CPU time is measured; pass --url to
+download from a real Nexus instead.
+
+Usage:
+    python benchmark_downloads.py [--size-mb 512] [--rounds 3] [--url URL]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from nexus_client.checksums import ChecksumVerifier
+from nexus_client.downloads import write_body
+
+
+def iter_content(chunk_size):
+    """Write path of a plain requests download with the given chunk size."""
+    def write(response, f, verifier):
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+            verifier.update(chunk)
+    return write
+
+
+def write_body_default(response, f, verifier):
+    """write_body() with its default chunk size."""
+    for _ in write_body(response, f, verifier=verifier):
+        pass
+
+
+def measure(session, url, write, output_path):
+    """Download once and return (bytes, wall seconds, CPU seconds)."""
+    verifier = ChecksumVerifier({'sha256': '0' * 64})
+    wall, cpu = time.perf_counter(), time.process_time()
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        with open(output_path, 'wb') as f:
+            write(response, f, verifier)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return os.path.getsize(output_path), wall, cpu
+
+
+def serve(directory):
+    """Start an HTTP server for a directory in a child process."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'http.server', str(port), '--bind', '127.0.0.1', '--directory', directory],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    for _ in range(50):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.1)
+    return server, f'http://127.0.0.1:{port}'
+
+
+def main():
+    """Run the benchmark and print CPU seconds per GB for each write path."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size-mb', type=int, default=512, help='size of the served test file')
+    parser.add_argument('--rounds', type=int, default=3, help='downloads per write path (best is kept)')
+    parser.add_argument('--url', help='download this URL instead of a local test file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        url = args.url
+        if url is None:
+            with open(os.path.join(tmp, 'blob.bin'), 'wb') as f:
+                block = os.urandom(1024 * 1024)
+                for _ in range(args.size_mb):
+                    f.write(block)
+            server, base_url = serve(tmp)
+            url = f'{base_url}/blob.bin'
+
+        output_path = os.path.join(tmp, 'download.bin')
+        paths = [
+            ('iter_content(8 KB)', iter_content(8192)),
+            ('iter_content(1 MB)', iter_content(1024 * 1024)),
+            ('write_body()', write_body_default),
+        ]
+        try:
+            with requests.Session() as session:
+                print(f"{'write path':<20} {'MB/s':>8} {'CPU s/GB':>10}")
+                for name, write in paths:
+                    runs = [measure(session, url, write, output_path) for _ in range(args.rounds)]
+                    size, wall, cpu = min(runs, key=lambda run: run[2])
+                    print(f"{name:<20} {size / wall / 1e6:>8.0f} {cpu / (size / 1e9):>10.3f}")
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
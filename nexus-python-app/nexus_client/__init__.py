@@ -6,7 +6,8 @@ Sonatype Nexus Repository Manager REST API.
 """
 
 from .client import NexusClient
+from .aio import AsyncNexusClient
 from .exceptions import NexusException, NexusAuthenticationError, NexusNotFoundError
 
 __version__ = "1.0.0"
-__all__ = ["NexusClient", "NexusException", "NexusAuthenticationError", "NexusNotFoundError"]
+__all__ = ["NexusClient", "AsyncNexusClient", "NexusException", "NexusAuthenticationError", "NexusNotFoundError"]
@@ -0,0 +1,9 @@
+"""
+Asynchronous (asyncio) client for the Nexus Repository Manager REST API.
+
+Requires the optional ``aiohttp`` dependency (``pip install 'nexus-client[async]'``).
+"""
+
+from .client import AsyncNexusClient, NexusResponse
+
+__all__ = ["AsyncNexusClient", "NexusResponse"]
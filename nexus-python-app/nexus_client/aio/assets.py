@@ -0,0 +1,122 @@
+"""Async assets management API."""
+
+import asyncio
+from typing import Dict, Any, AsyncIterator, Optional
+
+from ..checkpoint import CheckpointStore
+from .pagination import iter_items
+
+
+# Bytes of a download body gathered before each write to the file
+WRITE_SIZE = 1024 * 1024
+
+class AsyncAssetAPI:
+    """Async API for managing assets in Nexus repositories."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def list(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List assets in a repository.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token for pagination
+
+        Returns:
+            Dict with 'items' (list of assets) and 'continuationToken'
+        """
+        params = {'repository': repository}
+        if continuation_token:
+            params['continuationToken'] = continuation_token
+
+        response = await self.client.get('/v1/assets', params=params)
+        return response.json()
+
+    async def iter_assets(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all assets in a repository, following pagination.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+
+        Yields:
+            Asset dicts
+        """
+        async for item in iter_items(
+            lambda token: self.list(repository, continuation_token=token),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            f'assets:{repository}'
+        ):
+            yield item
+
+    async def get(self, asset_id: str) -> Dict[str, Any]:
+        """
+        Get asset details by ID.
+
+        Args:
+            asset_id: Asset ID
+
+        Returns:
+            Asset details
+        """
+        response = await self.client.get(f'/v1/assets/{asset_id}')
+        return response.json()
+
+    async def delete(self, asset_id: str) -> None:
+        """
+        Delete an asset.
+
+        Args:
+            asset_id: Asset ID to delete
+        """
+        await self.client.delete(f'/v1/assets/{asset_id}')
+
+    async def download(self, asset_id: str, output_path: str) -> None:
+        """
+        Download an asset to a file.
+
+        The body is written in blocks of WRITE_SIZE bytes from the event
+        loop's default executor, so the loop is never blocked on disk.
+
+        Args:
+            asset_id: Asset ID
+            output_path: Path to save the downloaded file
+        """
+        asset = await self.get(asset_id)
+        download_url = asset.get('downloadUrl')
+
+        if not download_url:
+            raise ValueError(f"Asset {asset_id} has no download URL")
+
+        # File calls block, so they run on the loop's default executor
+        loop = asyncio.get_running_loop()
+        async with self.client.stream('GET', download_url) as response:
+            f = await loop.run_in_executor(None, open, output_path, 'wb')
+            try:
+                buffer = bytearray()
+                async for chunk in response.content.iter_any():
+                    buffer += chunk
+                    if len(buffer) >= WRITE_SIZE:
+                        data, buffer = buffer, bytearray()
+                        await loop.run_in_executor(None, f.write, data)
+                if buffer:
+                    await loop.run_in_executor(None, f.write, buffer)
+            finally:
+                await loop.run_in_executor(None, f.close)
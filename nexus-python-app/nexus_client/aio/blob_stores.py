@@ -0,0 +1,117 @@
+"""Async blob store management API."""
+
+from typing import List, Dict, Any, Optional
+
+
+class AsyncBlobStoreAPI:
+    """Async API for managing blob stores."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """
+        List all blob stores.
+
+        Returns:
+            List of blob stores
+        """
+        response = await self.client.get('/v1/blobstores')
+        return response.json()
+
+    async def get_file_blob_store(self, name: str) -> Dict[str, Any]:
+        """
+        Get file blob store configuration.
+
+        Args:
+            name: Blob store name
+
+        Returns:
+            Blob store configuration
+        """
+        response = await self.client.get(f'/v1/blobstores/file/{name}')
+        return response.json()
+
+    async def create_file_blob_store(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        soft_quota_type: Optional[str] = None,
+        soft_quota_limit: Optional[int] = None
+    ) -> None:
+        """
+        Create a file blob store.
+
+        Args:
+            name: Blob store name
+            path: Path on disk (optional, defaults to data directory)
+            soft_quota_type: Quota type (spaceRemainingQuota, spaceUsedQuota)
+            soft_quota_limit: Quota limit in MB
+        """
+        data = {
+            "name": name,
+        }
+
+        if path:
+            data["path"] = path
+
+        if soft_quota_type and soft_quota_limit:
+            data["softQuota"] = {
+                "type": soft_quota_type,
+                "limit": soft_quota_limit
+            }
+
+        await self.client.post('/v1/blobstores/file', json=data)
+
+    async def update_file_blob_store(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        soft_quota_type: Optional[str] = None,
+        soft_quota_limit: Optional[int] = None
+    ) -> None:
+        """
+        Update a file blob store.
+
+        Args:
+            name: Blob store name
+            path: Path on disk
+            soft_quota_type: Quota type
+            soft_quota_limit: Quota limit in MB
+        """
+        data = {
+            "name": name,
+        }
+
+        if path:
+            data["path"] = path
+
+        if soft_quota_type and soft_quota_limit:
+            data["softQuota"] = {
+                "type": soft_quota_type,
+                "limit": soft_quota_limit
+            }
+
+        await self.client.put(f'/v1/blobstores/file/{name}', json=data)
+
+    async def delete(self, name: str) -> None:
+        """
+        Delete a blob store.
+
+        Args:
+            name: Blob store name
+        """
+        await self.client.delete(f'/v1/blobstores/{name}')
+
+    async def get_quota_status(self, name: str) -> Dict[str, Any]:
+        """
+        Get blob store quota status.
+
+        Args:
+            name: Blob store name
+
+        Returns:
+            Quota status information
+        """
+        response = await self.client.get(f'/v1/blobstores/{name}/quota-status')
+        return response.json()
@@ -0,0 +1,373 @@
+"""Asynchronous Nexus Repository Manager client."""
+
+import asyncio
+import json as jsonlib
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any
+from urllib.parse import urljoin
+import logging
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ..exceptions import NexusException, error_for_status
+from ..metrics import RequestMetrics, endpoint_template
+from ..retry import RetryPolicy
+from .repositories import AsyncRepositoryAPI
+from .components import AsyncComponentAPI
+from .assets import AsyncAssetAPI
+from .security import AsyncSecurityAPI
+from .tasks import AsyncTaskAPI
+from .search import AsyncSearchAPI
+from .blob_stores import AsyncBlobStoreAPI
+
+
+logger = logging.getLogger(__name__)
+
+
+class NexusResponse:
+    """
+    Fully read HTTP response returned by the async client.
+
+    Mirrors the subset of ``requests.Response`` used by the API modules
+    (``status_code``, ``headers``, ``content``, ``text`` and ``json()``).
+    """
+
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return jsonlib.loads(self.content)
+
+
+class AsyncNexusClient:
+    """
+    Asynchronous client for the Nexus Repository Manager REST API.
+
+    Exposes the same API modules as :class:`NexusClient`, with coroutine
+    methods. At most ``max_concurrency`` requests are in flight at once.
+
+    Example:
+        >>> async with AsyncNexusClient("https://nexus.example.com", username="admin", password="admin123") as client:
+        ...     repos = await client.repositories.list()
+        ...     pages = await asyncio.gather(*(client.components.list(r['name']) for r in repos))
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        verify_ssl: bool = True,
+        timeout: int = 30,
+        max_concurrency: int = 100,
+        retry: Optional[RetryPolicy] = None,
+        keep_alive: bool = True,
+        metrics: Optional[RequestMetrics] = None
+    ):
+        """
+        Initialize async Nexus client.
+
+        Args:
+            base_url: Base URL of Nexus server (e.g., "https://nexus.example.com")
+            username: Username for authentication
+            password: Password for authentication
+            verify_ssl: Whether to verify SSL certificates
+            timeout: Connect timeout and maximum wait for data, in seconds
+            max_concurrency: Maximum number of requests in flight at once
+            retry: Retry policy for transient failures (defaults to
+                RetryPolicy(), pass retry.NO_RETRY to disable)
+            keep_alive: Reuse connections between requests
+            metrics: Metrics collector (a new RequestMetrics by default)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncNexusClient requires aiohttp: pip install 'nexus-client[async]'"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.base_url = base_url.rstrip('/')
+        self.api_base = urljoin(self.base_url, '/service/rest/')
+        self.username = username
+        self.password = password
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.keep_alive = keep_alive
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+
+        # Total number of retries made by this client
+        self.total_retries = 0
+
+        # Session and semaphore are bound to the running event loop,
+        # so they are created on first use.
+        self._session = None
+        self._semaphore = None
+
+        # Initialize API modules
+        self.repositories = AsyncRepositoryAPI(self)
+        self.components = AsyncComponentAPI(self)
+        self.assets = AsyncAssetAPI(self)
+        self.security = AsyncSecurityAPI(self)
+        self.tasks = AsyncTaskAPI(self)
+        self.search = AsyncSearchAPI(self)
+        self.blob_stores = AsyncBlobStoreAPI(self)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The underlying aiohttp session, created on first use."""
+        if self._session is None or self._session.closed:
+            auth = None
+            if self.username and self.password:
+                auth = aiohttp.BasicAuth(self.username, self.password)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=None if self.verify_ssl else False,
+                force_close=not self.keep_alive
+            )
+            self._session = aiohttp.ClientSession(
+                auth=auth,
+                connector=connector,
+                # Bounds connecting and each wait for data, not whole
+                # transfers: large downloads may take longer than timeout
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        data: Any = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ):
+        """
+        Make an HTTP request and yield the unread aiohttp response.
+
+        The concurrency slot is held until the context exits, so callers
+        can stream large bodies without buffering them; it is given up
+        while waiting to retry. Transient failures
+        are retried according to the client's retry policy; form bodies
+        can only be sent once, so leave retry_post disabled for uploads.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to api_base) or absolute URL
+            params: Query parameters
+            json: JSON body data
+            data: Raw body data
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Raises:
+            NexusException: If the request fails or returns an error status
+        """
+        url = urljoin(self.api_base, endpoint.lstrip('/'))
+        session = self.session
+
+        semaphore = self._semaphore
+        template = endpoint_template(endpoint)
+        attempt = 0
+        while True:
+            # The slot is released while sleeping before a retry
+            await semaphore.acquire()
+            retry_reason = None
+            retry_headers = None
+            try:
+                self.metrics.request_started(method, template)
+                started = time.monotonic()
+                try:
+                    response = await session.request(
+                        method,
+                        url,
+                        params=params,
+                        json=json,
+                        data=data,
+                        headers=headers or {},
+                        **kwargs
+                    )
+
+                except BaseException as e:
+                    self.metrics.request_finished(method, template, None, time.monotonic() - started)
+                    transient = isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+                    if transient and self.retry.should_retry_error(method, attempt):
+                        retry_reason = str(e) or type(e).__name__
+                    elif transient or isinstance(e, aiohttp.ClientError):
+                        raise NexusException(f"Request failed: {str(e)}", retries=attempt) from e
+                    else:
+                        raise
+
+                else:
+                    self.metrics.request_finished(
+                        method,
+                        template,
+                        response.status,
+                        time.monotonic() - started,
+                        bytes_received=response.content_length or 0
+                    )
+
+                    if response.status >= 400:
+                        if self.retry.should_retry_status(method, response.status, attempt):
+                            response.release()
+                            retry_reason = f"status {response.status}"
+                            retry_headers = response.headers
+                        else:
+                            try:
+                                text = await response.text(errors='replace')
+                            finally:
+                                response.release()
+                            error = error_for_status(response.status, text, response)
+                            error.retries = attempt
+                            raise error
+            except BaseException:
+                semaphore.release()
+                raise
+
+            if retry_reason is None:
+                break
+            semaphore.release()
+            await self._wait_before_retry(method, url, template, attempt, retry_reason, retry_headers)
+            attempt += 1
+
+        try:
+            yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NexusException(f"Request failed: {str(e)}", retries=attempt) from e
+        finally:
+            response.release()
+            semaphore.release()
+
+    async def _wait_before_retry(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        attempt: int,
+        reason: str,
+        headers=None
+    ) -> None:
+        """Record a retry and sleep for the policy's backoff delay."""
+        delay = self.retry.delay(attempt, headers)
+        self.total_retries += 1
+        self.metrics.record_retry(method, template)
+
+        logger.warning(
+            "%s %s failed (%s), retry %d/%d in %.2fs",
+            method, url, reason, attempt + 1, self.retry.max_retries, delay
+        )
+        await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        data: Any = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> NexusResponse:
+        """
+        Make an HTTP request to the Nexus API and read the full body.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to api_base)
+            params: Query parameters
+            json: JSON body data
+            data: Raw body data
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            Response object
+
+        Raises:
+            NexusAuthenticationError: If authentication fails
+            NexusNotFoundError: If resource not found
+            NexusForbiddenError: If access forbidden
+            NexusBadRequestError: If request is invalid
+            NexusException: For other errors
+        """
+        async with self.stream(
+            method,
+            endpoint,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+            **kwargs
+        ) as response:
+            # Errors reading the body are wrapped by stream(), with the retry count
+            content = await response.read()
+            return NexusResponse(
+                response.status,
+                response.headers,
+                content,
+                str(response.url)
+            )
+
+    async def get(self, endpoint: str, **kwargs) -> NexusResponse:
+        """Make a GET request."""
+        return await self._request('GET', endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> NexusResponse:
+        """Make a POST request."""
+        return await self._request('POST', endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs) -> NexusResponse:
+        """Make a PUT request."""
+        return await self._request('PUT', endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> NexusResponse:
+        """Make a DELETE request."""
+        return await self._request('DELETE', endpoint, **kwargs)
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get the status of the Nexus server."""
+        response = await self.get('/v1/status')
+        return response.json() if response.content else {}
+
+    async def is_writable(self) -> bool:
+        """Check if the Nexus server is in read-only mode."""
+        response = await self.get('/v1/read-only')
+        data = response.json() if response.content else {}
+        return not data.get('frozen', True)
+
+    async def close(self):
+        """Close the session and cleanup resources."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,178 @@
+"""Async components management API."""
+
+import os
+from typing import Dict, Any, AsyncIterator, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ..checkpoint import CheckpointStore
+from .pagination import iter_items
+
+
+class AsyncComponentAPI:
+    """Async API for managing components in Nexus repositories."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def list(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List components in a repository.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token for pagination
+
+        Returns:
+            Dict with 'items' (list of components) and 'continuationToken'
+        """
+        params = {'repository': repository}
+        if continuation_token:
+            params['continuationToken'] = continuation_token
+
+        response = await self.client.get('/v1/components', params=params)
+        return response.json()
+
+    async def iter_components(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all components in a repository, following pagination.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+
+        Yields:
+            Component dicts
+        """
+        async for item in iter_items(
+            lambda token: self.list(repository, continuation_token=token),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            f'components:{repository}'
+        ):
+            yield item
+
+    async def get(self, component_id: str) -> Dict[str, Any]:
+        """
+        Get component details by ID.
+
+        Args:
+            component_id: Component ID
+
+        Returns:
+            Component details
+        """
+        response = await self.client.get(f'/v1/components/{component_id}')
+        return response.json()
+
+    async def delete(self, component_id: str) -> None:
+        """
+        Delete a component.
+
+        Args:
+            component_id: Component ID to delete
+        """
+        await self.client.delete(f'/v1/components/{component_id}')
+
+    async def upload_maven(
+        self,
+        repository: str,
+        group_id: str,
+        artifact_id: str,
+        version: str,
+        file_path: str,
+        packaging: str = "jar",
+        generate_pom: bool = False
+    ) -> None:
+        """
+        Upload a Maven component.
+
+        Args:
+            repository: Repository name
+            group_id: Maven groupId
+            artifact_id: Maven artifactId
+            version: Version
+            file_path: Path to file to upload
+            packaging: Packaging type (jar, war, pom, etc.)
+            generate_pom: Auto-generate POM file
+        """
+        with open(file_path, 'rb') as f:
+            form = aiohttp.FormData()
+            form.add_field('maven2.groupId', group_id)
+            form.add_field('maven2.artifactId', artifact_id)
+            form.add_field('maven2.version', version)
+            form.add_field('maven2.asset1.extension', packaging)
+            form.add_field('maven2.generate-pom', str(generate_pom).lower())
+            form.add_field('maven2.asset1', f, filename=os.path.basename(file_path))
+
+            await self.client.post(
+                '/v1/components',
+                params={'repository': repository},
+                data=form
+            )
+
+    async def upload_npm(
+        self,
+        repository: str,
+        package_path: str
+    ) -> None:
+        """
+        Upload an NPM package.
+
+        Args:
+            repository: Repository name
+            package_path: Path to .tgz package file
+        """
+        with open(package_path, 'rb') as f:
+            form = aiohttp.FormData()
+            form.add_field('npm.asset', f, filename=os.path.basename(package_path))
+
+            await self.client.post(
+                '/v1/components',
+                params={'repository': repository},
+                data=form
+            )
+
+    async def upload_raw(
+        self,
+        repository: str,
+        directory: str,
+        filename: str,
+        file_path: str
+    ) -> None:
+        """
+        Upload a raw component.
+
+        Args:
+            repository: Repository name
+            directory: Directory path in repository
+            filename: Filename in repository
+            file_path: Local file path
+        """
+        with open(file_path, 'rb') as f:
+            form = aiohttp.FormData()
+            form.add_field('raw.directory', directory)
+            form.add_field('raw.asset1.filename', filename)
+            form.add_field('raw.asset1', f, filename=os.path.basename(file_path))
+
+            await self.client.post(
+                '/v1/components',
+                params={'repository': repository},
+                data=form
+            )
@@ -0,0 +1,135 @@
+"""Async helpers for walking continuationToken-paginated endpoints."""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from ..checkpoint import CheckpointStore
+
+
+# Sentinel put on the prefetch queue once the last page has been fetched
+_DONE = object()
+
+
+class _PrefetchError:
+    """Wraps an exception raised by the prefetch task."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def iter_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield pages from a paginated endpoint until no continuation token is left.
+
+    With ``prefetch`` > 0, a background task requests page N+1 as soon as
+    page N's continuation token is known, buffering at most ``prefetch``
+    pages ahead of the consumer.
+
+    Args:
+        fetch_page: Coroutine function taking a continuation token and
+            returning a page dict with 'items' and 'continuationToken'
+        continuation_token: Token to start from (None for the first page)
+        prefetch: Number of pages to fetch ahead in the background (0 disables)
+
+    Yields:
+        Page dicts as returned by the endpoint
+    """
+    if prefetch > 0:
+        async for page in _iter_pages_prefetched(fetch_page, continuation_token, prefetch):
+            yield page
+        return
+
+    token = continuation_token
+    while True:
+        page = await fetch_page(token)
+        yield page
+
+        token = page.get('continuationToken')
+        if not token:
+            break
+
+
+async def _iter_pages_prefetched(
+    fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+    continuation_token: Optional[str],
+    depth: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield pages fetched by a background task."""
+    pages = asyncio.Queue(maxsize=depth)
+
+    async def worker():
+        token = continuation_token
+        try:
+            while True:
+                page = await fetch_page(token)
+                await pages.put(page)
+                token = page.get('continuationToken')
+                if not token:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await pages.put(_PrefetchError(e))
+            return
+        await pages.put(_DONE)
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+
+
+async def iter_items(
+    fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0,
+    checkpoint: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield items one at a time from a paginated endpoint.
+
+    Checkpointing behaves as in nexus_client.pagination.iter_items().
+
+    Args:
+        fetch_page: Coroutine function taking a continuation token
+        continuation_token: Token to start from (None for the first page or
+            the checkpointed position)
+        prefetch: Number of pages to fetch ahead in the background (0 disables)
+        checkpoint: Store used to persist progress after each page
+        checkpoint_key: Key of this walk in the checkpoint store
+
+    Yields:
+        Items from each page, in order
+    """
+    if checkpoint is not None:
+        if not checkpoint_key:
+            raise ValueError("checkpoint_key is required when checkpoint is set")
+        state = checkpoint.get(checkpoint_key)
+        if state is not None and continuation_token is None:
+            if state.get('complete'):
+                return
+            continuation_token = state.get('continuationToken')
+
+    async for page in iter_pages(fetch_page, continuation_token, prefetch):
+        items = page.get('items', [])
+        for item in items:
+            yield item
+
+        if checkpoint is not None:
+            checkpoint.save_page(
+                checkpoint_key,
+                page.get('continuationToken'),
+                len(items)
+            )
@@ -0,0 +1,191 @@
+"""Async search API for finding components and assets."""
+
+from typing import Dict, Any, AsyncIterator, Optional
+
+from ..checkpoint import CheckpointStore, search_checkpoint_key
+from .pagination import iter_items
+
+
+class AsyncSearchAPI:
+    """Async API for searching components and assets."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def search(
+        self,
+        repository: Optional[str] = None,
+        format: Optional[str] = None,
+        group: Optional[str] = None,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        md5: Optional[str] = None,
+        sha1: Optional[str] = None,
+        sha256: Optional[str] = None,
+        sha512: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        **extra_params
+    ) -> Dict[str, Any]:
+        """
+        Search for components.
+
+        Args:
+            repository: Repository name
+            format: Repository format (maven2, npm, docker, etc.)
+            group: Component group (e.g., Maven groupId)
+            name: Component name
+            version: Component version
+            md5: MD5 checksum
+            sha1: SHA-1 checksum
+            sha256: SHA-256 checksum
+            sha512: SHA-512 checksum
+            continuation_token: Token for pagination
+            **extra_params: Additional search parameters passed through as-is,
+                e.g. format attributes such as 'maven.extension' or 'q'
+
+        Returns:
+            Dict with 'items' (list of components) and 'continuationToken'
+        """
+        params = {}
+
+        if repository:
+            params['repository'] = repository
+        if format:
+            params['format'] = format
+        if group:
+            params['group'] = group
+        if name:
+            params['name'] = name
+        if version:
+            params['version'] = version
+        if md5:
+            params['md5'] = md5
+        if sha1:
+            params['sha1'] = sha1
+        if sha256:
+            params['sha256'] = sha256
+        if sha512:
+            params['sha512'] = sha512
+        if continuation_token:
+            params['continuationToken'] = continuation_token
+        params.update({k: v for k, v in extra_params.items() if v})
+
+        response = await self.client.get('/v1/search', params=params)
+        return response.json()
+
+    async def search_assets(
+        self,
+        repository: Optional[str] = None,
+        format: Optional[str] = None,
+        group: Optional[str] = None,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        md5: Optional[str] = None,
+        sha1: Optional[str] = None,
+        sha256: Optional[str] = None,
+        sha512: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        **extra_params
+    ) -> Dict[str, Any]:
+        """
+        Search for assets.
+
+        Args:
+            repository: Repository name
+            format: Repository format
+            group: Component group
+            name: Component name
+            version: Component version
+            md5: MD5 checksum
+            sha1: SHA-1 checksum
+            sha256: SHA-256 checksum
+            sha512: SHA-512 checksum
+            continuation_token: Token for pagination
+            **extra_params: Additional search parameters passed through as-is,
+                e.g. format attributes such as 'maven.extension' or 'q'
+
+        Returns:
+            Dict with 'items' (list of assets) and 'continuationToken'
+        """
+        params = {}
+
+        if repository:
+            params['repository'] = repository
+        if format:
+            params['format'] = format
+        if group:
+            params['group'] = group
+        if name:
+            params['name'] = name
+        if version:
+            params['version'] = version
+        if md5:
+            params['md5'] = md5
+        if sha1:
+            params['sha1'] = sha1
+        if sha256:
+            params['sha256'] = sha256
+        if sha512:
+            params['sha512'] = sha512
+        if continuation_token:
+            params['continuationToken'] = continuation_token
+        params.update({k: v for k, v in extra_params.items() if v})
+
+        response = await self.client.get('/v1/search/assets', params=params)
+        return response.json()
+
+    async def iter_search(
+        self,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        **filters
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all matching components, following pagination.
+
+        Args:
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+            **filters: Search filters accepted by search()
+
+        Yields:
+            Component dicts
+        """
+        async for item in iter_items(
+            lambda token: self.search(continuation_token=token, **filters),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            search_checkpoint_key('search', filters)
+        ):
+            yield item
+
+    async def iter_search_assets(
+        self,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        **filters
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all matching assets, following pagination.
+
+        Args:
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+            **filters: Search filters accepted by search_assets()
+
+        Yields:
+            Asset dicts
+        """
+        async for item in iter_items(
+            lambda token: self.search_assets(continuation_token=token, **filters),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            search_checkpoint_key('search_assets', filters)
+        ):
+            yield item
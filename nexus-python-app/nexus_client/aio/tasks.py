@@ -0,0 +1,51 @@
+"""Async tasks management API."""
+
+from typing import List, Dict, Any
+
+
+class AsyncTaskAPI:
+    """Async API for managing scheduled tasks."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """
+        List all tasks.
+
+        Returns:
+            List of tasks
+        """
+        response = await self.client.get('/v1/tasks')
+        return response.json()
+
+    async def get(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get task details.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task details
+        """
+        response = await self.client.get(f'/v1/tasks/{task_id}')
+        return response.json()
+
+    async def run(self, task_id: str) -> None:
+        """
+        Run a task immediately.
+
+        Args:
+            task_id: Task ID to run
+        """
+        await self.client.post(f'/v1/tasks/{task_id}/run')
+
+    async def stop(self, task_id: str) -> None:
+        """
+        Stop a running task.
+
+        Args:
+            task_id: Task ID to stop
+        """
+        await self.client.post(f'/v1/tasks/{task_id}/stop')
@@ -0,0 +1,272 @@
+"""Content-addressed local cache of downloaded artifacts."""
+
+import errno
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# Linux ioctl cloning a file's extents (copy-on-write reflink)
+_FICLONE = 0x40049409
+
+# Ways of producing an output file from a cached object, in 'auto' order
+LINK_MODES = ('reflink', 'hardlink', 'copy')
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Create dst as a copy-on-write clone of src (Btrfs, XFS, ...)."""
+    if fcntl is None or not hasattr(fcntl, 'ioctl'):
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported")
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+
+
+def _place(src: str, dst: str, mode: str) -> str:
+    """
+    Atomically make dst hold the content of src.
+
+    Args:
+        src: Existing file
+        dst: Destination path (replaced if it exists)
+        mode: 'auto' or one of LINK_MODES
+
+    Returns:
+        Link mode that was used
+    """
+    directory = os.path.dirname(os.path.abspath(dst))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.nexus-')
+    os.close(fd)
+    os.unlink(tmp_path)
+
+    modes = LINK_MODES if mode == 'auto' else (mode,)
+    try:
+        for index, candidate in enumerate(modes):
+            try:
+                if candidate == 'reflink':
+                    _reflink(src, tmp_path)
+                elif candidate == 'hardlink':
+                    os.link(src, tmp_path)
+                else:
+                    shutil.copyfile(src, tmp_path)
+            except OSError as e:
+                if index == len(modes) - 1 or e.errno == errno.ENOENT:
+                    raise
+                continue
+            os.replace(tmp_path, dst)
+            return candidate
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    raise ValueError(f"Unknown link mode {mode!r}")
+
+
+class ArtifactCache:
+    """
+    Local cache of artifacts keyed by SHA-256, shared across repositories.
+
+    Objects are stored as ``<root>/objects/ab/abcdef...`` and handed out
+    as reflinks (copy-on-write clones, where the file system supports
+    them), hardlinks, or copies, in that order with the default 'auto'
+    mode. Hardlinked outputs share the cached inode: treat them as
+    read-only, or choose 'reflink' or 'copy'.
+
+    Several processes can share one cache directory: objects are added by
+    atomic rename, hits refresh the object's mtime, and eviction of the
+    least recently used objects down to ``max_bytes`` runs under an
+    exclusive file lock.
+
+    Example:
+        >>> cache = ArtifactCache('~/.cache/nexus-artifacts', max_bytes=20 * 1024**3)
+        >>> client = NexusClient(url, artifact_cache=cache)
+        >>> client.assets.download(asset, 'out/app.jar')  # fetched, then cached
+        >>> client.assets.download(asset, 'other/app.jar')  # linked from the cache
+    """
+
+    def __init__(self, root: str, max_bytes: int = 10 * 1024 ** 3, link_mode: str = 'auto'):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (created if needed)
+            max_bytes: Size cap; least recently used objects are evicted above it
+            link_mode: 'auto', 'reflink', 'hardlink' or 'copy'
+        """
+        if link_mode != 'auto' and link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be 'auto' or one of {LINK_MODES}")
+
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.max_bytes = max_bytes
+        self.link_mode = link_mode
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._objects = os.path.join(self.root, 'objects')
+        os.makedirs(self._objects, exist_ok=True)
+        self._lock = threading.Lock()
+        # Approximate size, rescanned under the file lock before evicting
+        self._size: Optional[int] = None
+
+    def object_path(self, sha256: str) -> str:
+        """Path of the cached object for a digest."""
+        sha256 = sha256.lower()
+        if len(sha256) != 64 or any(c not in '0123456789abcdef' for c in sha256):
+            raise ValueError(f"Invalid SHA-256 digest {sha256!r}")
+        return os.path.join(self._objects, sha256[:2], sha256)
+
+    def contains(self, sha256: str) -> bool:
+        """Check whether an object is cached."""
+        return os.path.exists(self.object_path(sha256))
+
+    def fetch(self, sha256: str, output_path: str) -> bool:
+        """
+        Produce ``output_path`` from the cache if the content is there.
+
+        Args:
+            sha256: Digest of the wanted content
+            output_path: Destination file (replaced if it exists)
+
+        Returns:
+            True on a hit, False if the content has to be downloaded
+        """
+        path = self.object_path(sha256)
+        try:
+            _place(path, output_path, self.link_mode)
+            # mtime is the LRU clock, shared with other processes
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, sha256: str, file_path: str) -> None:
+        """
+        Add a downloaded file whose SHA-256 has been verified.
+
+        Args:
+            sha256: Digest of the file content
+            file_path: File to add (left in place)
+        """
+        path = self.object_path(sha256)
+        try:
+            os.utime(path)
+            return
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            _place(file_path, path, self.link_mode)
+        except OSError as e:
+            # A full or read-only cache must not fail the download
+            logger.warning("Could not cache %s: %s", file_path, e)
+            return
+
+        size = os.path.getsize(path)
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+            over = self._size is None or self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """List (mtime, size, path) of all objects."""
+        entries = []
+        for directory, _dirs, names in os.walk(self._objects):
+            for name in names:
+                if name.startswith('.'):
+                    # Object being added by _place()
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock on the cache directory, shared with other processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.root, '.lock'), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Remove least recently used objects until the cache fits.
+
+        Args:
+            max_bytes: Target size (defaults to the cache's max_bytes)
+
+        Returns:
+            Number of evicted objects
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        evicted = 0
+        with self._file_lock():
+            entries = self._scan()
+            total = sum(size for _, size, _ in entries)
+            for _mtime, size, path in sorted(entries):
+                if total <= limit:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                evicted += 1
+
+        with self._lock:
+            self._size = total
+            self.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every object."""
+        self.evict(0)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, objects and bytes
+        """
+        entries = self._scan()
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'objects': len(entries),
+                'bytes': sum(size for _, size, _ in entries),
+            }
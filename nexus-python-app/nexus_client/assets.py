@@ -1,6 +1,31 @@
 """Assets management API."""
 
-from typing import List, Dict, Any, Optional
+import os
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import quote, unquote, urlparse
+
+from .checkpoint import CheckpointStore
+from .checksums import ChecksumVerifier
+from .downloads import (
+    DOWNLOAD_CHUNK_SIZE,
+    SEGMENT_THRESHOLD,
+    DownloadManager,
+    DownloadReport,
+    DownloadResult,
+    download_file,
+    download_segmented
+)
+from .mirror import MirrorReport, RepositoryMirror
+from .pagination import iter_items
+
+
+def _url_path(url: str) -> str:
+    """Repository path of a download URL ('/repository/{name}/{path}')."""
+    path = unquote(urlparse(url).path)
+    marker = '/repository/'
+    if marker in path:
+        path = path.split(marker, 1)[1].split('/', 1)[-1]
+    return path.lstrip('/')
 
 
 class AssetAPI:
@@ -28,8 +53,37 @@ class AssetAPI:
         if continuation_token:
             params['continuationToken'] = continuation_token
 
-        response = self.client.get('/v1/assets', params=params)
-        return response.json()
+        return self.client.get_json('/v1/assets', params=params)
+
+    def iter_assets(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all assets in a repository, following pagination.
+
+        Pages are fetched lazily, so memory use stays flat regardless of
+        repository size.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+
+        Yields:
+            Asset dicts
+        """
+        return iter_items(
+            lambda token: self.list(repository, continuation_token=token),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            f'assets:{repository}'
+        )
 
     def get(self, asset_id: str) -> Dict[str, Any]:
         """
@@ -41,8 +95,7 @@ class AssetAPI:
         Returns:
             Asset details
         """
-        response = self.client.get(f'/v1/assets/{asset_id}')
-        return response.json()
+        return self.client.get_json(f'/v1/assets/{asset_id}')
 
     def delete(self, asset_id: str) -> None:
         """
@@ -51,30 +104,263 @@ class AssetAPI:
         Args:
             asset_id: Asset ID to delete
         """
-        self.client.delete(f'/v1/assets/{asset_id}')
+        try:
+            self.client.delete(f'/v1/assets/{asset_id}')
+        finally:
+            # The ID does not tell which repository lost the content
+            self.client.components.checksum_index.clear()
+
+    def describe(
+        self,
+        asset: Union[str, Dict[str, Any]],
+        repository: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get what is known about an asset to download it.
+
+        Asset dicts from listings and searches are returned as they are,
+        so only a bare asset ID costs an extra request. For URLs and paths
+        only 'downloadUrl' and 'path' are known.
+
+        Args:
+            asset: Asset ID, asset dict, download URL, or repository path
+                (the latter requires ``repository``)
+            repository: Repository holding ``asset`` when it is a path
+
+        Returns:
+            Asset dict with at least 'downloadUrl' and 'path'
+        """
+        if isinstance(asset, dict):
+            download_url = asset.get('downloadUrl')
+            if not download_url:
+                if 'id' not in asset:
+                    raise ValueError(f"Asset {asset!r} has no download URL")
+                return self.describe(asset['id'])
+            if asset.get('path'):
+                return asset
+            return dict(asset, path=_url_path(download_url))
+
+        if '://' in asset:
+            return {'downloadUrl': asset, 'path': _url_path(asset)}
+
+        if repository is not None:
+            path = asset.lstrip('/')
+            return {
+                'downloadUrl': f'{self.client.base_url}/repository/{repository}/{quote(path)}',
+                'path': path,
+                'repository': repository,
+            }
+
+        details = self.get(asset)
+        if not details.get('downloadUrl'):
+            raise ValueError(f"Asset {asset} has no download URL")
+        return details
+
+    def resolve(
+        self,
+        asset: Union[str, Dict[str, Any]],
+        repository: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Find the download URL and repository path of an asset.
+
+        Args:
+            asset: Anything accepted by describe()
+            repository: Repository holding ``asset`` when it is a path
+
+        Returns:
+            (download URL, repository path) tuple
+        """
+        details = self.describe(asset, repository)
+        return details['downloadUrl'], details['path'].lstrip('/')
 
-    def download(self, asset_id: str, output_path: str) -> None:
+    def download(
+        self,
+        asset_id: Union[str, Dict[str, Any]],
+        output_path: str,
+        repository: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = True,
+        segments: int = 1,
+        segment_threshold: int = SEGMENT_THRESHOLD,
+        verify: bool = True,
+        preallocate: bool = True
+    ) -> int:
         """
         Download an asset to a file.
 
+        The file is written as ``output_path + '.part'`` and renamed when
+        complete; see download_file() for how interrupted downloads resume.
+        With ``segments`` > 1, assets of at least ``segment_threshold``
+        bytes are fetched as that many byte ranges in parallel (see
+        download_segmented()); size the client's ``pool_maxsize`` to match.
+
+        With ``verify``, the SHA-1, SHA-256 and MD5 found in the asset
+        metadata are computed while the body is written and checked before
+        the file is renamed into place. Assets given as URLs or paths carry
+        no metadata and are not verified.
+
+        With ``preallocate``, the file is allocated to the asset's
+        ``fileSize`` before the body is written.
+
+        With the client's ``artifact_cache``, an asset whose SHA-256 is
+        already cached is linked from the cache instead of downloaded, and
+        downloaded assets with a SHA-256 are added to it (their SHA-256 is
+        then always verified).
+
         Args:
-            asset_id: Asset ID
+            asset_id: Asset ID, or anything accepted by describe()
             output_path: Path to save the downloaded file
+            repository: Repository name when ``asset_id`` is a path
+            chunk_size: Size of the reads from the response body
+            resume: Continue partial downloads with Range requests
+            segments: Number of parallel connections for large assets
+            segment_threshold: Minimum size in bytes for a segmented download
+            verify: Check the content against the asset's checksums
+            preallocate: Reserve the file's size on disk up front
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            NexusChecksumMismatchError: If the content does not match; the
+                file is deleted
         """
-        asset = self.get(asset_id)
-        download_url = asset.get('downloadUrl')
+        details = self.describe(asset_id, repository)
 
-        if not download_url:
-            raise ValueError(f"Asset {asset_id} has no download URL")
+        cache = self.client.artifact_cache
+        sha256 = (details.get('checksum') or {}).get('sha256') if cache is not None else None
+        if sha256 and cache.fetch(sha256, output_path):
+            return os.path.getsize(output_path)
 
-        response = self.client.session.get(
+        if verify:
+            verifier = ChecksumVerifier.for_asset(details)
+        else:
+            # Cached content must match its key even when not verifying
+            verifier = ChecksumVerifier({'sha256': sha256}) if sha256 else None
+
+        size = self._fetch(
+            details, output_path, resume, chunk_size, segments, segment_threshold, verifier, preallocate
+        )
+        if sha256:
+            cache.put(sha256, output_path)
+        return size
+
+    def _fetch(
+        self,
+        details: Dict[str, Any],
+        output_path: str,
+        resume: bool,
+        chunk_size: int,
+        segments: int,
+        segment_threshold: int,
+        verifier: Optional[ChecksumVerifier],
+        preallocate: bool
+    ) -> int:
+        """Download an asset over the network."""
+        download_url = details['downloadUrl']
+        size = details.get('fileSize')
+
+        # Absolute URLs go through _request unchanged, so downloads share
+        # the client's retry policy, rate limits and error mapping
+        if segments > 1:
+            # Unknown sizes are found out by download_segmented()'s probe
+            if size is None or size >= segment_threshold:
+                return download_segmented(
+                    self.client,
+                    download_url,
+                    output_path,
+                    segments,
+                    segment_threshold,
+                    chunk_size,
+                    verifier
+                )
+        return download_file(
+            self.client,
             download_url,
-            verify=self.client.verify_ssl,
-            timeout=self.client.timeout,
-            stream=True
+            output_path,
+            resume,
+            chunk_size,
+            verifier,
+            size=size if preallocate else None
         )
-        response.raise_for_status()
 
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+    def download_many(
+        self,
+        assets: Iterable[Union[str, Dict[str, Any]]],
+        dest_dir: str,
+        repository: Optional[str] = None,
+        workers: int = 8,
+        progress: Optional[Callable[[DownloadResult], None]] = None,
+        segments: int = 1,
+        segment_threshold: int = SEGMENT_THRESHOLD,
+        verify: bool = True
+    ) -> DownloadReport:
+        """
+        Download many assets concurrently into a directory.
+
+        See DownloadManager.
+
+        Args:
+            assets: Asset IDs, asset dicts, download URLs or repository paths
+            dest_dir: Directory the assets are saved under, by repository path
+            repository: Repository name for items given as paths
+            workers: Number of concurrent downloads
+            progress: Callback receiving each DownloadResult as it completes
+            segments: Parallel connections per asset of at least
+                ``segment_threshold`` bytes
+            segment_threshold: Minimum size in bytes for a segmented download
+            verify: Check downloads against the asset checksums
+
+        Returns:
+            DownloadReport of the run
+        """
+        manager = DownloadManager(
+            self,
+            workers=workers,
+            segments=segments,
+            segment_threshold=segment_threshold,
+            verify=verify
+        )
+        return manager.download(assets, dest_dir, repository, progress)
+
+    def mirror(
+        self,
+        repository: str,
+        dest_dir: str,
+        workers: int = 8,
+        delete: bool = False,
+        progress: Optional[Callable[[DownloadResult], None]] = None,
+        segments: int = 1,
+        segment_threshold: int = SEGMENT_THRESHOLD,
+        verify: bool = True
+    ) -> MirrorReport:
+        """
+        Incrementally sync a repository into a local directory.
+
+        Only assets that are new or changed since the last run are
+        downloaded. See RepositoryMirror.
+
+        Args:
+            repository: Repository name
+            dest_dir: Mirror directory
+            workers: Number of concurrent downloads
+            delete: Remove local files of assets deleted from the repository
+            progress: Callback receiving each DownloadResult as it completes
+            segments: Parallel connections per asset of at least
+                ``segment_threshold`` bytes
+            segment_threshold: Minimum size in bytes for a segmented download
+            verify: Check downloads against the asset checksums
+
+        Returns:
+            MirrorReport of the run
+        """
+        mirror = RepositoryMirror(
+            self,
+            workers=workers,
+            delete=delete,
+            verify=verify,
+            segments=segments,
+            segment_threshold=segment_threshold
+        )
+        return mirror.mirror(repository, dest_dir, progress)
@@ -2,6 +2,8 @@
 
 from typing import List, Dict, Any, Optional
 
+from .conditional import PollResult
+
 
 class BlobStoreAPI:
     """API for managing blob stores."""
@@ -16,8 +18,20 @@ class BlobStoreAPI:
         Returns:
             List of blob stores
         """
-        response = self.client.get('/v1/blobstores')
-        return response.json()
+        return self.client.get_json('/v1/blobstores')
+
+    def poll(self) -> PollResult:
+        """
+        List all blob stores with a conditional request.
+
+        Cheap to call every few seconds: when nothing changed Nexus answers
+        304 and the previous list is returned without being re-downloaded.
+
+        Returns:
+            PollResult whose ``data`` is the list of blob stores and
+            ``changed`` tells whether it differs from the previous poll
+        """
+        return self.client.poll('/v1/blobstores')
 
     def get_file_blob_store(self, name: str) -> Dict[str, Any]:
         """
@@ -29,8 +43,7 @@ class BlobStoreAPI:
         Returns:
             Blob store configuration
         """
-        response = self.client.get(f'/v1/blobstores/file/{name}')
-        return response.json()
+        return self.client.get_json(f'/v1/blobstores/file/{name}')
 
     def create_file_blob_store(
         self,
@@ -113,5 +126,4 @@ class BlobStoreAPI:
         Returns:
             Quota status information
         """
-        response = self.client.get(f'/v1/blobstores/{name}/quota-status')
-        return response.json()
+        return self.client.get_json(f'/v1/blobstores/{name}/quota-status')
@@ -0,0 +1,287 @@
+"""In-memory TTL/LRU cache for read-only API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Default time-to-live in seconds per endpoint template. Endpoints that are
+# not listed (searches, listings of components and assets, downloads) are
+# not cached unless ResponseCache is given a default_ttl.
+DEFAULT_TTLS = {
+    '/v1/repositories': 60.0,
+    '/v1/repositories/{name}': 60.0,
+    '/v1/blobstores': 60.0,
+    '/v1/blobstores/file/{name}': 60.0,
+    '/v1/security/roles': 300.0,
+    '/v1/security/roles/{source}/{role_id}': 300.0,
+    '/v1/security/privileges': 300.0,
+    '/v1/security/privileges/{name}': 300.0,
+    '/v1/components/{id}': 300.0,
+    '/v1/assets/{id}': 300.0,
+}
+
+# Resource roots, most specific first
+_ROOTS = (
+    '/v1/security/users',
+    '/v1/security/roles',
+    '/v1/security/privileges',
+    '/v1/repositories',
+    '/v1/blobstores',
+    '/v1/components',
+    '/v1/assets',
+    '/v1/search',
+    '/v1/tasks',
+)
+
+# Writes under a root also change what these roots return
+_RELATED_ROOTS = {
+    '/v1/repositories': ('/v1/components', '/v1/assets', '/v1/search'),
+    '/v1/components': ('/v1/assets', '/v1/search'),
+    '/v1/assets': ('/v1/components', '/v1/search'),
+    '/v1/blobstores': ('/v1/repositories',),
+    '/v1/security/privileges': ('/v1/security/roles',),
+}
+
+# Roots whose resources are reachable under several paths (a blob store
+# 'x' is deleted at /v1/blobstores/x but read at /v1/blobstores/file/x),
+# so any write evicts everything under them
+_FAMILY_ROOTS = ('/v1/blobstores',)
+
+_REST_PREFIX = '/service/rest'
+
+# Approximate per-entry bookkeeping overhead in bytes
+_ENTRY_OVERHEAD = 512
+
+
+def api_path(url: str) -> str:
+    """Path of a URL relative to the REST base, e.g. '/v1/components/abc'."""
+    path = urlparse(url).path if '://' in url else url
+    path = '/' + path.lstrip('/')
+    if path.startswith(_REST_PREFIX + '/'):
+        path = path[len(_REST_PREFIX):]
+    return path.rstrip('/') or '/'
+
+
+def _under(path: str, root: str) -> bool:
+    """Check whether path is root or one of its sub-resources."""
+    return path == root or path.startswith(root + '/')
+
+
+class _Entry:
+    """Cached response data."""
+
+    __slots__ = ('path', 'expires', 'status_code', 'headers', 'content', 'url', 'encoding', 'size')
+
+    def __init__(self, path: str, expires: float, response: requests.Response):
+        self.path = path
+        self.expires = expires
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.content = response.content
+        self.url = response.url
+        self.encoding = response.encoding
+        self.size = len(self.content) + _ENTRY_OVERHEAD
+
+    def to_response(self) -> requests.Response:
+        """Build a fresh Response object from the cached data."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = self.encoding
+        response.reason = 'OK'
+        response.from_cache = True
+        response.retries = 0
+        return response
+
+
+class ResponseCache:
+    """
+    Thread-safe response cache with per-endpoint TTLs and a memory-bounded LRU.
+
+    Only GET responses of endpoints with a TTL are stored. Any write
+    (POST, PUT, DELETE) through the same client evicts the written
+    resource, its sub-resources, the collection listings above it and
+    related collections (e.g. deleting a repository evicts cached
+    components, assets and searches).
+
+    Example:
+        >>> client = NexusClient(url, cache=ResponseCache(max_bytes=32 * 1024 * 1024))
+        >>> client.repositories.list()  # fetched
+        >>> client.repositories.list()  # served from cache
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Approximate memory budget for cached bodies
+            ttls: TTL in seconds per endpoint template, merged over DEFAULT_TTLS
+                (a TTL of 0 disables caching for that endpoint)
+            default_ttl: TTL for endpoints without an entry in ``ttls``
+                (None leaves them uncached)
+        """
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, template: str) -> Optional[float]:
+        """TTL in seconds for an endpoint template, or None if it is not cached."""
+        ttl = self.ttls.get(template, self.default_ttl)
+        return ttl if ttl else None
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (url, items)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        template: str
+    ) -> Optional[requests.Response]:
+        """
+        Look up a fresh cached response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            template: Endpoint template of the request
+
+        Returns:
+            A new Response built from the cached data, or None on a miss
+        """
+        if self.ttl_for(template) is None:
+            return None
+
+        key = self._key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.to_response()
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        template: str,
+        response: requests.Response
+    ) -> None:
+        """
+        Cache a successful GET response if its endpoint has a TTL.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            template: Endpoint template of the request
+            response: Fully read response
+        """
+        ttl = self.ttl_for(template)
+        if ttl is None or response.status_code != 200:
+            return
+
+        key = self._key(url, params)
+        entry = _Entry(api_path(url), time.monotonic() + ttl, response)
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, url: str) -> int:
+        """
+        Evict entries affected by a write to ``url``.
+
+        Args:
+            url: URL or endpoint that was written
+
+        Returns:
+            Number of evicted entries
+        """
+        path = api_path(url)
+        root = next((r for r in _ROOTS if _under(path, r)), None)
+        related = _RELATED_ROOTS.get(root, ()) if root else ()
+        if root in _FAMILY_ROOTS:
+            related = (root,) + related
+
+        def affected(entry_path: str) -> bool:
+            # The resource itself and its sub-resources
+            if _under(entry_path, path):
+                return True
+            # Collection listings above it
+            if path.startswith(entry_path + '/'):
+                return True
+            return any(_under(entry_path, other) for other in related)
+
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if affected(entry.path)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Evict every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, entries and bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def _remove(self, key: Tuple) -> None:
+        """Remove an entry (lock held)."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
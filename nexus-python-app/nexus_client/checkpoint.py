@@ -0,0 +1,153 @@
+"""Persistent checkpoints for resumable paginated crawls."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class CheckpointStore:
+    """
+    JSON file recording the progress of paginated walks.
+
+    Each crawl is stored under a key (e.g. 'components:maven-releases')
+    with the continuationToken of the next page to fetch and counters for
+    the pages and items already consumed. The file is rewritten atomically
+    after every update, so a crash never leaves it half-written.
+
+    Example:
+        >>> store = CheckpointStore("crawl.checkpoint.json")
+        >>> for component in client.components.iter_components("maven-releases", checkpoint=store):
+        ...     process(component)
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a checkpoint file.
+
+        Args:
+            path: Path to the JSON checkpoint file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from disk, returning an empty store if missing."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self) -> None:
+        """Atomically replace the checkpoint file with the current entries."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored entry for a key.
+
+        Args:
+            key: Checkpoint key
+
+        Returns:
+            Copy of the entry, or None if the key is unknown
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return dict(entry) if entry is not None else None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an arbitrary entry for a key and persist it.
+
+        Args:
+            key: Checkpoint key
+            entry: JSON-serializable dict
+        """
+        with self._lock:
+            self._entries[key] = dict(entry)
+            self._write()
+
+    def save_page(
+        self,
+        key: str,
+        continuation_token: Optional[str],
+        items: int
+    ) -> None:
+        """
+        Record that one more page of a walk has been fully consumed.
+
+        Args:
+            key: Checkpoint key
+            continuation_token: Token of the next page, or None if the walk is done
+            items: Number of items in the consumed page
+        """
+        with self._lock:
+            entry = self._entries.get(key) or {'pages': 0, 'items': 0}
+            entry['continuationToken'] = continuation_token
+            entry['pages'] = entry.get('pages', 0) + 1
+            entry['items'] = entry.get('items', 0) + items
+            entry['complete'] = continuation_token is None
+            entry['updated'] = time.time()
+            self._entries[key] = entry
+            self._write()
+
+    def is_complete(self, key: str) -> bool:
+        """Check whether the walk stored under ``key`` has finished."""
+        with self._lock:
+            return bool(self._entries.get(key, {}).get('complete'))
+
+    def progress(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of every stored entry.
+
+        Returns:
+            Dict mapping keys to their entries
+        """
+        with self._lock:
+            return {key: dict(entry) for key, entry in self._entries.items()}
+
+    def reset(self, key: str) -> None:
+        """
+        Forget a single walk so it restarts from the first page.
+
+        Args:
+            key: Checkpoint key
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._write()
+
+    def clear(self) -> None:
+        """Forget every stored walk."""
+        with self._lock:
+            self._entries = {}
+            self._write()
+
+
+def search_checkpoint_key(kind: str, filters: Dict[str, Any]) -> str:
+    """
+    Build a stable checkpoint key for a search walk.
+
+    Args:
+        kind: 'search' or 'search_assets'
+        filters: Search filters of the walk
+
+    Returns:
+        Key such as 'search_assets:{"name": "foo*", "repository": "r"}'
+    """
+    return f"{kind}:{json.dumps(filters, sort_keys=True)}"
@@ -0,0 +1,128 @@
+"""Checksum helpers for uploads and downloads."""
+
+import hashlib
+from typing import Any, Dict, Optional, Sequence
+
+from .exceptions import NexusChecksumMismatchError
+
+
+# Size of the reads made while hashing local files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Checksums of the asset metadata verified by downloads
+VERIFY_ALGORITHMS = ('sha1', 'sha256', 'md5')
+
+
+def hash_file(
+    path: str,
+    algorithms: Sequence[str] = ('sha256',),
+    chunk_size: int = HASH_CHUNK_SIZE
+) -> Dict[str, str]:
+    """
+    Hash a local file with one or more algorithms in a single read.
+
+    Args:
+        path: File path
+        algorithms: hashlib algorithm names (as used in Nexus asset
+            checksums: 'sha1', 'sha256', 'sha512', 'md5')
+        chunk_size: Size of each read
+
+    Returns:
+        Dict mapping algorithm to hex digest
+    """
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+def sha256_file(path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """SHA-256 hex digest of a local file."""
+    return hash_file(path, ('sha256',), chunk_size)['sha256']
+
+
+class ChecksumVerifier:
+    """
+    Incremental hashes of a download, checked against expected digests.
+
+    Fed with the same chunks that are written to disk, so verifying costs
+    no extra read of the file.
+
+    Example:
+        >>> verifier = ChecksumVerifier.for_asset(asset)
+        >>> for chunk in chunks:
+        ...     f.write(chunk)
+        ...     verifier.update(chunk)
+        >>> verifier.verify(path)
+    """
+
+    def __init__(self, expected: Dict[str, str]):
+        """
+        Initialize the verifier.
+
+        Args:
+            expected: Hex digests by hashlib algorithm name
+        """
+        self.expected = {name: digest.lower() for name, digest in expected.items() if digest}
+        self.reset()
+
+    @classmethod
+    def for_asset(
+        cls,
+        asset: Dict[str, Any],
+        algorithms: Sequence[str] = VERIFY_ALGORITHMS
+    ) -> Optional['ChecksumVerifier']:
+        """
+        Build a verifier from the 'checksum' block of asset metadata.
+
+        Args:
+            asset: Asset dict
+            algorithms: Algorithms to verify when present in the metadata
+
+        Returns:
+            ChecksumVerifier, or None if the asset has none of the checksums
+        """
+        checksums = asset.get('checksum') or {}
+        expected = {name: checksums[name] for name in algorithms if checksums.get(name)}
+        return cls(expected) if expected else None
+
+    def reset(self) -> None:
+        """Start over, e.g. when a download restarts from the first byte."""
+        self._hashers = {name: hashlib.new(name) for name in self.expected}
+
+    def update(self, data) -> None:
+        """Hash the next chunk of content."""
+        for hasher in self._hashers.values():
+            hasher.update(data)
+
+    def update_from_file(self, path: str, chunk_size: int = HASH_CHUNK_SIZE) -> None:
+        """Hash content already on disk (e.g. the start of a resumed download)."""
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                self.update(chunk)
+
+    def hexdigests(self) -> Dict[str, str]:
+        """Digests of the content hashed so far."""
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+    def verify(self, path: str) -> None:
+        """
+        Compare the digests with the expected ones.
+
+        Args:
+            path: Name of the content, used in the error
+
+        Raises:
+            NexusChecksumMismatchError: On the first digest that differs
+        """
+        for name, actual in self.hexdigests().items():
+            if actual != self.expected[name]:
+                raise NexusChecksumMismatchError(path, name, self.expected[name], actual)
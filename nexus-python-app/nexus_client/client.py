@@ -1,16 +1,27 @@
 """Main Nexus Repository Manager client."""
 
 import requests
+import threading
+import time
 from typing import Optional, Dict, Any
 from urllib.parse import urljoin
 import logging
 
-from .exceptions import (
-    NexusException,
-    NexusAuthenticationError,
-    NexusNotFoundError,
-    NexusForbiddenError,
-    NexusBadRequestError
+from .artifact_cache import ArtifactCache
+from .cache import ResponseCache
+from .conditional import PollResult, ValidatorStore
+from .exceptions import NexusException, error_for_status
+from .metrics import RequestMetrics, endpoint_template
+from .ratelimit import RateLimiter, classify_request
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .tracing import (
+    RequestHook,
+    RequestTrace,
+    TimedHTTPAdapter,
+    connection_timings,
+    reset_connection_timings,
+    run_hooks
 )
 from .repositories import RepositoryAPI
 from .components import ComponentAPI
@@ -40,7 +51,18 @@ class NexusClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         verify_ssl: bool = True,
-        timeout: int = 30
+        timeout: int = 30,
+        retry: Optional[RetryPolicy] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        thread_local_sessions: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        artifact_cache: Optional[ArtifactCache] = None
     ):
         """
         Initialize Nexus client.
@@ -51,6 +73,28 @@ class NexusClient:
             password: Password for authentication
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds
+            retry: Retry policy for transient failures (defaults to
+                RetryPolicy(), pass retry.NO_RETRY to disable)
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum connections kept per host pool; size it to
+                the number of worker threads sharing the client
+            pool_block: Block when the pool is exhausted instead of opening
+                extra, non-reused connections
+            keep_alive: Reuse connections between requests (False sends
+                'Connection: close')
+            thread_local_sessions: Give each thread its own pooled session
+                instead of sharing one across threads
+            rate_limiter: Per-endpoint-class rate and concurrency budgets,
+                may be shared by several clients
+            metrics: Metrics collector (a new RequestMetrics by default),
+                may be shared by several clients
+            cache: Response cache for read-only endpoints (disabled by default)
+            coalesce: Share one request and one decoded result between
+                threads making the same GET through get_json() at the same
+                time; coalesced callers receive the same object and must
+                not modify it
+            artifact_cache: Local content-addressed cache used by asset
+                downloads (disabled by default)
         """
         self.base_url = base_url.rstrip('/')
         self.api_base = urljoin(self.base_url, '/service/rest/')
@@ -58,11 +102,36 @@ class NexusClient:
         self.password = password
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
 
-        # Session for connection pooling
-        self.session = requests.Session()
-        if username and password:
-            self.session.auth = (username, password)
+        # Total number of retries made by this client
+        self.total_retries = 0
+        self._retries_lock = threading.Lock()
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.thread_local_sessions = thread_local_sessions
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+        self.cache = cache
+        self.singleflight = SingleFlight() if coalesce else None
+        self.artifact_cache = artifact_cache
+
+        # ETag/Last-Modified validators remembered by poll()
+        self.validators = ValidatorStore()
+
+        # Callables receiving a RequestTrace before and after each attempt
+        self._pre_request_hooks = []
+        self._post_request_hooks = []
+
+        # Sessions for connection pooling: one shared session, or one per
+        # thread in thread-local mode. All of them are closed by close().
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._local = threading.local()
+        self._session = None if thread_local_sessions else self._create_session()
 
         # Initialize API modules
         self.repositories = RepositoryAPI(self)
@@ -73,6 +142,81 @@ class NexusClient:
         self.search = SearchAPI(self)
         self.blob_stores = BlobStoreAPI(self)
 
+    def _create_session(self) -> requests.Session:
+        """Create a session with the configured pool and authentication."""
+        session = requests.Session()
+        if self.username and self.password:
+            session.auth = (self.username, self.password)
+
+        # Retries are handled by _request, not by urllib3
+        adapter = TimedHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        with self._sessions_lock:
+            self._sessions.append(session)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Session used by the calling thread."""
+        if not self.thread_local_sessions:
+            return self._session
+
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        """Replace the shared session (disables thread-local sessions)."""
+        self.thread_local_sessions = False
+        self._session = session
+        with self._sessions_lock:
+            self._sessions.append(session)
+
+    def add_pre_request_hook(self, hook: RequestHook) -> None:
+        """
+        Register a callable run before every request attempt.
+
+        Args:
+            hook: Callable receiving a RequestTrace (method, url, endpoint
+                template, params, attempt); exceptions it raises are logged
+        """
+        self._pre_request_hooks.append(hook)
+
+    def add_post_request_hook(self, hook: RequestHook) -> None:
+        """
+        Register a callable run after every request attempt.
+
+        Args:
+            hook: Callable receiving the completed RequestTrace, including
+                status, timing breakdown and sizes; exceptions it raises
+                are logged
+        """
+        self._post_request_hooks.append(hook)
+
+    def remove_request_hook(self, hook: RequestHook) -> None:
+        """
+        Unregister a pre- or post-request hook.
+
+        Args:
+            hook: Previously registered callable
+        """
+        for hooks in (self._pre_request_hooks, self._post_request_hooks):
+            if hook in hooks:
+                hooks.remove(hook)
+
     def _request(
         self,
         method: str,
@@ -93,10 +237,13 @@ class NexusClient:
             json: JSON body data
             data: Raw body data
             headers: Additional headers
-            **kwargs: Additional arguments to pass to requests
+            **kwargs: Additional arguments to pass to requests; use_cache=False
+                bypasses the response cache for this call
 
         Returns:
-            Response object
+            Response object, with the number of retries it needed in
+            ``response.retries``. With a rate limiter, a streamed response
+            (stream=True) holds its in-flight slot until it is closed.
 
         Raises:
             NexusAuthenticationError: If authentication fails
@@ -108,56 +255,219 @@ class NexusClient:
         url = urljoin(self.api_base, endpoint.lstrip('/'))
 
         request_headers = headers or {}
+        endpoint_class = classify_request(method, endpoint)
+        template = endpoint_template(endpoint)
+        attempt = 0
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                data=data,
-                headers=request_headers,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
-                **kwargs
-            )
+        use_cache = kwargs.pop('use_cache', True) and self.cache is not None
+        cacheable = use_cache and method.upper() == 'GET' and not kwargs.get('stream')
+        if cacheable:
+            cached = self.cache.get(url, params, template)
+            if cached is not None:
+                return cached
 
-            # Handle different error status codes
-            if response.status_code == 401:
-                raise NexusAuthenticationError(
-                    "Authentication failed",
-                    status_code=401,
-                    response=response
-                )
-            elif response.status_code == 403:
-                raise NexusForbiddenError(
-                    "Access forbidden - insufficient permissions",
-                    status_code=403,
-                    response=response
-                )
-            elif response.status_code == 404:
-                raise NexusNotFoundError(
-                    "Resource not found",
-                    status_code=404,
-                    response=response
+        while True:
+            if attempt:
+                self._rewind_body(data, kwargs.get('files'))
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint_class)
+
+            trace = None
+            if self._pre_request_hooks or self._post_request_hooks:
+                trace = RequestTrace(method, url, template, params, attempt)
+                run_hooks(self._pre_request_hooks, trace)
+
+            self.metrics.request_started(method, template)
+            reset_connection_timings()
+            started = time.monotonic()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=request_headers,
+                    verify=self.verify_ssl,
+                    timeout=self.timeout,
+                    **kwargs
                 )
-            elif response.status_code == 400:
-                raise NexusBadRequestError(
-                    f"Bad request: {response.text}",
-                    status_code=400,
-                    response=response
+
+            except BaseException as e:
+                elapsed = time.monotonic() - started
+                self.metrics.request_finished(method, template, None, elapsed)
+                if trace is not None:
+                    trace.error = str(e) or type(e).__name__
+                    self._finish_trace(trace, None, elapsed, False, 0, 0)
+                self._release_limit(endpoint_class)
+                if not isinstance(e, requests.exceptions.RequestException):
+                    raise
+
+                logger.debug("%s %s failed after %.3fs: %s", method, url, elapsed, e)
+                transient = isinstance(
+                    e,
+                    (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
                 )
-            elif response.status_code >= 400:
-                raise NexusException(
-                    f"Request failed with status {response.status_code}: {response.text}",
-                    status_code=response.status_code,
-                    response=response
+                if transient and self.retry.should_retry_error(method, attempt):
+                    self._wait_before_retry(method, url, template, attempt, str(e))
+                    attempt += 1
+                    continue
+                raise NexusException(f"Request failed: {str(e)}", retries=attempt) from e
+
+            elapsed = time.monotonic() - started
+            bytes_sent = int(response.request.headers.get('Content-Length') or 0)
+            bytes_received = self._response_size(response, kwargs.get('stream'))
+            self.metrics.request_finished(
+                method,
+                template,
+                response.status_code,
+                elapsed,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received
+            )
+            if trace is not None:
+                self._finish_trace(
+                    trace,
+                    response,
+                    elapsed,
+                    bool(kwargs.get('stream')),
+                    bytes_sent,
+                    bytes_received
                 )
+            logger.debug("%s %s -> %d in %.3fs", method, url, response.status_code, elapsed)
+
+            if self.cache is not None:
+                if method.upper() != 'GET':
+                    # Any write may have changed the resource, even if it failed
+                    self.cache.invalidate(url)
+                elif cacheable:
+                    self.cache.store(url, params, template, response)
+
+            # Handle different error status codes
+            if response.status_code >= 400:
+                self._release_limit(endpoint_class)
+                if self.retry.should_retry_status(method, response.status_code, attempt):
+                    response.close()
+                    self._wait_before_retry(
+                        method,
+                        url,
+                        template,
+                        attempt,
+                        f"status {response.status_code}",
+                        response.headers
+                    )
+                    attempt += 1
+                    continue
+
+                error = error_for_status(response.status_code, response.text, response)
+                error.retries = attempt
+                raise error
+
+            if kwargs.get('stream'):
+                # Streamed bodies keep their in-flight slot until closed
+                self._release_limit_on_close(response, endpoint_class)
+            else:
+                self._release_limit(endpoint_class)
 
+            # Number of retries this request needed
+            response.retries = attempt
             return response
 
-        except requests.exceptions.RequestException as e:
-            raise NexusException(f"Request failed: {str(e)}") from e
+    def _finish_trace(
+        self,
+        trace: RequestTrace,
+        response: Optional[requests.Response],
+        elapsed: float,
+        stream: bool,
+        bytes_sent: int,
+        bytes_received: int
+    ) -> None:
+        """Fill in the timing breakdown of an attempt and run post-request hooks."""
+        timings = connection_timings()
+        trace.connect = timings['connect']
+        trace.tls = timings['tls']
+        trace.total = elapsed
+        trace.bytes_sent = bytes_sent
+        trace.bytes_received = bytes_received
+
+        if response is not None:
+            # requests measures from sending the request to parsed headers
+            headers_time = response.elapsed.total_seconds()
+            trace.status_code = response.status_code
+            trace.first_byte = max(headers_time - trace.connect - trace.tls, 0.0)
+            trace.body = None if stream else max(elapsed - headers_time, 0.0)
+
+        run_hooks(self._post_request_hooks, trace)
+
+    def _release_limit(self, endpoint_class: str) -> None:
+        """Give back the rate limiter slot taken for a request."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.release(endpoint_class)
+
+    def _release_limit_on_close(self, response: requests.Response, endpoint_class: str) -> None:
+        """Hold the rate limiter slot until a streamed response is closed."""
+        if self.rate_limiter is None:
+            return
+
+        close = response.close
+        # list.pop() is atomic, so the slot is released exactly once
+        slot = [endpoint_class]
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                try:
+                    self._release_limit(slot.pop())
+                except IndexError:
+                    pass
+
+        response.close = close_and_release
+
+    def _wait_before_retry(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        attempt: int,
+        reason: str,
+        headers: Optional[Dict] = None
+    ) -> None:
+        """Record a retry and sleep for the policy's backoff delay."""
+        delay = self.retry.delay(attempt, headers)
+        with self._retries_lock:
+            self.total_retries += 1
+        self.metrics.record_retry(method, template)
+
+        logger.warning(
+            "%s %s failed (%s), retry %d/%d in %.2fs",
+            method, url, reason, attempt + 1, self.retry.max_retries, delay
+        )
+        time.sleep(delay)
+
+    @staticmethod
+    def _response_size(response: requests.Response, stream: bool) -> int:
+        """Body size of a response, from Content-Length if it is streamed."""
+        if not stream:
+            return len(response.content)
+        try:
+            return int(response.headers.get('Content-Length') or 0)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _rewind_body(data: Any, files: Optional[Dict]) -> None:
+        """Seek file-like request bodies back to the start before a retry."""
+        bodies = [data]
+        if files:
+            for value in files.values():
+                # requests accepts a file or a (filename, file, ...) tuple
+                bodies.append(value[1] if isinstance(value, tuple) else value)
+
+        for body in bodies:
+            if hasattr(body, 'seek'):
+                body.seek(0)
 
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """Make a GET request."""
@@ -175,6 +485,59 @@ class NexusClient:
         """Make a DELETE request."""
         return self._request('DELETE', endpoint, **kwargs)
 
+    def get_json(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """
+        Make a GET request and decode its JSON body.
+
+        With coalescing enabled, concurrent calls for the same URL and
+        params share a single request and the same decoded object.
+
+        Args:
+            endpoint: API endpoint (relative to api_base)
+            params: Query parameters
+
+        Returns:
+            Decoded JSON body
+        """
+        def fetch():
+            return self.get(endpoint, params=params).json()
+
+        if self.singleflight is None:
+            return fetch()
+
+        url = urljoin(self.api_base, endpoint.lstrip('/'))
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        data, _ = self.singleflight.do(('GET', url, items), fetch)
+        return data
+
+    def poll(self, endpoint: str, params: Optional[Dict] = None) -> PollResult:
+        """
+        Make a conditional GET, reusing the last result if nothing changed.
+
+        Sends the ETag/Last-Modified validators of the previous poll of the
+        same URL. On a 304 the remembered decoded object is returned without
+        downloading or decoding a body.
+
+        Args:
+            endpoint: API endpoint (relative to api_base)
+            params: Query parameters
+
+        Returns:
+            PollResult with the decoded data and a changed flag
+        """
+        url = urljoin(self.api_base, endpoint.lstrip('/'))
+        known, previous, headers = self.validators.lookup(url, params)
+
+        response = self.get(endpoint, params=params, headers=headers, use_cache=False)
+
+        if response.status_code == 304 and known:
+            return PollResult(previous, changed=False, not_modified=True, response=response)
+
+        data = response.json() if response.content else None
+        self.validators.update(url, params, response.headers, data)
+        changed = not known or data != previous
+        return PollResult(data, changed=changed, not_modified=False, response=response)
+
     def get_status(self) -> Dict[str, Any]:
         """Get the status of the Nexus server."""
         response = self.get('/v1/status')
@@ -187,8 +550,11 @@ class NexusClient:
         return not data.get('frozen', True)
 
     def close(self):
-        """Close the session and cleanup resources."""
-        self.session.close()
+        """Close all sessions and cleanup resources."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
 
     def __enter__(self):
         """Context manager entry."""
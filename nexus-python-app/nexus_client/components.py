@@ -1,6 +1,25 @@
 """Components management API."""
 
-from typing import List, Dict, Any, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence, Tuple, Union
+
+from .checkpoint import CheckpointStore
+from .checksums import sha256_file
+from .dedup import ChecksumIndex
+from .maven import MavenAsset, MavenComponent
+from .multipart import MultipartEncoder, ProgressCallback
+from .pagination import iter_items
+from .search import SearchAPI
+from .uploads import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_BATCH_BYTES,
+    RawDirectoryUploader,
+    UploadReport,
+    UploadResult
+)
 
 
 class ComponentAPI:
@@ -8,6 +27,8 @@ class ComponentAPI:
 
     def __init__(self, client):
         self.client = client
+        # Cached checksum lookups used by skip_existing uploads
+        self.checksum_index = ChecksumIndex(SearchAPI(client))
 
     def list(
         self,
@@ -28,8 +49,37 @@ class ComponentAPI:
         if continuation_token:
             params['continuationToken'] = continuation_token
 
-        response = self.client.get('/v1/components', params=params)
-        return response.json()
+        return self.client.get_json('/v1/components', params=params)
+
+    def iter_components(
+        self,
+        repository: str,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all components in a repository, following pagination.
+
+        Pages are fetched lazily, so memory use stays flat regardless of
+        repository size.
+
+        Args:
+            repository: Repository name
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+
+        Yields:
+            Component dicts
+        """
+        return iter_items(
+            lambda token: self.list(repository, continuation_token=token),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            f'components:{repository}'
+        )
 
     def get(self, component_id: str) -> Dict[str, Any]:
         """
@@ -41,8 +91,7 @@ class ComponentAPI:
         Returns:
             Component details
         """
-        response = self.client.get(f'/v1/components/{component_id}')
-        return response.json()
+        return self.client.get_json(f'/v1/components/{component_id}')
 
     def delete(self, component_id: str) -> None:
         """
@@ -51,7 +100,56 @@ class ComponentAPI:
         Args:
             component_id: Component ID to delete
         """
-        self.client.delete(f'/v1/components/{component_id}')
+        try:
+            self.client.delete(f'/v1/components/{component_id}')
+        finally:
+            # The ID does not tell which repository lost the content
+            self.checksum_index.clear()
+
+    def _post_multipart(
+        self,
+        repository: str,
+        fields: List,
+        progress: Optional[ProgressCallback] = None
+    ) -> None:
+        """
+        Upload a component as a streamed multipart body.
+
+        Args:
+            repository: Repository name
+            fields: (name, value) pairs for MultipartEncoder
+            progress: Callback receiving (bytes sent, total bytes)
+        """
+        encoder = MultipartEncoder(fields, progress=progress)
+        try:
+            self.client.post(
+                '/v1/components',
+                params={'repository': repository},
+                data=encoder,
+                headers={'Content-Type': encoder.content_type}
+            )
+        finally:
+            encoder.close()
+
+    def _find_existing(
+        self,
+        repository: str,
+        file_path: str,
+        path: Optional[str]
+    ) -> Tuple[bool, str]:
+        """
+        Hash a local file and check whether Nexus already stores it.
+
+        Args:
+            repository: Repository name
+            file_path: Local file path
+            path: Target repository path (None for any path)
+
+        Returns:
+            (exists, sha256) tuple
+        """
+        sha256 = sha256_file(file_path)
+        return self.checksum_index.exists(repository, sha256, path), sha256
 
     def upload_maven(
         self,
@@ -61,11 +159,17 @@ class ComponentAPI:
         version: str,
         file_path: str,
         packaging: str = "jar",
-        generate_pom: bool = False
-    ) -> None:
+        generate_pom: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        skip_existing: bool = False
+    ) -> bool:
         """
         Upload a Maven component.
 
+        The file is streamed from disk, so memory use does not depend on
+        its size. Use upload_maven_component() to send a POM, sources,
+        javadoc or signatures along with it.
+
         Args:
             repository: Repository name
             group_id: Maven groupId
@@ -74,56 +178,183 @@ class ComponentAPI:
             file_path: Path to file to upload
             packaging: Packaging type (jar, war, pom, etc.)
             generate_pom: Auto-generate POM file
+            progress: Callback receiving (bytes sent, total bytes)
+            skip_existing: Don't upload if the same content (by SHA-256) is
+                already stored at the artifact's path
+
+        Returns:
+            True if the file was uploaded, False if it was skipped
         """
-        with open(file_path, 'rb') as f:
-            files = {
-                'maven2.asset1': f,
-            }
-            data = {
-                'maven2.groupId': group_id,
-                'maven2.artifactId': artifact_id,
-                'maven2.version': version,
-                'maven2.asset1.extension': packaging,
-                'maven2.generate-pom': str(generate_pom).lower()
-            }
+        component = MavenComponent(
+            group_id,
+            artifact_id,
+            version,
+            [MavenAsset(file_path, packaging)],
+            generate_pom=generate_pom
+        )
+        return bool(self.upload_maven_component(repository, component, progress, skip_existing))
 
-            self.client.post(
-                f'/v1/components',
-                params={'repository': repository},
-                files=files,
-                data=data
-            )
+    def upload_maven_component(
+        self,
+        repository: str,
+        component: MavenComponent,
+        progress: Optional[ProgressCallback] = None,
+        skip_existing: bool = False
+    ) -> List[MavenAsset]:
+        """
+        Upload all files of a Maven component in a single request.
+
+        The primary artifact and any classifier or extension assets (pom,
+        sources, javadoc, signatures, checksums) are sent as
+        maven2.asset1..maven2.assetN of one multipart body.
+
+        Args:
+            repository: Repository name
+            component: GAV and its assets
+            progress: Callback receiving (bytes sent, total bytes)
+            skip_existing: Leave out assets whose content (by SHA-256) is
+                already stored at their path
+
+        Returns:
+            Assets that were uploaded (empty if all were skipped)
+        """
+        assets = list(component.assets)
+        digests = {}
+        if skip_existing:
+            remaining = []
+            for asset in assets:
+                exists, digests[id(asset)] = self._find_existing(
+                    repository, asset.file_path, component.path_of(asset)
+                )
+                if not exists:
+                    remaining.append(asset)
+            assets = remaining
+            if not assets:
+                return []
+
+        fields = [
+            ('maven2.groupId', component.group_id),
+            ('maven2.artifactId', component.artifact_id),
+            ('maven2.version', component.version),
+            ('maven2.generate-pom', str(component.generate_pom).lower()),
+        ]
+        if component.packaging:
+            fields.append(('maven2.packaging', component.packaging))
+        for index, asset in enumerate(assets, start=1):
+            fields.append((f'maven2.asset{index}', (os.path.basename(asset.file_path), asset.file_path)))
+            fields.append((f'maven2.asset{index}.extension', asset.extension))
+            if asset.classifier:
+                fields.append((f'maven2.asset{index}.classifier', asset.classifier))
+        self._post_multipart(repository, fields, progress)
+
+        if skip_existing:
+            for asset in assets:
+                self.checksum_index.record(repository, digests[id(asset)], component.path_of(asset))
+        return assets
+
+    def upload_maven_batch(
+        self,
+        repository: str,
+        components: List[MavenComponent],
+        workers: int = 8,
+        skip_existing: bool = False,
+        progress: Optional[Callable[[UploadResult], None]] = None
+    ) -> UploadReport:
+        """
+        Upload many Maven components concurrently, one request per GAV.
+
+        Args:
+            repository: Repository name
+            components: Components to publish
+            workers: Number of concurrent upload requests
+            skip_existing: Leave out assets already stored with the same
+                content
+            progress: Callback receiving each UploadResult as it completes
+
+        Returns:
+            UploadReport with one result per asset; a failed request fails
+            all assets of its GAV
+        """
+        started = time.monotonic()
+        results: List[UploadResult] = []
+        requests_sent = [0]
+        lock = threading.Lock()
+
+        def publish(component: MavenComponent) -> None:
+            error = None
+            uploaded = component.assets
+            try:
+                uploaded = self.upload_maven_component(repository, component, skip_existing=skip_existing)
+            except Exception as e:
+                error = f'{component.gav}: {str(e) or type(e).__name__}'
+
+            sent = set(map(id, uploaded))
+            component_results = [
+                UploadResult(
+                    asset.file_path,
+                    component.path_of(asset),
+                    os.path.getsize(asset.file_path),
+                    error=error,
+                    skipped=id(asset) not in sent
+                )
+                for asset in component.assets
+            ]
+            with lock:
+                results.extend(component_results)
+                if sent:
+                    requests_sent[0] += 1
+            if progress is not None:
+                for result in component_results:
+                    progress(result)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='nexus-upload') as pool:
+            # Exceptions are caught per component, so list() only drains the pool
+            list(pool.map(publish, components))
+
+        results.sort(key=lambda r: r.remote_path)
+        return UploadReport(results, time.monotonic() - started, requests_sent[0])
 
     def upload_npm(
         self,
         repository: str,
-        package_path: str
-    ) -> None:
+        package_path: str,
+        progress: Optional[ProgressCallback] = None,
+        skip_existing: bool = False
+    ) -> bool:
         """
         Upload an NPM package.
 
         Args:
             repository: Repository name
             package_path: Path to .tgz package file
+            progress: Callback receiving (bytes sent, total bytes)
+            skip_existing: Don't upload if the same tarball (by SHA-256) is
+                already stored anywhere in the repository
+
+        Returns:
+            True if the package was uploaded, False if it was skipped
         """
-        with open(package_path, 'rb') as f:
-            files = {
-                'npm.asset': f,
-            }
+        if skip_existing:
+            # The target path depends on the package.json inside the tarball
+            exists, _ = self._find_existing(repository, package_path, None)
+            if exists:
+                return False
 
-            self.client.post(
-                f'/v1/components',
-                params={'repository': repository},
-                files=files
-            )
+        fields = [
+            ('npm.asset', (os.path.basename(package_path), package_path)),
+        ]
+        self._post_multipart(repository, fields, progress)
+        return True
 
     def upload_raw(
         self,
         repository: str,
         directory: str,
         filename: str,
-        file_path: str
-    ) -> None:
+        file_path: str,
+        progress: Optional[ProgressCallback] = None,
+        skip_existing: bool = False
+    ) -> bool:
         """
         Upload a raw component.
 
@@ -132,19 +363,84 @@ class ComponentAPI:
             directory: Directory path in repository
             filename: Filename in repository
             file_path: Local file path
+            progress: Callback receiving (bytes sent, total bytes)
+            skip_existing: Don't upload if the same content (by SHA-256) is
+                already stored at directory/filename
+
+        Returns:
+            True if the file was uploaded, False if it was skipped
         """
-        with open(file_path, 'rb') as f:
-            files = {
-                'raw.asset1': f,
-            }
-            data = {
-                'raw.directory': directory,
-                'raw.asset1.filename': filename,
-            }
+        path = f'{directory.strip("/")}/{filename}'
+        if skip_existing:
+            exists, sha256 = self._find_existing(repository, file_path, path)
+            if exists:
+                return False
 
-            self.client.post(
-                f'/v1/components',
-                params={'repository': repository},
-                files=files,
-                data=data
-            )
+        self.upload_raw_batch(repository, directory, [(filename, file_path)], progress)
+
+        if skip_existing:
+            self.checksum_index.record(repository, sha256, path)
+        return True
+
+    def upload_raw_batch(
+        self,
+        repository: str,
+        directory: str,
+        assets: List[Tuple[str, str]],
+        progress: Optional[ProgressCallback] = None
+    ) -> None:
+        """
+        Upload several raw files to one directory in a single request.
+
+        Args:
+            repository: Repository name
+            directory: Directory path in repository
+            assets: (filename in repository, local file path) pairs
+            progress: Callback receiving (bytes sent, total bytes)
+        """
+        fields = [('raw.directory', directory)]
+        for index, (filename, file_path) in enumerate(assets, start=1):
+            fields.append((f'raw.asset{index}', (filename, file_path)))
+            fields.append((f'raw.asset{index}.filename', filename))
+        self._post_multipart(repository, fields, progress)
+
+    def upload_raw_directory(
+        self,
+        repository: str,
+        local_dir: str,
+        directory: str = '',
+        include: Optional[Union[str, Sequence[str]]] = None,
+        workers: int = 8,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        progress: Optional[Callable[[UploadResult], None]] = None,
+        skip_existing: bool = False
+    ) -> UploadReport:
+        """
+        Upload a local directory tree to a raw repository concurrently.
+
+        See RawDirectoryUploader.
+
+        Args:
+            repository: Repository name
+            local_dir: Local directory to upload
+            directory: Repository directory the tree is placed under
+            include: Glob pattern(s) selecting files by relative path
+            workers: Number of concurrent upload requests
+            batch_size: Maximum files per request
+            max_batch_bytes: Maximum file bytes per request
+            progress: Callback receiving each UploadResult as it completes
+            skip_existing: Skip files whose content (by SHA-256) is already
+                stored at their target path
+
+        Returns:
+            UploadReport with one result per file
+        """
+        uploader = RawDirectoryUploader(
+            self,
+            workers=workers,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            skip_existing=skip_existing
+        )
+        return uploader.upload(repository, local_dir, directory, include, progress)
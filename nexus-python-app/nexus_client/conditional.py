@@ -0,0 +1,131 @@
+"""Conditional GET support (ETag / Last-Modified) for repeated polling."""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class PollResult:
+    """
+    Outcome of a conditional poll.
+
+    Attributes:
+        data: Decoded JSON body (the remembered object on a 304)
+        changed: False if the data is the same as the previous poll
+        not_modified: True if Nexus answered 304 and nothing was downloaded
+        response: Underlying response
+    """
+
+    def __init__(self, data: Any, changed: bool, not_modified: bool, response):
+        self.data = data
+        self.changed = changed
+        self.not_modified = not_modified
+        self.response = response
+
+    def __repr__(self) -> str:
+        return f"PollResult(changed={self.changed}, not_modified={self.not_modified})"
+
+
+class _Validators:
+    """Validators and decoded body remembered for one URL."""
+
+    __slots__ = ('etag', 'last_modified', 'data')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], data: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.data = data
+
+
+class ValidatorStore:
+    """
+    Thread-safe memory of ETag/Last-Modified validators per URL.
+
+    Holds the last decoded body of each polled URL so that a 304 answer
+    can be served without downloading or decoding anything.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, _Validators] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (url, items)
+
+    @staticmethod
+    def _headers(entry: Optional[_Validators]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def request_headers(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build conditional request headers for a URL.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Dict with If-None-Match and/or If-Modified-Since (empty if unknown)
+        """
+        return self.lookup(url, params)[2]
+
+    def remembered(self, url: str, params: Optional[Dict[str, Any]]) -> Tuple[bool, Any]:
+        """
+        Get the last decoded body of a URL.
+
+        Returns:
+            (known, data) tuple; known is False if the URL was never polled
+        """
+        known, data, _ = self.lookup(url, params)
+        return known, data
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]]) -> Tuple[bool, Any, Dict[str, str]]:
+        """
+        Get the last decoded body of a URL and the headers that validate it.
+
+        Both come from the same entry, so a 304 to these headers always
+        means the returned body is current.
+
+        Returns:
+            (known, data, headers) tuple; see remembered() and request_headers()
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(url, params))
+        return (entry is not None, entry.data if entry is not None else None, self._headers(entry))
+
+    def update(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers,
+        data: Any
+    ) -> None:
+        """
+        Remember the validators and decoded body of a 200 response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Response headers
+            data: Decoded body
+        """
+        entry = _Validators(headers.get('ETag'), headers.get('Last-Modified'), data)
+        with self._lock:
+            self._entries[self._key(url, params)] = entry
+
+    def forget(self, url: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Drop what is remembered for a URL."""
+        with self._lock:
+            self._entries.pop(self._key(url, params), None)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self._entries.clear()
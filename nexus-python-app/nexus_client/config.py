@@ -4,6 +4,8 @@ import os
 from typing import Optional
 from dotenv import load_dotenv
 
+from .retry import RetryPolicy
+
 
 class Config:
     """Configuration loader for Nexus client."""
@@ -25,7 +27,9 @@ class Config:
         self.nexus_password = os.getenv('NEXUS_PASSWORD')
         self.verify_ssl = os.getenv('NEXUS_VERIFY_SSL', 'true').lower() == 'true'
         self.timeout = int(os.getenv('NEXUS_TIMEOUT', '30'))
+        self.max_retries = int(os.getenv('NEXUS_MAX_RETRIES', '3'))
         self.database_path = os.getenv('DATABASE_PATH', 'nexus_data.db')
+        self.checkpoint_path = os.getenv('CHECKPOINT_PATH', 'nexus_crawl.checkpoint.json')
 
     def get_client_kwargs(self) -> dict:
         """
@@ -39,5 +43,6 @@ class Config:
             'username': self.nexus_username,
             'password': self.nexus_password,
             'verify_ssl': self.verify_ssl,
-            'timeout': self.timeout
+            'timeout': self.timeout,
+            'retry': RetryPolicy(max_retries=self.max_retries)
         }
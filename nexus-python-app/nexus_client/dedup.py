@@ -0,0 +1,164 @@
+"""Checksum-based upload deduplication."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .singleflight import SingleFlight
+
+
+# Seconds a lookup result is trusted before asking Nexus again
+DEFAULT_LOOKUP_TTL = 300.0
+
+
+def normalize_path(path: str) -> str:
+    """Repository path without leading or trailing slashes."""
+    return path.strip('/')
+
+
+class ChecksumIndex:
+    """
+    Cached answers to "which paths of this repository hold this SHA-256?".
+
+    Lookups go through ``SearchAPI.search_assets(sha256=..., repository=...)``.
+    Results are cached per (repository, sha256) for ``ttl`` seconds,
+    identical concurrent lookups share one search, and prefetch() resolves
+    many checksums at once on a thread pool. Uploads made through the same
+    index are recorded so they count as present without another search.
+    Deletes made through the client's ComponentAPI, AssetAPI and
+    RepositoryAPI drop the affected lookups.
+
+    Example:
+        >>> index = ChecksumIndex(client.search)
+        >>> index.prefetch("raw-releases", digests)
+        >>> index.exists("raw-releases", digest, "app/1.2.0/app.tar.gz")
+    """
+
+    def __init__(self, search_api, ttl: float = DEFAULT_LOOKUP_TTL, workers: int = 8):
+        """
+        Initialize the index.
+
+        Args:
+            search_api: SearchAPI used for lookups
+            ttl: Seconds a lookup result stays valid (None to keep forever)
+            workers: Concurrent lookups made by prefetch()
+        """
+        self.search = search_api
+        self.ttl = ttl
+        self.workers = workers
+        self.lookups = 0
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        # (repository, sha256) -> (expiry, paths)
+        self._entries: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[FrozenSet[str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def _expiry(self) -> float:
+        return time.monotonic() + self.ttl if self.ttl is not None else float('inf')
+
+    def _lookup(self, repository: str, sha256: str) -> FrozenSet[str]:
+        """Search Nexus for the paths holding a checksum and cache them."""
+        paths = frozenset(
+            normalize_path(asset['path'])
+            for asset in self.search.iter_search_assets(repository=repository, sha256=sha256)
+            if asset.get('path')
+        )
+        with self._lock:
+            self.lookups += 1
+            self._entries[(repository, sha256)] = (self._expiry(), paths)
+        return paths
+
+    def paths(self, repository: str, sha256: str) -> FrozenSet[str]:
+        """
+        Get the paths of ``repository`` whose content has this SHA-256.
+
+        Args:
+            repository: Repository name
+            sha256: Hex digest
+
+        Returns:
+            Normalized repository paths (empty if the content is absent)
+        """
+        sha256 = sha256.lower()
+        key = (repository, sha256)
+        paths = self._cached(key)
+        if paths is None:
+            paths, _ = self._flight.do(key, lambda: self._lookup(repository, sha256))
+        return paths
+
+    def exists(self, repository: str, sha256: str, path: Optional[str] = None) -> bool:
+        """
+        Check whether content is already stored.
+
+        Args:
+            repository: Repository name
+            sha256: Hex digest of the content
+            path: Target path; None accepts the content at any path
+
+        Returns:
+            True if the content is present (at ``path`` if given)
+        """
+        paths = self.paths(repository, sha256)
+        if path is None:
+            return bool(paths)
+        return normalize_path(path) in paths
+
+    def prefetch(self, repository: str, checksums: Iterable[str]) -> None:
+        """
+        Resolve many checksums concurrently so later checks hit the cache.
+
+        Args:
+            repository: Repository name
+            checksums: SHA-256 hex digests; duplicates are looked up once
+        """
+        pending = {
+            sha256.lower() for sha256 in checksums
+            if self._cached((repository, sha256.lower())) is None
+        }
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='nexus-dedup') as pool:
+            list(pool.map(lambda sha256: self.paths(repository, sha256), pending))
+
+    def record(self, repository: str, sha256: str, path: str) -> None:
+        """
+        Remember that content was just uploaded to ``path``.
+
+        Args:
+            repository: Repository name
+            sha256: Hex digest of the uploaded content
+            path: Repository path it was uploaded to
+        """
+        key = (repository, sha256.lower())
+        with self._lock:
+            entry = self._entries.get(key)
+            # Without a fresh lookup, only the recorded path is known
+            paths = entry[1] if entry is not None and entry[0] > time.monotonic() else frozenset()
+            self._entries[key] = (self._expiry(), paths | {normalize_path(path)})
+
+    def forget(self, repository: str) -> None:
+        """
+        Forget the cached lookups of one repository.
+
+        Args:
+            repository: Repository name
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == repository]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forget every cached lookup."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,637 @@
+"""Concurrent asset downloads."""
+
+import json
+import logging
+import os
+import re
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import requests
+
+from .checksums import ChecksumVerifier
+from .exceptions import NexusChecksumMismatchError, NexusException
+
+
+logger = logging.getLogger(__name__)
+
+# Size of the reads from download response bodies. Per-chunk Python
+# overhead dominates below about 1 MB; see examples/benchmark_downloads.py
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Minimum asset size for a segmented download
+SEGMENT_THRESHOLD = 64 * 1024 * 1024
+
+# Smallest byte range worth its own connection
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# Suffix of the file a download is written to until it completes
+PART_SUFFIX = '.part'
+
+# Suffix of the sidecar file recording what a .part file belongs to
+_STATE_SUFFIX = '.json'
+
+_CONTENT_RANGE = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
+
+# Errors raised while reading a response body that are worth resuming after
+_BODY_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+def _validator(headers) -> Optional[str]:
+    """Strong validator usable in If-Range: a strong ETag or Last-Modified."""
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+def write_body(
+    response: requests.Response,
+    f: BinaryIO,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    verifier: Optional[ChecksumVerifier] = None
+) -> Iterator[int]:
+    """
+    Write a streamed response body to a file, yielding the size of each write.
+
+    Each chunk is written and fed to the verifier as it arrives. Chunks
+    of several MB keep the per-chunk overhead of iter_content() small
+    next to the cost of hashing and writing the data.
+
+    Args:
+        response: Response of a request made with ``stream=True``
+        f: File opened for binary writing, positioned where the body goes
+        chunk_size: Size of the reads from the body
+        verifier: Checksums fed with the same bytes that are written
+
+    Yields:
+        Number of bytes written by each write
+    """
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        f.write(chunk)
+        if verifier is not None:
+            verifier.update(chunk)
+        yield len(chunk)
+
+
+def _read_state(part_path: str, url: str) -> Tuple[int, Optional[str]]:
+    """
+    Get the resume offset and validator of an existing .part file.
+
+    Returns:
+        (offset, validator); (0, None) if there is nothing to resume
+    """
+    try:
+        with open(part_path + _STATE_SUFFIX, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        offset = os.path.getsize(part_path)
+    except (OSError, ValueError):
+        return 0, None
+    if state.get('url') != url or not state.get('validator') or state.get('preallocated'):
+        # A preallocated file left by a crash: its size says nothing about
+        # how much of it was written
+        return 0, None
+    return offset, state['validator']
+
+
+def _write_state(part_path: str, url: str, validator: Optional[str], preallocated: bool = False) -> None:
+    """Record the URL and validator the .part file is being filled from."""
+    with open(part_path + _STATE_SUFFIX, 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'validator': validator, 'preallocated': preallocated}, f)
+
+
+def _remove(path: str) -> None:
+    """Delete a file if it exists."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def download_file(
+    client,
+    url: str,
+    output_path: str,
+    resume: bool = True,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    verifier: Optional[ChecksumVerifier] = None,
+    size: Optional[int] = None
+) -> int:
+    """
+    Download a URL to a file through ``output_path + '.part'``.
+
+    The body is written to a .part file that is atomically renamed to
+    ``output_path`` once complete, so ``output_path`` never holds a
+    truncated file. With ``resume``, a .part file left by an earlier
+    interrupted call is continued with a Range request, and a connection
+    lost mid-body is resumed the same way, up to the client's
+    ``retry.max_retries`` times. Resuming is only attempted when the server
+    gave a strong ETag or a Last-Modified date; it is sent as If-Range, so
+    an asset that changed in the meantime is downloaded again in full.
+
+    With a ``verifier``, the content is hashed in the same loop that
+    writes it (only the existing part of a resumed .part file is read back)
+    and checked before the rename; on a mismatch the file is deleted.
+
+    With the expected ``size``, a download starting from the first byte
+    preallocates the .part file (see preallocate()), so the file system
+    can lay it out contiguously and a full disk fails before any transfer.
+    The unwritten tail is cut off whenever writing stops.
+
+    Args:
+        client: NexusClient used for the requests
+        url: Download URL
+        output_path: Destination file
+        resume: Reuse partial downloads instead of starting over
+        chunk_size: Size of the reads from the response body
+        verifier: Expected checksums to verify the content against
+        size: Expected size in bytes, to preallocate the file
+
+    Returns:
+        Size of the downloaded file
+
+    Raises:
+        NexusChecksumMismatchError: If the content does not match the checksums
+        NexusException: If the download fails or cannot be resumed any more
+    """
+    part_path = output_path + PART_SUFFIX
+    attempt = 0
+    # Number of bytes of the .part file fed to the verifier
+    hashed = 0
+
+    while True:
+        offset, validator = _read_state(part_path, url) if resume else (0, None)
+        headers = {}
+        if offset and validator:
+            headers = {'Range': f'bytes={offset}-', 'If-Range': validator}
+
+        try:
+            response = client.get(url, stream=True, headers=headers)
+        except NexusException as e:
+            if e.status_code != 416 or not headers:
+                raise
+            # The .part file does not fit the asset any more: start over
+            _remove(part_path)
+            _remove(part_path + _STATE_SUFFIX)
+            continue
+
+        with response:
+            match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+            if response.status_code == 206 and match and int(match.group(1)) == offset:
+                mode = 'ab'
+            else:
+                # Full body: the validator did not match or ranges are unsupported
+                offset, mode = 0, 'wb'
+
+            if verifier is not None and hashed != offset:
+                # Restarted from scratch, or resuming a file left by another call
+                verifier.reset()
+                if offset:
+                    verifier.update_from_file(part_path)
+                hashed = offset
+
+            validator = _validator(response.headers)
+            preallocated = mode == 'wb' and bool(size)
+            if resume:
+                _write_state(part_path, url, validator, preallocated)
+
+            try:
+                with open(part_path, mode) as f:
+                    if preallocated:
+                        preallocate(f, size)
+                    try:
+                        for n in write_body(response, f, chunk_size, verifier):
+                            offset += n
+                            if verifier is not None:
+                                hashed = offset
+                    finally:
+                        if preallocated:
+                            f.truncate(offset)
+                            if resume:
+                                _write_state(part_path, url, validator)
+            except _BODY_ERRORS as e:
+                if not resume or not validator or attempt >= client.retry.max_retries:
+                    raise NexusException(f"Download of {url} failed: {e}", retries=attempt) from e
+
+                delay = client.retry.delay(attempt)
+                logger.warning(
+                    "Download of %s interrupted at %d bytes (%s), resuming in %.2fs",
+                    url, offset, e, delay
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+        _verify_part(verifier, part_path, output_path)
+        os.replace(part_path, output_path)
+        _remove(part_path + _STATE_SUFFIX)
+        return offset
+
+
+def _verify_part(verifier: Optional[ChecksumVerifier], part_path: str, output_path: str) -> None:
+    """Check a completed .part file, deleting it if it is corrupt."""
+    if verifier is None:
+        return
+    try:
+        verifier.verify(output_path)
+    except NexusChecksumMismatchError:
+        _remove(part_path)
+        _remove(part_path + _STATE_SUFFIX)
+        raise
+
+
+class DownloadResult:
+    """
+    Outcome of one item of a bulk download.
+
+    Attributes:
+        asset: Item as given (asset ID, asset dict, URL or path)
+        url: Download URL, if it could be resolved
+        path: Repository path of the asset
+        output_path: Local file the asset was written to
+        size: Bytes written
+        elapsed: Seconds spent on the item
+        error: Error message, or None if the download succeeded
+    """
+
+    def __init__(
+        self,
+        asset: Any,
+        url: Optional[str] = None,
+        path: Optional[str] = None,
+        output_path: Optional[str] = None,
+        size: int = 0,
+        elapsed: float = 0.0,
+        error: Optional[str] = None
+    ):
+        self.asset = asset
+        self.url = url
+        self.path = path
+        self.output_path = output_path
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the asset was downloaded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f'failed: {self.error}'
+        return f"DownloadResult({self.path or self.asset!r}, {status})"
+
+
+class DownloadReport:
+    """
+    Totals of a bulk download.
+
+    Only failed items are kept; successful ones are counted, so a report
+    over millions of assets stays small. Use the ``progress`` callback of
+    DownloadManager.download() to see every result.
+
+    Attributes:
+        succeeded: Number of items downloaded
+        bytes_downloaded: Bytes written by successful downloads
+        failed: Results of the items that could not be downloaded
+        elapsed: Seconds spent on the whole run
+    """
+
+    def __init__(self):
+        self.succeeded = 0
+        self.bytes_downloaded = 0
+        self.failed: List[DownloadResult] = []
+        self.elapsed = 0.0
+
+    def add(self, result: DownloadResult) -> None:
+        """Count one finished item."""
+        if result.ok:
+            self.succeeded += 1
+            self.bytes_downloaded += result.size
+        else:
+            self.failed.append(result)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate bytes per second over the whole run."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"DownloadReport(succeeded={self.succeeded}, failed={len(self.failed)}, "
+            f"bytes={self.bytes_downloaded}, throughput={self.throughput / 1e6:.1f} MB/s)"
+        )
+
+
+class DownloadManager:
+    """
+    Download many assets concurrently with bounded concurrency.
+
+    Items can be asset IDs, asset dicts from listings or searches, download
+    URLs, or repository paths. Asset dicts are used as they are, so
+    downloading the results of a listing costs no per-asset metadata
+    request. Each asset is written under ``dest_dir`` at its repository
+    path. A failed item is reported and does not stop the others.
+
+    Items are taken from the iterable only as workers free up, and only
+    failures are kept in the report, so memory stays flat however many
+    assets a listing yields.
+
+    Size the client's ``pool_maxsize`` to at least ``workers`` so every
+    worker keeps a connection open.
+
+    Example:
+        >>> manager = DownloadManager(client.assets, workers=32)
+        >>> report = manager.download(client.assets.iter_assets("raw-releases"), "./mirror")
+        >>> print(report.throughput / 1e6, "MB/s")
+    """
+
+    def __init__(
+        self,
+        asset_api,
+        workers: int = 8,
+        segments: int = 1,
+        segment_threshold: int = SEGMENT_THRESHOLD,
+        verify: bool = True
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            asset_api: AssetAPI used to resolve and fetch assets
+            workers: Number of concurrent downloads
+            segments: Parallel connections per asset of at least
+                ``segment_threshold`` bytes
+            segment_threshold: Minimum size in bytes for a segmented download
+            verify: Check downloads against the checksums of the asset
+                metadata (items given as URLs or paths have none)
+        """
+        self.assets = asset_api
+        self.workers = workers
+        self.segments = segments
+        self.segment_threshold = segment_threshold
+        self.verify = verify
+
+    def download(
+        self,
+        assets: Iterable[Union[str, Dict[str, Any]]],
+        dest_dir: str,
+        repository: Optional[str] = None,
+        progress: Optional[Callable[[DownloadResult], None]] = None
+    ) -> DownloadReport:
+        """
+        Download items into ``dest_dir``.
+
+        Args:
+            assets: Asset IDs, asset dicts, download URLs or repository paths
+            dest_dir: Directory the assets are saved under, by repository path
+            repository: Repository name for items given as paths
+            progress: Callback receiving each DownloadResult as it completes
+
+        Returns:
+            DownloadReport of the run
+        """
+        started = time.monotonic()
+        dest_dir = os.path.abspath(dest_dir)
+        report = DownloadReport()
+
+        def fetch(asset: Union[str, Dict[str, Any]]) -> DownloadResult:
+            result = self._download_one(asset, dest_dir, repository)
+            if progress is not None:
+                progress(result)
+            return result
+
+        def collect(futures: Iterable[Future]) -> None:
+            for future in futures:
+                report.add(future.result())
+
+        # Items are pulled from ``assets`` only as workers free up, so a
+        # lazy listing is never held in memory as a whole
+        window = 2 * self.workers
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='nexus-download') as pool:
+            pending: Set[Future] = set()
+            for asset in assets:
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(pool.submit(fetch, asset))
+            collect(wait(pending).done)
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _download_one(
+        self,
+        asset: Union[str, Dict[str, Any]],
+        dest_dir: str,
+        repository: Optional[str]
+    ) -> DownloadResult:
+        """Download one item, capturing any error in the result."""
+        started = time.monotonic()
+        result = DownloadResult(asset)
+        try:
+            details = self.assets.describe(asset, repository)
+            result.url, result.path = details['downloadUrl'], details['path'].lstrip('/')
+            result.output_path = output_path_for(dest_dir, result.path)
+            os.makedirs(os.path.dirname(result.output_path), exist_ok=True)
+            result.size = self.assets.download(
+                details,
+                result.output_path,
+                segments=self.segments,
+                segment_threshold=self.segment_threshold,
+                verify=self.verify
+            )
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.elapsed = time.monotonic() - started
+        return result
+
+
+def output_path_for(dest_dir: str, path: str) -> str:
+    """
+    Local file for a repository path, refusing paths that escape dest_dir.
+
+    Args:
+        dest_dir: Absolute destination directory
+        path: Repository path of the asset
+
+    Returns:
+        Absolute local path
+    """
+    output_path = os.path.abspath(os.path.join(dest_dir, *path.strip('/').split('/')))
+    if os.path.commonpath([dest_dir, output_path]) != dest_dir or output_path == dest_dir:
+        raise ValueError(f"Asset path {path!r} is outside of {dest_dir}")
+    return output_path
+
+
+def preallocate(f, size: int) -> None:
+    """
+    Reserve ``size`` bytes for an open file.
+
+    Uses posix_fallocate where available so the blocks are allocated up
+    front (and a full disk fails early), otherwise extends the file.
+    """
+    if size <= 0:
+        return
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            # Not supported by this file system
+            pass
+    f.truncate(size)
+
+
+class _RangeNotHonored(Exception):
+    """The server answered a range request with something else than the range."""
+
+
+def _fetch_segment(
+    client,
+    url: str,
+    part_path: str,
+    start: int,
+    end: int,
+    validator: str,
+    chunk_size: int,
+    cancelled: threading.Event
+) -> None:
+    """Write bytes start..end (inclusive) of the URL at their offset in part_path."""
+    position = start
+    attempt = 0
+
+    with open(part_path, 'r+b') as f:
+        while position <= end:
+            if cancelled.is_set():
+                return
+
+            headers = {'Range': f'bytes={position}-{end}', 'If-Range': validator}
+            response = client.get(url, stream=True, headers=headers)
+            with response:
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if response.status_code != 206 or not match or int(match.group(1)) != position:
+                    raise _RangeNotHonored()
+
+                f.seek(position)
+                try:
+                    for n in write_body(response, f, chunk_size):
+                        position += n
+                        if cancelled.is_set():
+                            return
+                except _BODY_ERRORS as e:
+                    if attempt >= client.retry.max_retries:
+                        raise NexusException(
+                            f"Segment {start}-{end} of {url} failed: {e}",
+                            retries=attempt
+                        ) from e
+                    delay = client.retry.delay(attempt)
+                    logger.warning(
+                        "Segment %d-%d of %s interrupted at %d (%s), resuming in %.2fs",
+                        start, end, url, position, e, delay
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+
+            if position <= end:
+                raise NexusException(f"Segment {start}-{end} of {url} ended early at {position}")
+
+
+def download_segmented(
+    client,
+    url: str,
+    output_path: str,
+    segments: int = 4,
+    threshold: int = SEGMENT_THRESHOLD,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    verifier: Optional[ChecksumVerifier] = None
+) -> int:
+    """
+    Download a large file as byte ranges fetched over parallel connections.
+
+    A one-byte range request first checks that the server supports ranges
+    and gives the size and a validator. The .part file is then preallocated
+    and each segment is written at its offset by its own thread; every
+    segment request carries If-Range so all of them read the same version.
+    Segments resume after a lost connection like download_file() does.
+
+    Falls back to a single-stream download_file() when the file is smaller
+    than ``threshold``, ranges are not supported, there is no validator, or
+    the asset changes during the download.
+
+    Segments arrive out of order, so a ``verifier`` hashes the assembled
+    file in one sequential read before it is renamed.
+
+    Args:
+        client: NexusClient used for the requests
+        url: Download URL
+        output_path: Destination file
+        segments: Number of parallel range requests
+        threshold: Minimum size in bytes to split the download
+        chunk_size: Size of the reads from each response body
+        verifier: Expected checksums to verify the content against
+
+    Returns:
+        Size of the downloaded file
+    """
+    probe = client.get(url, stream=True, headers={'Range': 'bytes=0-0'})
+    with probe:
+        match = _CONTENT_RANGE.match(probe.headers.get('Content-Range', ''))
+        validator = _validator(probe.headers)
+        ranged = probe.status_code == 206 and match is not None and match.group(3) != '*'
+        if probe.status_code == 206:
+            # Read the single byte so the connection can be reused
+            probe.content
+
+    size = int(match.group(3)) if ranged else 0
+    if not ranged or not validator or size < max(threshold, 2):
+        return download_file(
+            client, url, output_path, chunk_size=chunk_size, verifier=verifier, size=size or None
+        )
+
+    count = max(1, min(segments, size // MIN_SEGMENT_SIZE or 1))
+    bounds = [size * i // count for i in range(count + 1)]
+    ranges = [(bounds[i], bounds[i + 1] - 1) for i in range(count)]
+
+    part_path = output_path + PART_SUFFIX
+    # A single-stream .part file cannot be reused by segments
+    _remove(part_path + _STATE_SUFFIX)
+    with open(part_path, 'wb') as f:
+        preallocate(f, size)
+
+    cancelled = threading.Event()
+
+    def fetch(byte_range: Tuple[int, int]) -> None:
+        try:
+            _fetch_segment(client, url, part_path, *byte_range, validator, chunk_size, cancelled)
+        except BaseException:
+            # Stop the other segments early
+            cancelled.set()
+            raise
+
+    try:
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix='nexus-segment') as pool:
+            futures = [pool.submit(fetch, byte_range) for byte_range in ranges]
+            for future in futures:
+                future.result()
+    except _RangeNotHonored:
+        _remove(part_path)
+        logger.info("%s changed or stopped honoring ranges, downloading it in one stream", url)
+        return download_file(client, url, output_path, chunk_size=chunk_size, verifier=verifier)
+    except BaseException:
+        _remove(part_path)
+        raise
+
+    if verifier is not None:
+        verifier.reset()
+        verifier.update_from_file(part_path)
+        _verify_part(verifier, part_path, output_path)
+    os.replace(part_path, output_path)
+    return size
@@ -4,10 +4,12 @@
 class NexusException(Exception):
     """Base exception for all Nexus client errors."""
 
-    def __init__(self, message, status_code=None, response=None):
+    def __init__(self, message, status_code=None, response=None, retries=0):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        # Number of retries made before giving up
+        self.retries = retries
 
 
 class NexusAuthenticationError(NexusException):
@@ -28,3 +30,57 @@ class NexusForbiddenError(NexusException):
 class NexusBadRequestError(NexusException):
     """Raised when the request is invalid (400)."""
     pass
+
+
+class NexusChecksumMismatchError(NexusException):
+    """Raised when downloaded content does not match the asset's checksum."""
+
+    def __init__(self, path, algorithm, expected, actual):
+        super().__init__(f"{algorithm} mismatch for {path}: expected {expected}, got {actual}")
+        self.path = path
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+
+def error_for_status(status_code, text, response=None):
+    """
+    Map an HTTP error status (>= 400) to the matching Nexus exception.
+
+    Args:
+        status_code: HTTP status code of the response
+        text: Response body as text, used in the error message
+        response: Response object to attach to the exception
+
+    Returns:
+        Exception instance to raise
+    """
+    if status_code == 401:
+        return NexusAuthenticationError(
+            "Authentication failed",
+            status_code=401,
+            response=response
+        )
+    elif status_code == 403:
+        return NexusForbiddenError(
+            "Access forbidden - insufficient permissions",
+            status_code=403,
+            response=response
+        )
+    elif status_code == 404:
+        return NexusNotFoundError(
+            "Resource not found",
+            status_code=404,
+            response=response
+        )
+    elif status_code == 400:
+        return NexusBadRequestError(
+            f"Bad request: {text}",
+            status_code=400,
+            response=response
+        )
+    return NexusException(
+        f"Request failed with status {status_code}: {text}",
+        status_code=status_code,
+        response=response
+    )
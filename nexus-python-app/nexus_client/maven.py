@@ -0,0 +1,135 @@
+"""Maven artifact descriptions for multi-asset uploads."""
+
+import os
+from typing import List, Optional
+
+
+def maven_path(
+    group_id: str,
+    artifact_id: str,
+    version: str,
+    extension: str,
+    classifier: Optional[str] = None
+) -> str:
+    """
+    Repository path of a Maven artifact (release layout).
+
+    Args:
+        group_id: Maven groupId
+        artifact_id: Maven artifactId
+        version: Version
+        extension: File extension (jar, pom, ...)
+        classifier: Classifier (sources, javadoc, ...)
+
+    Returns:
+        Path such as 'com/example/app/1.0/app-1.0-sources.jar'
+    """
+    suffix = f'-{classifier}' if classifier else ''
+    return (
+        f"{group_id.replace('.', '/')}/{artifact_id}/{version}/"
+        f"{artifact_id}-{version}{suffix}.{extension}"
+    )
+
+
+class MavenAsset:
+    """
+    One file of a Maven component.
+
+    Attributes:
+        file_path: Local file path
+        extension: Extension in the repository ('jar', 'pom', 'jar.asc', ...)
+        classifier: Classifier ('sources', 'javadoc', ...) or None
+    """
+
+    def __init__(self, file_path: str, extension: str, classifier: Optional[str] = None):
+        self.file_path = file_path
+        self.extension = extension
+        self.classifier = classifier
+
+    def __repr__(self) -> str:
+        return f"MavenAsset({self.file_path!r}, extension={self.extension!r}, classifier={self.classifier!r})"
+
+
+class MavenComponent:
+    """
+    A GAV and all of its files, uploaded together in one request.
+
+    Example:
+        >>> component = MavenComponent('com.example', 'app', '1.0', [
+        ...     MavenAsset('target/app-1.0.jar', 'jar'),
+        ...     MavenAsset('pom.xml', 'pom'),
+        ...     MavenAsset('target/app-1.0-sources.jar', 'jar', 'sources'),
+        ... ])
+    """
+
+    def __init__(
+        self,
+        group_id: str,
+        artifact_id: str,
+        version: str,
+        assets: List[MavenAsset],
+        packaging: Optional[str] = None,
+        generate_pom: bool = False
+    ):
+        self.group_id = group_id
+        self.artifact_id = artifact_id
+        self.version = version
+        self.assets = assets
+        self.packaging = packaging
+        self.generate_pom = generate_pom
+
+    @property
+    def gav(self) -> str:
+        """'groupId:artifactId:version' coordinates."""
+        return f'{self.group_id}:{self.artifact_id}:{self.version}'
+
+    def path_of(self, asset: MavenAsset) -> str:
+        """Repository path of one of the component's assets."""
+        return maven_path(self.group_id, self.artifact_id, self.version, asset.extension, asset.classifier)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: str,
+        group_id: str,
+        artifact_id: str,
+        version: str,
+        packaging: Optional[str] = None
+    ) -> 'MavenComponent':
+        """
+        Collect the files of a build output named after the Maven layout.
+
+        Every file named ``{artifactId}-{version}[-{classifier}].{extension}``
+        becomes an asset, including signatures and checksum files such as
+        ``app-1.0.jar.asc`` or ``app-1.0.pom.sha1``.
+
+        Args:
+            directory: Directory holding the files
+            group_id: Maven groupId
+            artifact_id: Maven artifactId
+            version: Version
+            packaging: Packaging of the component
+
+        Returns:
+            MavenComponent with one asset per matching file
+        """
+        prefix = f'{artifact_id}-{version}'
+        assets = []
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.startswith(prefix) or not os.path.isfile(path):
+                continue
+
+            rest = name[len(prefix):]
+            classifier = None
+            if rest.startswith('-'):
+                classifier, _, extension = rest[1:].partition('.')
+            elif rest.startswith('.'):
+                extension = rest[1:]
+            else:
+                continue
+
+            if extension and (classifier is None or classifier):
+                assets.append(MavenAsset(path, extension, classifier))
+
+        return cls(group_id, artifact_id, version, assets, packaging=packaging)
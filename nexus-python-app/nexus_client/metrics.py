@@ -0,0 +1,301 @@
+"""Per-endpoint request metrics with Prometheus text export."""
+
+import bisect
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+# Endpoint templates of the REST API, most specific first. Placeholders
+# match a single path segment, except {path} which matches the remainder.
+ENDPOINT_TEMPLATES = [
+    '/v1/blobstores/file/{name}',
+    '/v1/blobstores/{name}/quota-status',
+    '/v1/blobstores/{name}',
+    '/v1/components/{id}',
+    '/v1/assets/{id}',
+    '/v1/repositories/maven/hosted',
+    '/v1/repositories/docker/hosted',
+    '/v1/repositories/npm/hosted',
+    '/v1/repositories/{name}',
+    '/v1/security/users/{user_id}/change-password',
+    '/v1/security/users/{user_id}',
+    '/v1/security/roles/{source}/{role_id}',
+    '/v1/security/privileges/{name}',
+    '/v1/tasks/{id}/run',
+    '/v1/tasks/{id}/stop',
+    '/v1/tasks/{id}',
+    '/repository/{repository}/{path}',
+]
+
+# Latency histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_REST_PREFIX = '/service/rest'
+
+
+def _compile_template(template: str):
+    pattern = re.escape(template)
+    pattern = pattern.replace(re.escape('{path}'), '.+')
+    pattern = re.sub(r'\\\{\w+\\\}', '[^/]+', pattern)
+    return re.compile(f'^{pattern}/?$')
+
+
+_COMPILED_TEMPLATES = [(_compile_template(t), t) for t in ENDPOINT_TEMPLATES]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Reduce an endpoint or URL to its template, e.g. '/v1/components/{id}'.
+
+    Args:
+        endpoint: API endpoint relative to the REST base, or an absolute URL
+
+    Returns:
+        Matching template, or the normalized path if none matches
+    """
+    path = urlparse(endpoint).path if '://' in endpoint else endpoint.split('?', 1)[0]
+    path = '/' + path.lstrip('/')
+    if path.startswith(_REST_PREFIX + '/'):
+        path = path[len(_REST_PREFIX):]
+
+    for pattern, template in _COMPILED_TEMPLATES:
+        if pattern.match(path):
+            return template
+    return path.rstrip('/') or '/'
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets (not thread-safe)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get (upper bound, cumulative count) pairs, ending with +Inf."""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')
+
+
+class EndpointStats:
+    """Counters for one (method, endpoint template) pair."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_codes: Dict[str, int] = {}
+        self.latency = Histogram(buckets)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view of the counters."""
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'in_flight': self.in_flight,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'status_codes': dict(self.status_codes),
+            'latency_count': self.latency.count,
+            'latency_sum': self.latency.sum,
+            'latency_p50': self.latency.quantile(0.5),
+            'latency_p99': self.latency.quantile(0.99),
+            'latency_buckets': self.latency.cumulative(),
+        }
+
+
+class RequestMetrics:
+    """
+    Thread-safe request metrics keyed by HTTP method and endpoint template.
+
+    Every attempt made by the client is counted, so a retried request
+    contributes one request per attempt plus its retries.
+
+    Example:
+        >>> stats = client.metrics.snapshot()
+        >>> stats[('GET', '/v1/search/assets')]['latency_p99']
+        >>> client.metrics.write_prometheus('/var/lib/node_exporter/nexus_client.prom')
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            buckets: Latency histogram bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def _get(self, method: str, template: str) -> EndpointStats:
+        """Get or create the stats entry (lock held)."""
+        key = (method.upper(), template)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = EndpointStats(self.buckets)
+        return stats
+
+    def request_started(self, method: str, template: str) -> None:
+        """Record a request going on the wire."""
+        with self._lock:
+            self._get(method, template).in_flight += 1
+
+    def request_finished(
+        self,
+        method: str,
+        template: str,
+        status_code: Optional[int],
+        seconds: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0
+    ) -> None:
+        """
+        Record the outcome of a request started with request_started().
+
+        Args:
+            method: HTTP method
+            template: Endpoint template
+            status_code: Response status, or None for a transport error
+            seconds: Request latency (until the headers for streamed responses)
+            bytes_sent: Request body size
+            bytes_received: Response body size
+        """
+        with self._lock:
+            stats = self._get(method, template)
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency.observe(seconds)
+
+            status = str(status_code) if status_code is not None else 'error'
+            stats.status_codes[status] = stats.status_codes.get(status, 0) + 1
+            if status_code is None or status_code >= 400:
+                stats.errors += 1
+
+    def record_retry(self, method: str, template: str) -> None:
+        """Record that a request is about to be retried."""
+        with self._lock:
+            self._get(method, template).retries += 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Get a consistent copy of all counters.
+
+        Returns:
+            Dict mapping (method, endpoint template) to counter dicts
+        """
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._stats = {}
+
+    def render_prometheus(self, prefix: str = 'nexus_client') -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+        def labels(method: str, template: str, **extra) -> str:
+            pairs = [('method', method), ('endpoint', template)] + sorted(extra.items())
+            return ','.join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+
+        family('requests_total', 'counter', 'Requests by endpoint and status code')
+        for (method, template), stats in sorted(snapshot.items()):
+            for status, count in sorted(stats['status_codes'].items()):
+                lines.append(f'{prefix}_requests_total{{{labels(method, template, status=status)}}} {count}')
+
+        for name, key, help_text in (
+            ('retries_total', 'retries', 'Retried request attempts'),
+            ('request_bytes_total', 'bytes_sent', 'Request body bytes sent'),
+            ('response_bytes_total', 'bytes_received', 'Response body bytes received'),
+        ):
+            family(name, 'counter', help_text)
+            for (method, template), stats in sorted(snapshot.items()):
+                lines.append(f'{prefix}_{name}{{{labels(method, template)}}} {stats[key]}')
+
+        family('in_flight_requests', 'gauge', 'Requests currently waiting for a response')
+        for (method, template), stats in sorted(snapshot.items()):
+            lines.append(f'{prefix}_in_flight_requests{{{labels(method, template)}}} {stats["in_flight"]}')
+
+        family('request_duration_seconds', 'histogram', 'Request latency (until headers for streamed responses)')
+        for (method, template), stats in sorted(snapshot.items()):
+            for bound, count in stats['latency_buckets']:
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{{labels(method, template, le=le)}}} {count}'
+                )
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{labels(method, template)}}} {stats["latency_sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{{labels(method, template)}}} {stats["latency_count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, prefix: str = 'nexus_client') -> None:
+        """
+        Atomically write the metrics to a Prometheus text file.
+
+        Suitable for the node_exporter textfile collector.
+
+        Args:
+            path: Destination file path
+            prefix: Metric name prefix
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render_prometheus(prefix))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,303 @@
+"""Incremental mirroring of a repository to a local directory."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from .downloads import SEGMENT_THRESHOLD, DownloadManager, DownloadReport, DownloadResult, output_path_for
+
+
+logger = logging.getLogger(__name__)
+
+# Directory at the root of a mirror reserved for its bookkeeping; assets
+# with a path under it are not mirrored
+STATE_DIR = '.nexus-mirror'
+
+# Name of the manifest file in STATE_DIR
+MANIFEST_NAME = 'manifest.json'
+
+# Seconds between saves of the manifest while a mirror run is downloading
+SAVE_INTERVAL = 30.0
+
+
+def fingerprint(asset: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fields of an asset listing entry that change with its content.
+
+    Args:
+        asset: Asset dict
+
+    Returns:
+        Dict with fileSize, lastModified and checksum
+    """
+    return {
+        'fileSize': asset.get('fileSize'),
+        'lastModified': asset.get('lastModified'),
+        'checksum': dict(sorted((asset.get('checksum') or {}).items())),
+    }
+
+
+class MirrorManifest:
+    """
+    JSON file recording the assets a mirror holds, by repository path.
+
+    Each entry is the fingerprint() of the asset as it was when its file
+    was written. The file is rewritten atomically on save().
+    """
+
+    def __init__(self, path: str, repository: str):
+        """
+        Open (or create) a manifest.
+
+        Args:
+            path: Path to the JSON manifest file
+            repository: Repository the mirror belongs to
+
+        Raises:
+            ValueError: If the manifest belongs to another repository
+        """
+        self.path = path
+        self.repository = repository
+        self._lock = threading.Lock()
+        self._assets = self._read()
+        self._saved = time.monotonic()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from disk, returning an empty manifest if missing."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if data.get('repository') != self.repository:
+            raise ValueError(
+                f"{self.path} is the mirror of {data.get('repository')!r}, not {self.repository!r}"
+            )
+        return data.get('assets', {})
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Recorded fingerprint of a path, or None if it is not mirrored."""
+        with self._lock:
+            return self._assets.get(path)
+
+    def set(self, path: str, entry: Dict[str, Any]) -> None:
+        """Record the fingerprint of a written file."""
+        with self._lock:
+            self._assets[path] = entry
+
+    def remove(self, path: str) -> None:
+        """Forget a path."""
+        with self._lock:
+            self._assets.pop(path, None)
+
+    def paths(self) -> Set[str]:
+        """All recorded paths."""
+        with self._lock:
+            return set(self._assets)
+
+    def save(self, min_interval: float = 0.0) -> None:
+        """
+        Atomically write the manifest.
+
+        Args:
+            min_interval: Skip the write if the last one is more recent
+                than this many seconds
+        """
+        with self._lock:
+            if min_interval and time.monotonic() - self._saved < min_interval:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.mirror-')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'repository': self.repository, 'assets': self._assets}, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._saved = time.monotonic()
+
+
+class MirrorReport:
+    """Outcome of a mirror run."""
+
+    def __init__(self, downloads: DownloadReport, unchanged: int, deleted: List[str], elapsed: float):
+        self.downloads = downloads
+        self.unchanged = unchanged
+        self.deleted = deleted
+        self.elapsed = elapsed
+
+    @property
+    def downloaded(self) -> int:
+        """Number of new or changed assets written."""
+        return self.downloads.succeeded
+
+    @property
+    def failed(self) -> List[DownloadResult]:
+        """New or changed assets that could not be downloaded."""
+        return self.downloads.failed
+
+    def __repr__(self) -> str:
+        return (
+            f"MirrorReport(downloaded={self.downloaded}, failed={len(self.failed)}, "
+            f"unchanged={self.unchanged}, deleted={len(self.deleted)}, elapsed={self.elapsed:.1f}s)"
+        )
+
+
+class RepositoryMirror:
+    """
+    Keep a local directory in sync with a repository.
+
+    Each run walks the asset listing and compares every asset's path,
+    fileSize, lastModified and checksums with the manifest kept in the
+    mirror (``.nexus-mirror/manifest.json``). Only new or changed assets, and
+    assets whose local file is missing or has the wrong size, are
+    downloaded, by a DownloadManager. A failed download leaves the
+    previous file and its manifest entry in place, so it is retried on
+    the next run.
+
+    With ``delete``, files of assets that are no longer listed are
+    removed. Only files recorded in the manifest are ever deleted.
+
+    The listing is streamed into the downloads rather than collected
+    first; the manifest is the only per-asset state held in memory.
+
+    Example:
+        >>> mirror = RepositoryMirror(client.assets, workers=16, delete=True)
+        >>> report = mirror.mirror("raw-releases", "/srv/mirror/raw-releases")
+        >>> print(report.downloaded, "updated,", report.unchanged, "unchanged")
+    """
+
+    def __init__(
+        self,
+        asset_api,
+        workers: int = 8,
+        delete: bool = False,
+        verify: bool = True,
+        segments: int = 1,
+        segment_threshold: int = SEGMENT_THRESHOLD
+    ):
+        """
+        Initialize the mirror.
+
+        Args:
+            asset_api: AssetAPI used to list and fetch assets
+            workers: Number of concurrent downloads
+            delete: Remove local files of assets that were deleted upstream
+            verify: Check downloads against the asset checksums
+            segments: Parallel connections per asset of at least
+                ``segment_threshold`` bytes
+            segment_threshold: Minimum size in bytes for a segmented download
+        """
+        self.assets = asset_api
+        self.workers = workers
+        self.delete = delete
+        self.verify = verify
+        self.segments = segments
+        self.segment_threshold = segment_threshold
+
+    def mirror(
+        self,
+        repository: str,
+        dest_dir: str,
+        progress: Optional[Callable[[DownloadResult], None]] = None
+    ) -> MirrorReport:
+        """
+        Bring ``dest_dir`` up to date with a repository.
+
+        Args:
+            repository: Repository name
+            dest_dir: Mirror directory (created if needed)
+            progress: Callback receiving each DownloadResult as it completes
+
+        Returns:
+            MirrorReport of the run
+        """
+        started = time.monotonic()
+        dest_dir = os.path.abspath(dest_dir)
+        state_dir = os.path.join(dest_dir, STATE_DIR)
+        os.makedirs(state_dir, exist_ok=True)
+        manifest = MirrorManifest(os.path.join(state_dir, MANIFEST_NAME), repository)
+
+        # Recorded paths not seen in the listing (yet)
+        stale = manifest.paths() if self.delete else set()
+        unchanged = 0
+
+        def changed() -> Iterator[Dict[str, Any]]:
+            nonlocal unchanged
+            for asset in self.assets.iter_assets(repository):
+                path = asset['path'].lstrip('/')
+                if path == STATE_DIR or path.startswith(STATE_DIR + '/'):
+                    logger.warning("Not mirroring %s: %s is reserved for the mirror's state", path, STATE_DIR)
+                    continue
+                stale.discard(path)
+                if manifest.get(path) == fingerprint(asset) and self._present(dest_dir, path, asset):
+                    unchanged += 1
+                else:
+                    yield asset
+
+        def record(result: DownloadResult) -> None:
+            if result.ok:
+                manifest.set(result.path, fingerprint(result.asset))
+                manifest.save(SAVE_INTERVAL)
+            if progress is not None:
+                progress(result)
+
+        manager = DownloadManager(
+            self.assets,
+            workers=self.workers,
+            segments=self.segments,
+            segment_threshold=self.segment_threshold,
+            verify=self.verify
+        )
+        try:
+            downloads = manager.download(changed(), dest_dir, progress=record)
+        finally:
+            manifest.save()
+
+        deleted = []
+        if self.delete:
+            for path in sorted(stale):
+                self._remove(dest_dir, path)
+                manifest.remove(path)
+                deleted.append(path)
+            if deleted:
+                manifest.save()
+
+        return MirrorReport(downloads, unchanged, deleted, time.monotonic() - started)
+
+    @staticmethod
+    def _present(dest_dir: str, path: str, asset: Dict[str, Any]) -> bool:
+        """Check that the local file of an asset exists with the listed size."""
+        try:
+            size = os.path.getsize(output_path_for(dest_dir, path))
+        except (OSError, ValueError):
+            return False
+        return asset.get('fileSize') is None or size == asset['fileSize']
+
+    @staticmethod
+    def _remove(dest_dir: str, path: str) -> None:
+        """Delete the file of a path and the directories it leaves empty."""
+        try:
+            output_path = output_path_for(dest_dir, path)
+        except ValueError:
+            return
+        try:
+            os.unlink(output_path)
+        except FileNotFoundError:
+            pass
+
+        directory = os.path.dirname(output_path)
+        while directory != dest_dir:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                # Not empty
+                break
+            directory = os.path.dirname(directory)
@@ -0,0 +1,224 @@
+"""Streaming multipart/form-data encoder for uploads."""
+
+import io
+import mimetypes
+import os
+import uuid
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# Size of the reads made from files while streaming a body
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Called with (bytes sent so far, total bytes)
+ProgressCallback = Callable[[int, int], None]
+
+
+class _FilePart:
+    """File content of a part, opened lazily and closed once fully read."""
+
+    def __init__(self, source: Any):
+        self.path: Optional[str] = None
+        self.fileobj = None
+        self.owned = False
+
+        if isinstance(source, (str, os.PathLike)):
+            self.path = os.fspath(source)
+            self.start = 0
+            self.size = os.path.getsize(self.path)
+        else:
+            self.fileobj = source
+            self.start = source.tell()
+            source.seek(0, io.SEEK_END)
+            self.size = source.tell() - self.start
+            source.seek(self.start)
+
+    def open(self):
+        """Get a file object positioned at the start of the content."""
+        if self.fileobj is None:
+            self.fileobj = open(self.path, 'rb')
+            self.owned = True
+        self.fileobj.seek(self.start)
+        return self.fileobj
+
+    def close(self) -> None:
+        """Close the file if this part opened it."""
+        if self.owned and self.fileobj is not None:
+            self.fileobj.close()
+            self.fileobj = None
+            self.owned = False
+
+
+class MultipartEncoder:
+    """
+    File-like multipart/form-data body that streams file parts from disk.
+
+    The body is produced on demand while requests writes it to the socket,
+    so memory use is bounded by the chunk size whatever the file sizes.
+    Files given as paths are only opened while their part is being sent.
+    The total length is known upfront, so the request is sent with a
+    Content-Length rather than chunked.
+
+    Fields are (name, value) pairs. A value is either a string (a form
+    field) or a (filename, source) / (filename, source, content_type)
+    tuple, where source is a path, a binary file object or bytes.
+
+    Example:
+        >>> encoder = MultipartEncoder([
+        ...     ('raw.directory', '/releases'),
+        ...     ('raw.asset1', ('app.iso', '/data/app.iso')),
+        ...     ('raw.asset1.filename', 'app.iso'),
+        ... ], progress=lambda sent, total: print(f'{sent}/{total}'))
+        >>> client.post('/v1/components', params={'repository': 'raw'},
+        ...             data=encoder, headers={'Content-Type': encoder.content_type})
+    """
+
+    def __init__(
+        self,
+        fields: Union[Sequence[Tuple[str, Any]], dict],
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            fields: Form fields and file parts, in order
+            boundary: Multipart boundary (random by default)
+            chunk_size: Maximum size of the reads made from files
+            progress: Callback receiving (bytes sent, total bytes) after
+                each chunk
+        """
+        if isinstance(fields, dict):
+            fields = list(fields.items())
+
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+        # Body segments: bytes, or _FilePart streamed from its source
+        self._segments: List[Union[bytes, _FilePart]] = []
+        for name, value in fields:
+            self._add_field(name, value)
+        self._segments.append(f'--{self.boundary}--\r\n'.encode('utf-8'))
+
+        self.len = sum(
+            len(segment) if isinstance(segment, bytes) else segment.size
+            for segment in self._segments
+        )
+        self.bytes_read = 0
+        self._index = 0
+        self._offset = 0
+
+    def _add_field(self, name: str, value: Any) -> None:
+        """Append the segments of one part."""
+        if isinstance(value, tuple):
+            filename, source = value[0], value[1]
+            content_type = value[2] if len(value) > 2 else None
+            if not content_type:
+                content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            header = (
+                f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{_quote(name)}"; '
+                f'filename="{_quote(filename)}"\r\n'
+                f'Content-Type: {content_type}\r\n\r\n'
+            )
+            self._segments.append(header.encode('utf-8'))
+            if isinstance(source, bytes):
+                self._segments.append(source)
+            else:
+                self._segments.append(_FilePart(source))
+        else:
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+            header = (
+                f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            )
+            self._segments.append(header.encode('utf-8') + str(value).encode('utf-8'))
+        self._segments.append(b'\r\n')
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to ``size`` bytes of the body (the rest if size < 0).
+
+        Files are read at most ``chunk_size`` bytes at a time.
+        """
+        if size is None or size < 0:
+            size = self.len - self.bytes_read
+        parts = []
+        remaining = size
+
+        while remaining > 0 and self._index < len(self._segments):
+            segment = self._segments[self._index]
+            if isinstance(segment, bytes):
+                data = segment[self._offset:self._offset + remaining]
+            else:
+                fileobj = segment.open() if self._offset == 0 else segment.fileobj
+                wanted = min(remaining, self.chunk_size, segment.size - self._offset)
+                data = fileobj.read(wanted)
+                if not data and wanted:
+                    raise IOError(f"File part ended early at {self._offset} of {segment.size} bytes")
+
+            self._offset += len(data)
+            remaining -= len(data)
+            parts.append(data)
+
+            segment_size = len(segment) if isinstance(segment, bytes) else segment.size
+            if self._offset >= segment_size:
+                if not isinstance(segment, bytes):
+                    segment.close()
+                self._index += 1
+                self._offset = 0
+
+        chunk = b''.join(parts)
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.progress is not None:
+                self.progress(self.bytes_read, self.len)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Rewind the body to the start (used before retrying a request)."""
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartEncoder can only be rewound to the start")
+        self.close()
+        self.bytes_read = 0
+        self._index = 0
+        self._offset = 0
+        return 0
+
+    def tell(self) -> int:
+        """Number of body bytes produced so far."""
+        return self.bytes_read
+
+    def close(self) -> None:
+        """Close any file this encoder opened."""
+        for segment in self._segments:
+            if not isinstance(segment, bytes):
+                segment.close()
+
+    def to_string(self) -> bytes:
+        """Encode the whole body in memory (for debugging small bodies)."""
+        self.seek(0)
+        try:
+            return self.read()
+        finally:
+            self.seek(0)
+
+
+def _quote(value: str) -> str:
+    """Escape a Content-Disposition parameter value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\r', '').replace('\n', '')
@@ -0,0 +1,149 @@
+"""Helpers for walking continuationToken-paginated endpoints."""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .checkpoint import CheckpointStore
+
+
+# Sentinel put on the prefetch queue once the last page has been fetched
+_DONE = object()
+
+
+class _PrefetchError:
+    """Wraps an exception raised by the prefetch worker."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def iter_pages(
+    fetch_page: Callable[[Optional[str]], Dict[str, Any]],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield pages from a paginated endpoint until no continuation token is left.
+
+    Without prefetching only one page is held in memory at a time. With
+    ``prefetch`` > 0, a background thread requests page N+1 as soon as
+    page N's continuation token is known, buffering at most ``prefetch``
+    pages ahead of the consumer.
+
+    Args:
+        fetch_page: Callable taking a continuation token and returning a page
+            dict with 'items' and 'continuationToken'
+        continuation_token: Token to start from (None for the first page)
+        prefetch: Number of pages to fetch ahead in the background (0 disables)
+
+    Yields:
+        Page dicts as returned by the endpoint
+    """
+    if prefetch > 0:
+        yield from _iter_pages_prefetched(fetch_page, continuation_token, prefetch)
+        return
+
+    token = continuation_token
+    while True:
+        page = fetch_page(token)
+        yield page
+
+        token = page.get('continuationToken')
+        if not token:
+            break
+
+
+def _iter_pages_prefetched(
+    fetch_page: Callable[[Optional[str]], Dict[str, Any]],
+    continuation_token: Optional[str],
+    depth: int
+) -> Iterator[Dict[str, Any]]:
+    """Yield pages fetched by a background worker thread."""
+    pages = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Poll so an abandoned consumer never leaves the worker blocked
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        token = continuation_token
+        try:
+            while not stop.is_set():
+                page = fetch_page(token)
+                if not put(page):
+                    return
+                token = page.get('continuationToken')
+                if not token:
+                    break
+        except BaseException as e:
+            put(_PrefetchError(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=worker, name='nexus-page-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def iter_items(
+    fetch_page: Callable[[Optional[str]], Dict[str, Any]],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0,
+    checkpoint: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items one at a time from a paginated endpoint.
+
+    With a checkpoint store, the walk resumes from the stored token and
+    records the next token once every item of a page has been consumed,
+    so a restarted walk re-yields at most the page that was in progress.
+    A walk recorded as complete yields nothing until it is reset.
+
+    Args:
+        fetch_page: Callable taking a continuation token and returning a page
+        continuation_token: Token to start from (None for the first page or
+            the checkpointed position)
+        prefetch: Number of pages to fetch ahead in the background (0 disables)
+        checkpoint: Store used to persist progress after each page
+        checkpoint_key: Key of this walk in the checkpoint store
+
+    Yields:
+        Items from each page, in order
+    """
+    if checkpoint is not None:
+        if not checkpoint_key:
+            raise ValueError("checkpoint_key is required when checkpoint is set")
+        state = checkpoint.get(checkpoint_key)
+        if state is not None and continuation_token is None:
+            if state.get('complete'):
+                return
+            continuation_token = state.get('continuationToken')
+
+    for page in iter_pages(fetch_page, continuation_token, prefetch):
+        items = page.get('items', [])
+        yield from items
+
+        if checkpoint is not None:
+            checkpoint.save_page(
+                checkpoint_key,
+                page.get('continuationToken'),
+                len(items)
+            )
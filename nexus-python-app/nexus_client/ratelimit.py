@@ -0,0 +1,264 @@
+"""Client-side rate limiting and concurrency control."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+# Endpoint classes with independent budgets
+SEARCH = 'search'
+LISTING = 'listing'
+UPLOAD = 'upload'
+DOWNLOAD = 'download'
+DEFAULT = 'default'
+
+ENDPOINT_CLASSES = (SEARCH, LISTING, UPLOAD, DOWNLOAD, DEFAULT)
+
+# Collection endpoints whose GET is a (possibly paginated) listing
+_LISTING_PATHS = frozenset([
+    '/v1/assets',
+    '/v1/blobstores',
+    '/v1/components',
+    '/v1/repositories',
+    '/v1/security/privileges',
+    '/v1/security/roles',
+    '/v1/security/users',
+    '/v1/tasks',
+])
+
+_REST_PREFIX = '/service/rest'
+
+# Marker for configure() arguments that should be left as they are
+_UNCHANGED = object()
+
+
+def classify_request(method: str, endpoint: str) -> str:
+    """
+    Map a request to the endpoint class whose budget it consumes.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint relative to the REST base, or an absolute URL
+
+    Returns:
+        One of ENDPOINT_CLASSES
+    """
+    path = urlparse(endpoint).path if '://' in endpoint else endpoint
+    path = '/' + path.lstrip('/')
+
+    if path.startswith(_REST_PREFIX + '/'):
+        path = path[len(_REST_PREFIX):]
+    elif not path.startswith('/v1/'):
+        # Anything outside the REST API is repository content
+        return DOWNLOAD
+
+    method = method.upper()
+    if path.startswith('/v1/search'):
+        return SEARCH
+    if method == 'POST' and path == '/v1/components':
+        return UPLOAD
+    if method == 'GET' and path.rstrip('/') in _LISTING_PATHS:
+        return LISTING
+    return DEFAULT
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    A rate of None disables the bucket.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (None for unlimited)
+            burst: Bucket capacity (defaults to max(rate, 1))
+        """
+        self._lock = threading.Lock()
+        self.rate = None
+        self.burst = None
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: Optional[float], burst: Optional[float] = None) -> None:
+        """
+        Change the refill rate and capacity at runtime.
+
+        Args:
+            rate: Tokens added per second (None for unlimited)
+            burst: Bucket capacity (defaults to max(rate, 1))
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive (or None for unlimited)")
+
+        with self._lock:
+            self._refill()
+            was_unlimited = self.rate is None
+            self.rate = rate
+            self.burst = burst if burst is not None else (max(rate, 1.0) if rate else None)
+            if self.burst is not None:
+                # A newly limited bucket starts full; otherwise keep its level
+                self._tokens = self.burst if was_unlimited else min(self._tokens, self.burst)
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update (lock held)."""
+        now = time.monotonic()
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Time spent waiting in seconds
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                if self.rate is None:
+                    return waited
+                self._refill()
+                needed = min(tokens, self.burst)
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return waited
+                delay = (needed - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class ConcurrencyLimiter:
+    """Thread-safe counting semaphore whose limit can change at runtime."""
+
+    def __init__(self, max_in_flight: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_in_flight: Maximum concurrent holders (None for unlimited)
+        """
+        self._condition = threading.Condition()
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    def set_limit(self, max_in_flight: Optional[int]) -> None:
+        """Change the maximum number of concurrent holders."""
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1 (or None for unlimited)")
+
+        with self._condition:
+            self.max_in_flight = max_in_flight
+            self._condition.notify_all()
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._condition:
+            while self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        """Give a slot back."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+
+class RateLimiter:
+    """
+    Per-endpoint-class request budgets shared by one or more clients.
+
+    Each endpoint class (search, listing, upload, download, default) has
+    its own token bucket and max-in-flight limit. Classes without a
+    configured limit are not throttled. Limits can be changed at any time
+    from any thread.
+
+    Example:
+        >>> limiter = RateLimiter()
+        >>> limiter.configure('search', rate=20, max_in_flight=4)
+        >>> limiter.configure('download', max_in_flight=16)
+        >>> client = NexusClient(url, rate_limiter=limiter)
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket() for name in ENDPOINT_CLASSES
+        }
+        self._limiters: Dict[str, ConcurrencyLimiter] = {
+            name: ConcurrencyLimiter() for name in ENDPOINT_CLASSES
+        }
+
+    def configure(
+        self,
+        endpoint_class: str,
+        rate=_UNCHANGED,
+        burst=_UNCHANGED,
+        max_in_flight=_UNCHANGED
+    ) -> None:
+        """
+        Set the budget of an endpoint class; omitted arguments are unchanged.
+
+        Args:
+            endpoint_class: One of ENDPOINT_CLASSES
+            rate: Requests per second (None for unlimited)
+            burst: Requests allowed in a burst (defaults to max(rate, 1)
+                whenever the rate is set)
+            max_in_flight: Maximum concurrent requests (None for unlimited)
+        """
+        if endpoint_class not in self._buckets:
+            raise ValueError(
+                f"Unknown endpoint class {endpoint_class!r}, expected one of {ENDPOINT_CLASSES}"
+            )
+
+        bucket = self._buckets[endpoint_class]
+        if rate is not _UNCHANGED or burst is not _UNCHANGED:
+            bucket.set_rate(
+                bucket.rate if rate is _UNCHANGED else rate,
+                None if burst is _UNCHANGED else burst
+            )
+        if max_in_flight is not _UNCHANGED:
+            self._limiters[endpoint_class].set_limit(max_in_flight)
+
+    def in_flight(self, endpoint_class: str) -> int:
+        """Number of requests of this class currently in flight."""
+        return self._limiters[endpoint_class].in_flight
+
+    def acquire(self, endpoint_class: str) -> None:
+        """
+        Take an in-flight slot and a rate token for one request.
+
+        Must be paired with release().
+        """
+        limiter = self._limiters[endpoint_class]
+        limiter.acquire()
+        try:
+            self._buckets[endpoint_class].acquire()
+        except BaseException:
+            limiter.release()
+            raise
+
+    def release(self, endpoint_class: str) -> None:
+        """Give back the in-flight slot taken by acquire()."""
+        self._limiters[endpoint_class].release()
+
+    @contextmanager
+    def limit(self, endpoint_class: str) -> Iterator[None]:
+        """Hold an in-flight slot of ``endpoint_class`` for the duration of the block."""
+        self.acquire(endpoint_class)
+        try:
+            yield
+        finally:
+            self.release(endpoint_class)
@@ -2,6 +2,8 @@
 
 from typing import List, Dict, Any, Optional
 
+from .conditional import PollResult
+
 
 class RepositoryAPI:
     """API for managing Nexus repositories."""
@@ -16,8 +18,20 @@ class RepositoryAPI:
         Returns:
             List of repository configurations
         """
-        response = self.client.get('/v1/repositories')
-        return response.json()
+        return self.client.get_json('/v1/repositories')
+
+    def poll(self) -> PollResult:
+        """
+        List all repositories with a conditional request.
+
+        Cheap to call every few seconds: when nothing changed Nexus answers
+        304 and the previous list is returned without being re-downloaded.
+
+        Returns:
+            PollResult whose ``data`` is the list of repository configurations and
+            ``changed`` tells whether it differs from the previous poll
+        """
+        return self.client.poll('/v1/repositories')
 
     def get(self, repository_name: str) -> Dict[str, Any]:
         """
@@ -29,8 +43,7 @@ class RepositoryAPI:
         Returns:
             Repository configuration
         """
-        response = self.client.get(f'/v1/repositories/{repository_name}')
-        return response.json()
+        return self.client.get_json(f'/v1/repositories/{repository_name}')
 
     def create_maven_hosted(
         self,
@@ -138,4 +151,7 @@ class RepositoryAPI:
         Args:
             repository_name: Name of the repository to delete
         """
-        self.client.delete(f'/v1/repositories/{repository_name}')
+        try:
+            self.client.delete(f'/v1/repositories/{repository_name}')
+        finally:
+            self.client.components.checksum_index.forget(repository_name)
@@ -0,0 +1,163 @@
+"""Retry policy with exponential backoff for transient Nexus failures."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+
+# Methods that can safely be sent twice
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# Statuses Nexus returns while overloaded, restarting or paused for GC
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is retried.
+
+    Delays grow exponentially (``backoff_factor * 2 ** attempt``, capped at
+    ``max_backoff``) with full jitter. A ``Retry-After`` header on the
+    response takes precedence when present. Only idempotent methods are
+    retried unless ``retry_post`` is enabled; requests with file or stream
+    bodies are rewound before being resent.
+
+    Example:
+        >>> client = NexusClient(url, retry=RetryPolicy(max_retries=5, retry_post=True))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_post: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries per request (0 disables)
+            backoff_factor: Base delay in seconds for the first retry
+            max_backoff: Upper bound for a computed backoff delay in seconds
+            jitter: Randomize delays between 0 and the computed backoff
+            retry_statuses: HTTP statuses that trigger a retry
+            retry_post: Also retry POST requests (e.g. component uploads)
+            respect_retry_after: Honor the Retry-After response header
+            max_retry_after: Upper bound in seconds for a Retry-After delay
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_post = retry_post
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_method(self, method: str) -> bool:
+        """Check whether requests with this HTTP method may be retried."""
+        method = method.upper()
+        return method in IDEMPOTENT_METHODS or (self.retry_post and method == 'POST')
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """
+        Check whether a response status warrants another attempt.
+
+        Args:
+            method: HTTP method of the request
+            status_code: Status code of the failed response
+            attempt: Number of retries already made
+
+        Returns:
+            True if the request should be retried
+        """
+        return (
+            attempt < self.max_retries
+            and status_code in self.retry_statuses
+            and self.is_retryable_method(method)
+        )
+
+    def should_retry_error(self, method: str, attempt: int) -> bool:
+        """
+        Check whether a transient transport error warrants another attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+
+        Returns:
+            True if the request should be retried
+        """
+        return attempt < self.max_retries and self.is_retryable_method(method)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff delay before retry number ``attempt + 1``.
+
+        Args:
+            attempt: Number of retries already made
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry_after(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """
+        Parse a Retry-After header (delta-seconds or HTTP-date).
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Delay in seconds, or None if absent or invalid
+        """
+        if not self.respect_retry_after or not headers:
+            return None
+
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            seconds = float(value)
+        else:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def delay(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of retries already made
+            headers: Headers of the failed response, if any
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = self.retry_after(headers)
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+
+# Policy that never retries
+NO_RETRY = RetryPolicy(max_retries=0)
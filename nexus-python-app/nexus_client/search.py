@@ -1,6 +1,10 @@
 """Search API for finding components and assets."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+from .checkpoint import CheckpointStore, search_checkpoint_key
+from .pagination import iter_items
+from .sharding import ShardedWalker
 
 
 class SearchAPI:
@@ -20,7 +24,8 @@ class SearchAPI:
         sha1: Optional[str] = None,
         sha256: Optional[str] = None,
         sha512: Optional[str] = None,
-        continuation_token: Optional[str] = None
+        continuation_token: Optional[str] = None,
+        **extra_params
     ) -> Dict[str, Any]:
         """
         Search for components.
@@ -36,6 +41,8 @@ class SearchAPI:
             sha256: SHA-256 checksum
             sha512: SHA-512 checksum
             continuation_token: Token for pagination
+            **extra_params: Additional search parameters passed through as-is,
+                e.g. format attributes such as 'maven.extension' or 'q'
 
         Returns:
             Dict with 'items' (list of components) and 'continuationToken'
@@ -62,9 +69,9 @@ class SearchAPI:
             params['sha512'] = sha512
         if continuation_token:
             params['continuationToken'] = continuation_token
+        params.update({k: v for k, v in extra_params.items() if v})
 
-        response = self.client.get('/v1/search', params=params)
-        return response.json()
+        return self.client.get_json('/v1/search', params=params)
 
     def search_assets(
         self,
@@ -77,7 +84,8 @@ class SearchAPI:
         sha1: Optional[str] = None,
         sha256: Optional[str] = None,
         sha512: Optional[str] = None,
-        continuation_token: Optional[str] = None
+        continuation_token: Optional[str] = None,
+        **extra_params
     ) -> Dict[str, Any]:
         """
         Search for assets.
@@ -93,6 +101,8 @@ class SearchAPI:
             sha256: SHA-256 checksum
             sha512: SHA-512 checksum
             continuation_token: Token for pagination
+            **extra_params: Additional search parameters passed through as-is,
+                e.g. format attributes such as 'maven.extension' or 'q'
 
         Returns:
             Dict with 'items' (list of assets) and 'continuationToken'
@@ -119,6 +129,105 @@ class SearchAPI:
             params['sha512'] = sha512
         if continuation_token:
             params['continuationToken'] = continuation_token
+        params.update({k: v for k, v in extra_params.items() if v})
+
+        return self.client.get_json('/v1/search/assets', params=params)
+
+    def iter_search(
+        self,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all matching components, following pagination.
+
+        Args:
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+            **filters: Search filters accepted by search() (repository,
+                format, group, name, version, checksums)
 
-        response = self.client.get('/v1/search/assets', params=params)
-        return response.json()
+        Yields:
+            Component dicts
+        """
+        return iter_items(
+            lambda token: self.search(continuation_token=token, **filters),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            search_checkpoint_key('search', filters)
+        )
+
+    def iter_search_assets(
+        self,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all matching assets, following pagination.
+
+        Args:
+            continuation_token: Token to resume from (None for the first page)
+            prefetch: Number of pages to fetch ahead in the background
+            checkpoint: Store used to resume the walk and record progress
+            **filters: Search filters accepted by search_assets()
+
+        Yields:
+            Asset dicts
+        """
+        return iter_items(
+            lambda token: self.search_assets(continuation_token=token, **filters),
+            continuation_token,
+            prefetch,
+            checkpoint,
+            search_checkpoint_key('search_assets', filters)
+        )
+
+    def iter_search_sharded(
+        self,
+        shards: List[Dict[str, str]],
+        workers: int = 8,
+        remainder: bool = True,
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching components by walking query shards concurrently.
+
+        Args:
+            shards: Query partitions, e.g. from sharding.prefix_shards()
+            workers: Number of shards walked concurrently
+            remainder: Also walk the unsharded query for items the shards
+                miss (see ShardedWalker)
+            **filters: Filters shared by every shard (repository, format, ...)
+
+        Yields:
+            Component dicts, de-duplicated by id
+        """
+        return ShardedWalker(self, workers=workers, remainder=remainder).iter_components(shards, **filters)
+
+    def iter_search_assets_sharded(
+        self,
+        shards: List[Dict[str, str]],
+        workers: int = 8,
+        remainder: bool = True,
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching assets by walking query shards concurrently.
+
+        Args:
+            shards: Query partitions, e.g. from sharding.prefix_shards()
+            workers: Number of shards walked concurrently
+            remainder: Also walk the unsharded query for items the shards
+                miss (see ShardedWalker)
+            **filters: Filters shared by every shard (repository, format, ...)
+
+        Yields:
+            Asset dicts, de-duplicated by id
+        """
+        return ShardedWalker(self, workers=workers, remainder=remainder).iter_assets(shards, **filters)
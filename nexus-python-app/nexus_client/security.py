@@ -31,8 +31,7 @@ class SecurityAPI:
         if source:
             params['source'] = source
 
-        response = self.client.get('/v1/security/users', params=params)
-        return response.json()
+        return self.client.get_json('/v1/security/users', params=params)
 
     def create_user(
         self,
@@ -141,8 +140,7 @@ class SecurityAPI:
         if source:
             params['source'] = source
 
-        response = self.client.get('/v1/security/roles', params=params)
-        return response.json()
+        return self.client.get_json('/v1/security/roles', params=params)
 
     def get_role(self, role_id: str, source: str = "default") -> Dict[str, Any]:
         """
@@ -155,8 +153,7 @@ class SecurityAPI:
         Returns:
             Role details
         """
-        response = self.client.get(f'/v1/security/roles/{source}/{role_id}')
-        return response.json()
+        return self.client.get_json(f'/v1/security/roles/{source}/{role_id}')
 
     def create_role(
         self,
@@ -238,8 +235,7 @@ class SecurityAPI:
         Returns:
             List of privileges
         """
-        response = self.client.get('/v1/security/privileges')
-        return response.json()
+        return self.client.get_json('/v1/security/privileges')
 
     def get_privilege(self, privilege_name: str) -> Dict[str, Any]:
         """
@@ -251,8 +247,7 @@ class SecurityAPI:
         Returns:
             Privilege details
         """
-        response = self.client.get(f'/v1/security/privileges/{privilege_name}')
-        return response.json()
+        return self.client.get_json(f'/v1/security/privileges/{privilege_name}')
 
     def delete_privilege(self, privilege_name: str) -> None:
         """
@@ -0,0 +1,248 @@
+"""Sharded, concurrent enumeration of search results."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from .pagination import iter_pages
+
+
+# Default first characters used by prefix_shards(): digits and lowercase letters
+DEFAULT_SHARD_ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+# Sentinel put on the result queue when a shard has been fully walked
+_SHARD_DONE = object()
+
+
+class _ShardPage:
+    """Items of one page fetched by a shard (or by the remainder walk)."""
+
+    def __init__(self, items: List[Dict[str, Any]], remainder: bool):
+        self.items = items
+        self.remainder = remainder
+
+
+class _ShardError:
+    """Wraps an exception raised while walking a shard."""
+
+    def __init__(self, shard: Dict[str, str], error: BaseException):
+        self.shard = shard
+        self.error = error
+
+
+def prefix_shards(
+    field: str = 'name',
+    alphabet: str = DEFAULT_SHARD_ALPHABET
+) -> List[Dict[str, str]]:
+    """
+    Build one wildcard query partition per leading character.
+
+    Items whose ``field`` starts with a character outside ``alphabet``
+    are not covered by any shard; ShardedWalker picks them up in its
+    remainder walk. Pass an alphabet matching the repository's naming
+    (e.g. add '@' for scoped npm packages) to keep that walk short of
+    items.
+
+    Args:
+        field: Search field to partition on ('name', 'group', ...)
+        alphabet: Leading characters, one shard each
+
+    Returns:
+        List of shard filter dicts, e.g. [{'name': 'a*'}, {'name': 'b*'}, ...]
+    """
+    return [{field: f'{char}*'} for char in alphabet]
+
+
+def value_shards(field: str, values: Iterable[str]) -> List[Dict[str, str]]:
+    """
+    Build one query partition per exact value of a field.
+
+    Useful for format attributes with a small known domain, such as
+    ``value_shards('maven.extension', ['jar', 'pom', 'war'])``.
+
+    Args:
+        field: Search field to partition on
+        values: Values of the field, one shard each
+
+    Returns:
+        List of shard filter dicts
+    """
+    return [{field: value} for value in values]
+
+
+class ShardedWalker:
+    """
+    Walk independent search partitions concurrently and merge the results.
+
+    Continuation tokens force a single query to be read sequentially. The
+    walker splits one logical query into several shards (see
+    prefix_shards() and value_shards()), pages through each shard on its
+    own worker, and yields the merged stream de-duplicated by item id.
+
+    Shards built with prefix_shards() may not cover every item, so by
+    default the unsharded query is also walked, on one more worker, and
+    the items no shard returned are yielded once all shards are done.
+    That walk is as long as an unsharded one; pass ``remainder=False``
+    when the shards are known to cover the query.
+
+    De-duplication keeps the id of every yielded item in memory (on the
+    order of 100 bytes each). Shards that cannot overlap, such as those
+    of prefix_shards() or value_shards() on a single-valued field, can
+    be walked with ``dedup=False`` and ``remainder=False`` to keep no
+    per-item state.
+
+    Example:
+        >>> walker = ShardedWalker(client.search, workers=16)
+        >>> for asset in walker.iter_assets(prefix_shards('group'), repository="maven-central"):
+        ...     print(asset['path'])
+    """
+
+    def __init__(
+        self,
+        search_api,
+        workers: int = 8,
+        buffer_pages: int = 32,
+        remainder: bool = True,
+        dedup: bool = True
+    ):
+        """
+        Initialize the walker.
+
+        Args:
+            search_api: SearchAPI instance used to run shard queries
+            workers: Number of shards walked concurrently
+            buffer_pages: Maximum number of fetched pages waiting to be consumed
+            remainder: Also walk the unsharded query and yield the items
+                that no shard returned
+            dedup: Yield each item id at most once
+
+        Raises:
+            ValueError: If workers is below 1, or remainder is set without dedup
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if remainder and not dedup:
+            raise ValueError("remainder requires dedup")
+
+        self.search_api = search_api
+        self.workers = workers
+        self.buffer_pages = buffer_pages
+        self.remainder = remainder
+        self.dedup = dedup
+
+    def iter_assets(
+        self,
+        shards: List[Dict[str, str]],
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over assets matching ``filters`` across all shards.
+
+        Args:
+            shards: Query partitions; each is merged into ``filters``
+            **filters: Filters shared by every shard (repository, format, ...)
+
+        Yields:
+            Asset dicts, each id at most once (with dedup)
+        """
+        return self._walk(self.search_api.search_assets, shards, filters)
+
+    def iter_components(
+        self,
+        shards: List[Dict[str, str]],
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over components matching ``filters`` across all shards.
+
+        Args:
+            shards: Query partitions; each is merged into ``filters``
+            **filters: Filters shared by every shard (repository, format, ...)
+
+        Yields:
+            Component dicts, each id at most once (with dedup)
+        """
+        return self._walk(self.search_api.search, shards, filters)
+
+    def _walk(
+        self,
+        search: Callable[..., Dict[str, Any]],
+        shards: List[Dict[str, str]],
+        filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Run shard queries on a worker pool and yield de-duplicated items."""
+        for shard in shards:
+            overlap = set(shard) & set(filters)
+            if overlap:
+                raise ValueError(f"Shard fields {sorted(overlap)} are also given as filters")
+
+        results = queue.Queue(maxsize=self.buffer_pages)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Poll so an abandoned consumer never leaves workers blocked
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def walk_shard(shard: Dict[str, str], remainder: bool = False):
+            params = dict(filters, **shard)
+            try:
+                pages = iter_pages(
+                    lambda token: search(continuation_token=token, **params)
+                )
+                for page in pages:
+                    if stop.is_set() or not put(_ShardPage(page.get('items', []), remainder)):
+                        return
+            except BaseException as e:
+                put(_ShardError(shard, e))
+                return
+            put(_SHARD_DONE)
+
+        seen = set()
+        # Items of the remainder walk that no shard has returned (yet)
+        missed = {}
+        remaining = len(shards)
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers + (1 if self.remainder else 0),
+            thread_name_prefix='nexus-shard'
+        )
+        try:
+            if self.remainder:
+                remaining += 1
+                executor.submit(walk_shard, {}, True)
+            for shard in shards:
+                executor.submit(walk_shard, shard)
+
+            while remaining:
+                item = results.get()
+                if item is _SHARD_DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(item, _ShardError):
+                    raise item.error
+
+                for entry in item.items:
+                    entry_id = entry.get('id')
+                    if entry_id is None or not self.dedup:
+                        yield entry
+                    elif entry_id in seen:
+                        continue
+                    elif item.remainder:
+                        missed[entry_id] = entry
+                    else:
+                        seen.add(entry_id)
+                        missed.pop(entry_id, None)
+                        yield entry
+
+            for entry_id, entry in missed.items():
+                if entry_id not in seen:
+                    yield entry
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
@@ -0,0 +1,100 @@
+"""Coalescing of identical concurrent calls (singleflight)."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """A call in flight and the callers waiting for it."""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe deduplication of concurrent calls sharing a key.
+
+    While a call for a key is running, other threads calling do() with the
+    same key wait for it and receive its result (or its exception) instead
+    of running their own. Nothing is remembered once the call completes, so
+    this is not a cache: a later call runs again.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> data, shared = flight.do(('GET', url), fetch)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Hashable identity of the call
+            fn: Callable without arguments
+
+        Returns:
+            (result, shared) tuple; shared is True if the result came from
+            another thread's call, or if other threads received it too
+
+        Raises:
+            Whatever ``fn`` raised, in every waiting thread
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, call.waiters > 0
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dict with executed calls, coalesced callers and calls in flight
+        """
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+            }
@@ -2,6 +2,8 @@
 
 from typing import List, Dict, Any
 
+from .conditional import PollResult
+
 
 class TaskAPI:
     """API for managing scheduled tasks."""
@@ -16,8 +18,20 @@ class TaskAPI:
         Returns:
             List of tasks
         """
-        response = self.client.get('/v1/tasks')
-        return response.json()
+        return self.client.get_json('/v1/tasks')
+
+    def poll(self) -> PollResult:
+        """
+        List all tasks with a conditional request.
+
+        Cheap to call every few seconds: when nothing changed Nexus answers
+        304 and the previous list is returned without being re-downloaded.
+
+        Returns:
+            PollResult whose ``data`` is the list of tasks and
+            ``changed`` tells whether it differs from the previous poll
+        """
+        return self.client.poll('/v1/tasks')
 
     def get(self, task_id: str) -> Dict[str, Any]:
         """
@@ -29,8 +43,7 @@ class TaskAPI:
         Returns:
             Task details
         """
-        response = self.client.get(f'/v1/tasks/{task_id}')
-        return response.json()
+        return self.client.get_json(f'/v1/tasks/{task_id}')
 
     def run(self, task_id: str) -> None:
         """
@@ -0,0 +1,201 @@
+"""Request tracing hooks, connection timing and slow-request logging."""
+
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, IO, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+logger = logging.getLogger(__name__)
+
+# Connection setup timings of the request running on the current thread
+_timings = threading.local()
+
+
+def reset_connection_timings() -> None:
+    """Clear the connection timings recorded for the current thread."""
+    _timings.connect = 0.0
+    _timings.handshake = 0.0
+
+
+def connection_timings() -> Dict[str, float]:
+    """
+    Get connection setup timings recorded on the current thread.
+
+    Both are 0 when the request reused a pooled connection.
+
+    Returns:
+        Dict with 'connect' (TCP) and 'tls' (handshake) durations in seconds
+    """
+    connect = getattr(_timings, 'connect', 0.0)
+    handshake = getattr(_timings, 'handshake', 0.0)
+    tls = max(handshake - connect, 0.0) if handshake else 0.0
+    return {'connect': connect, 'tls': tls}
+
+
+class _TimedConnectionMixin:
+    """Records the TCP connect time of new connections."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _timings.connect = getattr(_timings, 'connect', 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection recording its connect time."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection recording its TCP connect and TLS handshake time."""
+
+    def connect(self):
+        # Covers _new_conn() plus the TLS handshake
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            _timings.handshake = getattr(_timings, 'handshake', 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool creating TimedHTTPConnection instances."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Connection pool creating TimedHTTPSConnection instances."""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record connect and TLS handshake time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+class RequestTrace:
+    """
+    Description and timing breakdown of one request attempt.
+
+    Passed to pre-request hooks before the attempt is sent (timings unset)
+    and to post-request hooks once it completed or failed.
+
+    Timings are in seconds: ``connect`` and ``tls`` are 0 for a reused
+    connection, ``first_byte`` runs from the connection being ready to the
+    response headers, and ``body`` is the time spent reading the body
+    (None for streamed responses, whose body is read by the caller).
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        attempt: int = 0
+    ):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.params = params
+        self.attempt = attempt
+        self.started = time.time()
+        self.status_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.connect: Optional[float] = None
+        self.tls: Optional[float] = None
+        self.first_byte: Optional[float] = None
+        self.body: Optional[float] = None
+        self.total: Optional[float] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable view of the trace."""
+        return {
+            'method': self.method,
+            'url': self.url,
+            'endpoint': self.endpoint,
+            'params': self.params,
+            'attempt': self.attempt,
+            'started': self.started,
+            'status_code': self.status_code,
+            'error': self.error,
+            'connect': self.connect,
+            'tls': self.tls,
+            'first_byte': self.first_byte,
+            'body': self.body,
+            'total': self.total,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+        }
+
+
+RequestHook = Callable[[RequestTrace], None]
+
+
+def run_hooks(hooks, trace: RequestTrace) -> None:
+    """Call each hook with the trace; a failing hook is logged, not raised."""
+    for hook in hooks:
+        try:
+            hook(trace)
+        except Exception:
+            logger.exception("Request hook %r failed", hook)
+
+
+class SlowRequestLogger:
+    """
+    Post-request hook writing a JSON line for every slow request attempt.
+
+    Example:
+        >>> client.add_post_request_hook(SlowRequestLogger(2.0, path='slow-requests.jsonl'))
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        path: Optional[str] = None,
+        stream: Optional[IO[str]] = None
+    ):
+        """
+        Initialize the logger.
+
+        Args:
+            threshold: Minimum total duration in seconds for an attempt to be logged
+            path: File to append JSON lines to
+            stream: Text stream to write to instead of a file (defaults to stderr)
+        """
+        self.threshold = threshold
+        self.path = path
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, trace: RequestTrace) -> None:
+        if trace.total is None or trace.total < self.threshold:
+            return
+
+        line = json.dumps(trace.to_dict(), default=str) + '\n'
+        with self._lock:
+            if self.path:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            else:
+                stream = self.stream or sys.stderr
+                stream.write(line)
+                stream.flush()
@@ -0,0 +1,332 @@
+"""Concurrent bulk uploads."""
+
+import fnmatch
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .checksums import sha256_file
+
+
+# Files sent per raw upload request
+DEFAULT_BATCH_SIZE = 20
+
+# Upper bound of the file bytes sent in one request; a larger file goes alone
+DEFAULT_MAX_BATCH_BYTES = 256 * 1024 * 1024
+
+
+class UploadResult:
+    """
+    Outcome of one file of a bulk upload.
+
+    Attributes:
+        local_path: Path of the local file
+        remote_path: Path of the asset in the repository
+        size: File size in bytes
+        error: Error message, or None if the upload succeeded
+        skipped: True if the file was not sent because Nexus already had it
+        sha256: Hex digest of the file, if it was hashed
+    """
+
+    def __init__(
+        self,
+        local_path: str,
+        remote_path: str,
+        size: int,
+        error: Optional[str] = None,
+        skipped: bool = False,
+        sha256: Optional[str] = None
+    ):
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self.size = size
+        self.error = error
+        self.skipped = skipped
+        self.sha256 = sha256
+
+    @property
+    def ok(self) -> bool:
+        """True if the file is in the repository."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = 'skipped' if self.skipped else ('ok' if self.ok else f'failed: {self.error}')
+        return f"UploadResult({self.remote_path!r}, {status})"
+
+
+class UploadReport:
+    """Per-file results and totals of a bulk upload."""
+
+    def __init__(self, results: List[UploadResult], elapsed: float, requests: int):
+        self.results = results
+        self.elapsed = elapsed
+        self.requests = requests
+
+    @property
+    def succeeded(self) -> List[UploadResult]:
+        """Files sent successfully."""
+        return [r for r in self.results if r.ok and not r.skipped]
+
+    @property
+    def skipped(self) -> List[UploadResult]:
+        """Files that did not need to be sent."""
+        return [r for r in self.results if r.skipped]
+
+    @property
+    def failed(self) -> List[UploadResult]:
+        """Files that could not be uploaded."""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def bytes_uploaded(self) -> int:
+        """Size of the files sent successfully."""
+        return sum(r.size for r in self.succeeded)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second sent successfully."""
+        return self.bytes_uploaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"UploadReport(succeeded={len(self.succeeded)}, skipped={len(self.skipped)}, "
+            f"failed={len(self.failed)}, requests={self.requests}, elapsed={self.elapsed:.1f}s)"
+        )
+
+
+def collect_files(
+    local_dir: str,
+    include: Optional[Union[str, Sequence[str]]] = None
+) -> List[Tuple[str, str]]:
+    """
+    List the files of a directory tree.
+
+    Args:
+        local_dir: Root directory
+        include: Glob pattern(s) matched against the relative path
+            (e.g. '*.tar.gz'); all files if None
+
+    Returns:
+        Sorted (local path, relative path with '/' separators) pairs
+    """
+    if isinstance(include, str):
+        include = [include]
+
+    files = []
+    for root, _dirs, names in os.walk(local_dir):
+        for name in names:
+            local_path = os.path.join(root, name)
+            relative = os.path.relpath(local_path, local_dir).replace(os.sep, '/')
+            if include and not any(fnmatch.fnmatch(relative, pattern) for pattern in include):
+                continue
+            files.append((local_path, relative))
+    files.sort(key=lambda item: item[1])
+    return files
+
+
+def _join(*parts: str) -> str:
+    """Join repository path parts, ignoring empty ones."""
+    return '/'.join(part.strip('/') for part in parts if part and part.strip('/'))
+
+
+class RawDirectoryUploader:
+    """
+    Mirror a local directory tree into a raw repository.
+
+    Files are grouped by target directory and packed into requests of up
+    to ``batch_size`` files (raw.asset1..raw.assetN), which are sent by a
+    pool of worker threads. A failed request marks all of its files as
+    failed; the other requests are unaffected.
+
+    With ``skip_existing``, files are hashed on the worker pool and their
+    SHA-256 looked up in the repository first (see ChecksumIndex); files
+    whose content is already stored at their target path are reported as
+    skipped instead of being sent.
+
+    Size the client's ``pool_maxsize`` to at least ``workers`` so every
+    worker keeps a connection open.
+
+    Example:
+        >>> uploader = RawDirectoryUploader(client.components, workers=16, batch_size=50)
+        >>> report = uploader.upload("raw-releases", "./dist", directory="app/1.2.0")
+        >>> for result in report.failed:
+        ...     print(result.local_path, result.error)
+    """
+
+    def __init__(
+        self,
+        component_api,
+        workers: int = 8,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        skip_existing: bool = False
+    ):
+        """
+        Initialize the uploader.
+
+        Args:
+            component_api: ComponentAPI used to send the requests
+            workers: Number of concurrent upload requests
+            batch_size: Maximum files per request
+            max_batch_bytes: Maximum file bytes per request
+            skip_existing: Skip files already stored with the same content
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.components = component_api
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.skip_existing = skip_existing
+
+    def upload(
+        self,
+        repository: str,
+        local_dir: str,
+        directory: str = '',
+        include: Optional[Union[str, Sequence[str]]] = None,
+        progress: Optional[Callable[[UploadResult], None]] = None
+    ) -> UploadReport:
+        """
+        Upload every file under ``local_dir``.
+
+        Args:
+            repository: Raw repository name
+            local_dir: Local directory to upload
+            directory: Repository directory the tree is placed under
+            include: Glob pattern(s) selecting files by relative path
+            progress: Callback receiving each UploadResult as it completes
+
+        Returns:
+            UploadReport with one result per file
+        """
+        files = [
+            (local_path, _join(directory, relative), os.path.getsize(local_path))
+            for local_path, relative in collect_files(local_dir, include)
+        ]
+        return self.upload_files(repository, files, progress)
+
+    def upload_files(
+        self,
+        repository: str,
+        files: Iterable[Tuple[str, str, int]],
+        progress: Optional[Callable[[UploadResult], None]] = None
+    ) -> UploadReport:
+        """
+        Upload files to explicit repository paths.
+
+        Args:
+            repository: Raw repository name
+            files: (local path, repository path, size) triples
+            progress: Callback receiving each UploadResult as it completes
+
+        Returns:
+            UploadReport with one result per file
+        """
+        started = time.monotonic()
+        files = list(files)
+        results: List[UploadResult] = []
+        lock = threading.Lock()
+
+        def report(batch_results: List[UploadResult]) -> None:
+            with lock:
+                results.extend(batch_results)
+            if progress is not None:
+                for result in batch_results:
+                    progress(result)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='nexus-upload') as pool:
+            digests: Dict[str, str] = {}
+            if self.skip_existing:
+                files, skipped, digests = self._skip_existing(pool, repository, files)
+                report(skipped)
+
+            batches = self._batches(files)
+
+            def send(batch: Tuple[str, List[Tuple[str, str, int]]]) -> None:
+                report(self._upload_batch(repository, *batch, digests=digests))
+
+            # Exceptions are caught per batch, so list() only drains the pool
+            list(pool.map(send, batches))
+
+        results.sort(key=lambda r: r.remote_path)
+        return UploadReport(results, time.monotonic() - started, len(batches))
+
+    def _skip_existing(
+        self,
+        pool: ThreadPoolExecutor,
+        repository: str,
+        files: List[Tuple[str, str, int]]
+    ) -> Tuple[List[Tuple[str, str, int]], List[UploadResult], Dict[str, str]]:
+        """
+        Hash files and split off those already stored at their target path.
+
+        Returns:
+            (files to send, skipped results, local path -> sha256)
+        """
+        index = self.components.checksum_index
+        digests = dict(zip(
+            (local_path for local_path, _, _ in files),
+            pool.map(lambda entry: sha256_file(entry[0]), files)
+        ))
+        index.prefetch(repository, digests.values())
+
+        to_send, skipped = [], []
+        for local_path, remote_path, size in files:
+            sha256 = digests[local_path]
+            if index.exists(repository, sha256, remote_path):
+                skipped.append(UploadResult(local_path, remote_path, size, skipped=True, sha256=sha256))
+            else:
+                to_send.append((local_path, remote_path, size))
+        return to_send, skipped, digests
+
+    def _batches(
+        self,
+        files: Iterable[Tuple[str, str, int]]
+    ) -> List[Tuple[str, List[Tuple[str, str, int]]]]:
+        """Group files by target directory into requests of bounded size."""
+        by_directory: Dict[str, List[Tuple[str, str, int]]] = {}
+        for local_path, remote_path, size in files:
+            remote_dir = remote_path.rsplit('/', 1)[0] if '/' in remote_path else ''
+            by_directory.setdefault(remote_dir, []).append((local_path, remote_path, size))
+
+        batches = []
+        for remote_dir, entries in by_directory.items():
+            batch: List[Tuple[str, str, int]] = []
+            batch_bytes = 0
+            for entry in entries:
+                full = len(batch) >= self.batch_size or batch_bytes + entry[2] > self.max_batch_bytes
+                if batch and full:
+                    batches.append((remote_dir, batch))
+                    batch, batch_bytes = [], 0
+                batch.append(entry)
+                batch_bytes += entry[2]
+            if batch:
+                batches.append((remote_dir, batch))
+        return batches
+
+    def _upload_batch(
+        self,
+        repository: str,
+        remote_dir: str,
+        batch: List[Tuple[str, str, int]],
+        digests: Dict[str, str]
+    ) -> List[UploadResult]:
+        """Send one request and turn its outcome into per-file results."""
+        assets = [(remote_path.rsplit('/', 1)[-1], local_path) for local_path, remote_path, _ in batch]
+        error = None
+        try:
+            self.components.upload_raw_batch(repository, remote_dir or '/', assets)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        results = []
+        for local_path, remote_path, size in batch:
+            sha256 = digests.get(local_path)
+            if error is None and sha256 is not None:
+                self.components.checksum_index.record(repository, sha256, remote_path)
+            results.append(UploadResult(local_path, remote_path, size, error=error, sha256=sha256))
+        return results
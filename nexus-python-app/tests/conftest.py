@@ -0,0 +1,175 @@
+"""Shared fixtures: a local HTTP server standing in for Nexus."""
+
+import http.server
+import threading
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from nexus_client import NexusClient
+from nexus_client.retry import RetryPolicy
+
+
+class Request:
+    """Request received by the test server."""
+
+    def __init__(self, method: str, path: str, query: Dict[str, str], headers, body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+
+class Reply:
+    """
+    Response sent by the test server.
+
+    With ``truncate``, only that many bytes of the body are sent after
+    headers announcing all of it, then the connection is closed.
+    """
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Union[bytes, str] = b'',
+        headers: Optional[Dict[str, str]] = None,
+        truncate: Optional[int] = None
+    ):
+        self.status = status
+        self.body = body.encode('utf-8') if isinstance(body, str) else body
+        self.headers = headers or {}
+        self.truncate = truncate
+
+
+# Answers a request with a Reply
+Handler = Callable[[Request], Reply]
+
+
+class NexusServer:
+    """
+    Threaded HTTP server with scripted routes.
+
+    A route is a list of Reply objects (or handlers) used in turn for the
+    requests to a method and path under /service/rest; the last one keeps
+    answering once the others are used up. Every request is recorded.
+    """
+
+    def __init__(self):
+        self.requests: List[Request] = []
+        self._routes: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self._httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._httpd.server_port}'
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            daemon=True
+        )
+        self._thread.start()
+
+    def route(self, method: str, path: str, *replies: Union[Reply, Handler]) -> None:
+        """Script the replies to a method and path (e.g. '/v1/assets' or '/repository/raw/f')."""
+        with self._lock:
+            self._routes[(method, path)] = list(replies)
+
+    def received(self, method: str, path: str) -> List[Request]:
+        """Requests received for a method and path."""
+        with self._lock:
+            return [r for r in self.requests if r.method == method and r.path == path]
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _reply(self, request: Request) -> Reply:
+        with self._lock:
+            self.requests.append(request)
+            replies = self._routes.get((request.method, request.path))
+            if not replies:
+                return Reply(404)
+            reply = replies.pop(0) if len(replies) > 1 else replies[0]
+        return reply if isinstance(reply, Reply) else reply(request)
+
+    def _handler_class(self):
+        server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                url = urlsplit(self.path)
+                path = url.path
+                if path.startswith('/service/rest/'):
+                    path = path[len('/service/rest'):]
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                request = Request(self.command, path, dict(parse_qsl(url.query)), self.headers, body)
+
+                reply = server._reply(request)
+                self.send_response(reply.status)
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(reply.body)))
+                if reply.truncate is not None:
+                    self.send_header('Connection', 'close')
+                    self.close_connection = True
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(reply.body[:reply.truncate])
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return RequestHandler
+
+
+def blob(data: bytes, etag: str = '"v1"', ranges: bool = True) -> Handler:
+    """
+    Handler serving a file like Nexus does, honoring Range and If-Range.
+
+    Args:
+        data: File content
+        etag: Strong ETag of the content
+        ranges: Answer range requests with 206 (otherwise always 200)
+    """
+    def handle(request: Request) -> Reply:
+        headers = {'ETag': etag, 'Accept-Ranges': 'bytes'}
+        byte_range = request.headers.get('Range')
+        if_range = request.headers.get('If-Range')
+        if not ranges or not byte_range or (if_range and if_range != etag):
+            return Reply(200, data, headers)
+
+        first, last = byte_range.split('=', 1)[1].split('-')
+        start = int(first)
+        end = min(int(last), len(data) - 1) if last else len(data) - 1
+        if start >= len(data):
+            return Reply(416, headers={'Content-Range': f'bytes */{len(data)}'})
+        headers['Content-Range'] = f'bytes {start}-{end}/{len(data)}'
+        return Reply(206, data[start:end + 1], headers)
+
+    return handle
+
+
+@pytest.fixture
+def server():
+    nexus = NexusServer()
+    yield nexus
+    nexus.close()
+
+
+@pytest.fixture
+def client(server):
+    # No backoff so retries do not slow the tests down
+    with NexusClient(
+        server.url,
+        username='admin',
+        password='admin123',
+        timeout=5,
+        retry=RetryPolicy(max_retries=3, backoff_factor=0.0, jitter=False)
+    ) as nexus_client:
+        yield nexus_client
@@ -0,0 +1,119 @@
+"""Retries, response cache and conditional polling of NexusClient."""
+
+import json
+
+import pytest
+
+from nexus_client import NexusClient
+from nexus_client.cache import ResponseCache
+from nexus_client.exceptions import NexusException
+from nexus_client.retry import RetryPolicy
+
+from .conftest import Reply
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Delays the client slept for before retrying, without sleeping."""
+    delays = []
+    monkeypatch.setattr('nexus_client.client.time.sleep', delays.append)
+    return delays
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_retries_overloaded_status_after_retry_after(server, client, sleeps, status):
+    server.route(
+        'GET', '/v1/status',
+        Reply(status, headers={'Retry-After': '7'}),
+        Reply(200, '{"ok": true}')
+    )
+
+    response = client.get('/v1/status')
+
+    assert response.json() == {'ok': True}
+    assert response.retries == 1
+    assert sleeps == [7.0]
+    assert len(server.received('GET', '/v1/status')) == 2
+
+
+def test_gives_up_after_max_retries(server, client, sleeps):
+    server.route('GET', '/v1/status', Reply(503))
+
+    with pytest.raises(NexusException) as info:
+        client.get('/v1/status')
+
+    assert info.value.retries == 3
+    assert len(server.received('GET', '/v1/status')) == 4
+
+
+def test_post_is_not_retried_by_default(server, client, sleeps):
+    server.route('POST', '/v1/components', Reply(503))
+
+    with pytest.raises(NexusException):
+        client.post('/v1/components', data=b'x')
+
+    assert len(server.received('POST', '/v1/components')) == 1
+
+
+def test_multipart_upload_is_rewound_before_retry(server, tmp_path, sleeps):
+    server.route('POST', '/v1/components', Reply(503), Reply(204))
+    source = tmp_path / 'app.bin'
+    source.write_bytes(b'payload' * 1000)
+
+    retry = RetryPolicy(max_retries=2, backoff_factor=0.0, retry_post=True)
+    with NexusClient(server.url, 'admin', 'admin123', retry=retry) as client:
+        client.components.upload_raw('raw', '/releases', 'app.bin', str(source))
+
+    first, second = server.received('POST', '/v1/components')
+    assert first.body == second.body
+    assert int(second.headers['Content-Length']) == len(second.body)
+    assert b'payload' * 1000 in second.body
+
+
+def test_cached_get_is_evicted_by_a_write(server):
+    server.route('GET', '/v1/repositories/maven', Reply(200, '{"name": "maven"}'))
+    server.route('DELETE', '/v1/repositories/maven', Reply(204))
+
+    with NexusClient(server.url, 'admin', 'admin123', cache=ResponseCache()) as client:
+        client.get('/v1/repositories/maven')
+        assert client.get('/v1/repositories/maven').from_cache
+
+        client.delete('/v1/repositories/maven')
+        client.get('/v1/repositories/maven')
+
+    assert len(server.received('GET', '/v1/repositories/maven')) == 2
+
+
+def test_write_evicts_listings_and_related_roots(server):
+    server.route('GET', '/v1/repositories', Reply(200, '[]'))
+    server.route('GET', '/v1/assets/abc', Reply(200, '{"id": "abc"}'))
+    server.route('POST', '/v1/repositories/raw/hosted', Reply(201))
+
+    with NexusClient(server.url, 'admin', 'admin123', cache=ResponseCache()) as client:
+        client.get('/v1/repositories')
+        client.get('/v1/assets/abc')
+        client.post('/v1/repositories/raw/hosted', json={'name': 'raw'})
+        client.get('/v1/repositories')
+        client.get('/v1/assets/abc')
+
+    assert len(server.received('GET', '/v1/repositories')) == 2
+    assert len(server.received('GET', '/v1/assets/abc')) == 2
+
+
+def test_poll_reuses_result_on_304(server, client):
+    tasks = [{'id': 'cleanup', 'currentState': 'WAITING'}]
+
+    def tasks_endpoint(request):
+        if request.headers.get('If-None-Match') == '"1"':
+            return Reply(304, headers={'ETag': '"1"'})
+        return Reply(200, json.dumps({'items': tasks}), {'ETag': '"1"'})
+
+    server.route('GET', '/v1/tasks', tasks_endpoint)
+
+    first = client.poll('/v1/tasks')
+    second = client.poll('/v1/tasks')
+
+    assert first.changed and not first.not_modified
+    assert second.not_modified and not second.changed
+    assert second.data == {'items': tasks}
+    assert server.received('GET', '/v1/tasks')[1].headers['If-None-Match'] == '"1"'
@@ -0,0 +1,97 @@
+"""Idempotent ingestion into the DataNexus SQLite store."""
+
+import pytest
+
+from data import DataNexus
+from main import DatabaseCheckpoint
+from nexus_client.pagination import iter_items
+
+
+@pytest.fixture
+def data(tmp_path):
+    store = DataNexus(db_path=str(tmp_path / 'nexus.db'), commit_interval=250)
+    store.connect()
+    yield store
+    store.close()
+
+
+def count(data, table):
+    return data.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+def component_rows(repository_id, first, last):
+    return [
+        (f'lib{i}', 'maven2', 'org.example', '1.0', repository_id, f'component-{i}')
+        for i in range(first, last)
+    ]
+
+
+def test_repository_is_saved_once(data):
+    first = data.save_repository('maven-releases', 'maven2')
+    again = data.save_repository('maven-releases', 'maven2')
+
+    assert first == again
+    assert count(data, 'repositories') == 1
+
+
+def test_reingested_components_are_skipped(data):
+    repository_id = data.save_repository('maven-releases', 'maven2')
+
+    assert data.save_components(component_rows(repository_id, 0, 600)) == 600
+    assert data.save_components(component_rows(repository_id, 300, 900)) == 300
+    assert count(data, 'components') == 900
+
+
+def test_reingested_assets_are_skipped(data):
+    repository_id = data.save_repository('raw', 'raw')
+    row = ('app.bin', 'asset-1', 10, None, None, 'admin', None, 'default', 'raw',
+           '/app.bin', 'http://nexus/repository/raw/app.bin', 'application/octet-stream', repository_id)
+
+    assert data.save_asset(*row) is not None
+    assert data.save_asset(*row) is None
+    assert count(data, 'assets') == 1
+
+
+def test_rows_are_committed_every_commit_interval(data, tmp_path):
+    repository_id = data.save_repository('maven-releases', 'maven2')
+    data.commit()
+    data.save_components(component_rows(repository_id, 0, 600))
+
+    other = DataNexus(db_path=str(tmp_path / 'nexus.db'))
+    other.connect()
+    try:
+        assert count(other, 'components') == 500
+    finally:
+        other.close()
+
+
+def test_crawl_resumed_after_crash_stores_each_component_once(data, tmp_path):
+    checkpoint_path = str(tmp_path / 'crawl.checkpoint.json')
+    repository_id = data.save_repository('maven-releases', 'maven2')
+    data.commit()
+
+    def pages(fail_at=None):
+        def fetch(token):
+            start = int(token or 0)
+            if start == fail_at:
+                raise ConnectionError('lost connection')
+            items = [{'id': f'component-{i}'} for i in range(start, min(start + 100, 1000))]
+            return {'items': items, 'continuationToken': str(start + 100) if start + 100 < 1000 else None}
+        return fetch
+
+    def crawl(fetch):
+        checkpoint = DatabaseCheckpoint(checkpoint_path, data)
+        for component in iter_items(fetch, checkpoint=checkpoint, checkpoint_key='components:maven'):
+            checkpoint.rows.append(('lib', 'maven2', None, '1.0', repository_id, component['id']))
+        checkpoint.flush()
+        return checkpoint
+
+    with pytest.raises(ConnectionError):
+        crawl(pages(fail_at=700))
+    # Pages after the last commit are crawled again on the next run
+    assert DatabaseCheckpoint(checkpoint_path, data).get('components:maven')['items'] == 600
+
+    checkpoint = crawl(pages())
+
+    assert checkpoint.is_complete('components:maven')
+    assert count(data, 'components') == 1000
@@ -0,0 +1,122 @@
+"""Resumable, segmented and verified downloads."""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from nexus_client import downloads
+from nexus_client.checksums import ChecksumVerifier
+from nexus_client.downloads import PART_SUFFIX, download_file, download_segmented
+from nexus_client.exceptions import NexusChecksumMismatchError
+
+from .conftest import Reply, blob
+
+
+DATA = os.urandom(256 * 1024 + 17)
+
+PATH = '/repository/raw/app.bin'
+
+
+@pytest.fixture
+def url(server):
+    return server.url + PATH
+
+
+def range_requests(server):
+    return [r for r in server.received('GET', PATH) if r.headers.get('Range')]
+
+
+def test_resumes_interrupted_body_with_range_and_if_range(server, client, url, tmp_path):
+    output = tmp_path / 'app.bin'
+    server.route(
+        'GET', PATH,
+        Reply(200, DATA, {'ETag': '"v1"'}, truncate=100 * 1024),
+        blob(DATA, etag='"v1"')
+    )
+
+    size = download_file(client, url, str(output), chunk_size=4096)
+
+    assert size == len(DATA)
+    assert output.read_bytes() == DATA
+    resumed, = range_requests(server)
+    assert resumed.headers['If-Range'] == '"v1"'
+    assert resumed.headers['Range'] != 'bytes=0-'
+    assert not os.path.exists(str(output) + PART_SUFFIX)
+
+
+def test_continues_part_file_left_by_earlier_call(server, client, url, tmp_path):
+    output = tmp_path / 'app.bin'
+    part = str(output) + PART_SUFFIX
+    with open(part, 'wb') as f:
+        f.write(DATA[:1000])
+    with open(part + '.json', 'w') as f:
+        json.dump({'url': url, 'validator': '"v1"', 'preallocated': False}, f)
+    server.route('GET', PATH, blob(DATA, etag='"v1"'))
+
+    verifier = ChecksumVerifier({'sha256': hashlib.sha256(DATA).hexdigest()})
+    download_file(client, url, str(output), verifier=verifier)
+
+    assert output.read_bytes() == DATA
+    request, = server.received('GET', PATH)
+    assert request.headers['Range'] == 'bytes=1000-'
+
+
+def test_changed_asset_is_downloaded_again_in_full(server, client, url, tmp_path):
+    output = tmp_path / 'app.bin'
+    part = str(output) + PART_SUFFIX
+    with open(part, 'wb') as f:
+        f.write(b'stale content')
+    with open(part + '.json', 'w') as f:
+        json.dump({'url': url, 'validator': '"v1"', 'preallocated': False}, f)
+    # If-Range no longer matches, so the server answers 200 with the new body
+    server.route('GET', PATH, blob(DATA, etag='"v2"'))
+
+    size = download_file(client, url, str(output))
+
+    assert size == len(DATA)
+    assert output.read_bytes() == DATA
+    request, = server.received('GET', PATH)
+    assert request.headers['If-Range'] == '"v1"'
+
+
+def test_segments_are_reassembled_in_order(server, client, url, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloads, 'MIN_SEGMENT_SIZE', 1024)
+    output = tmp_path / 'app.bin'
+    server.route('GET', PATH, blob(DATA))
+
+    verifier = ChecksumVerifier({'sha256': hashlib.sha256(DATA).hexdigest()})
+    size = download_segmented(client, url, str(output), segments=4, threshold=1, verifier=verifier)
+
+    assert size == len(DATA)
+    assert output.read_bytes() == DATA
+    ranges = sorted(r.headers['Range'] for r in range_requests(server))
+    assert 'bytes=0-0' in ranges
+    assert len(ranges) == 5
+
+
+def test_segmented_download_without_range_support_uses_one_stream(server, client, url, tmp_path):
+    output = tmp_path / 'app.bin'
+    server.route('GET', PATH, blob(DATA, ranges=False))
+
+    download_segmented(client, url, str(output), segments=4, threshold=1)
+
+    assert output.read_bytes() == DATA
+    assert len(server.received('GET', PATH)) == 2
+
+
+@pytest.mark.parametrize('segments', [1, 4])
+def test_checksum_mismatch_removes_the_download(server, client, url, tmp_path, monkeypatch, segments):
+    monkeypatch.setattr(downloads, 'MIN_SEGMENT_SIZE', 1024)
+    output = tmp_path / 'app.bin'
+    server.route('GET', PATH, blob(DATA))
+
+    verifier = ChecksumVerifier({'sha256': hashlib.sha256(b'other').hexdigest()})
+    with pytest.raises(NexusChecksumMismatchError):
+        if segments > 1:
+            download_segmented(client, url, str(output), segments=segments, threshold=1, verifier=verifier)
+        else:
+            download_file(client, url, str(output), verifier=verifier)
+
+    assert os.listdir(tmp_path) == []
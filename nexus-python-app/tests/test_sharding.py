@@ -0,0 +1,78 @@
+"""Coverage and de-duplication of sharded search walks."""
+
+import fnmatch
+
+import pytest
+
+from nexus_client.sharding import ShardedWalker, prefix_shards, value_shards
+
+
+NAMES = ['alpha', 'beta', 'core', 'zeta', 'Upper', '@scope/pkg', '_private', '9lives']
+
+
+class FakeSearch:
+    """SearchAPI answering wildcard queries from a list, three items a page."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def search_assets(self, continuation_token=None, **filters):
+        matches = [
+            item for item in self.items
+            if all(fnmatch.fnmatchcase(item[field], value) for field, value in filters.items())
+        ]
+        start = int(continuation_token or 0)
+        token = str(start + 3) if start + 3 < len(matches) else None
+        return {'items': matches[start:start + 3], 'continuationToken': token}
+
+
+@pytest.fixture
+def search():
+    items = [
+        {'id': f'{name}-{copy}', 'name': name, 'repository': 'npm'}
+        for name in NAMES
+        for copy in range(4)
+    ]
+    return FakeSearch(items)
+
+
+def ids(assets):
+    return [asset['id'] for asset in assets]
+
+
+def test_remainder_walk_finds_items_outside_the_alphabet(search):
+    walked = ids(ShardedWalker(search, workers=4).iter_assets(prefix_shards(), repository='npm'))
+
+    assert sorted(walked) == sorted(ids(search.items))
+
+
+def test_shards_alone_miss_items_outside_the_alphabet(search):
+    walker = ShardedWalker(search, workers=4, remainder=False)
+    walked = ids(walker.iter_assets(prefix_shards(), repository='npm'))
+
+    assert len(walked) == len(set(walked))
+    assert {asset_id.rsplit('-', 1)[0] for asset_id in walked} == {'alpha', 'beta', 'core', 'zeta', '9lives'}
+
+
+def test_overlapping_shards_are_deduplicated(search):
+    shards = value_shards('name', NAMES) + prefix_shards(alphabet='abcz')
+    walked = ids(ShardedWalker(search, workers=4).iter_assets(shards, repository='npm'))
+
+    assert sorted(walked) == sorted(ids(search.items))
+
+
+def test_dedup_can_be_turned_off(search):
+    shards = prefix_shards(alphabet='ab') * 2
+    walker = ShardedWalker(search, workers=2, remainder=False, dedup=False)
+
+    assert len(list(walker.iter_assets(shards, repository='npm'))) == 16
+
+
+def test_remainder_requires_dedup(search):
+    with pytest.raises(ValueError):
+        ShardedWalker(search, dedup=False)
+
+
+def test_shard_field_cannot_also_be_a_filter(search):
+    with pytest.raises(ValueError):
+        list(ShardedWalker(search).iter_assets(prefix_shards(), name='a*'))